@@ -0,0 +1,54 @@
+"""Benchmarks for `tools37.algebra`."""
+import random
+from functools import reduce
+from itertools import repeat
+from operator import mul
+
+from tools37.algebra import Polynom
+from tools37.algebra.Polynom import _karatsuba, _schoolbook, solve_many
+from .utils import report
+
+
+def bench_evaluate(degree: int = 8, count: int = 100_000) -> None:
+    polynom = Polynom(*(random.uniform(-1, 1) for _ in range(degree + 1)))
+    xs = [random.uniform(-2, 2) for _ in range(count)]
+
+    report(f"{count} evaluations of a polynom of degree {degree}", {
+        "sum of powers": lambda: [sum(c * x ** p for p, c in enumerate(polynom)) for x in xs],
+        "Horner": lambda: [polynom(x) for x in xs],
+        "evaluate_many": lambda: polynom.evaluate_many(xs),
+    })
+
+
+def bench_mul(sizes=(64, 256, 1024)) -> None:
+    for size in sizes:
+        a = [random.uniform(-1, 1) for _ in range(size)]
+        b = [random.uniform(-1, 1) for _ in range(size)]
+        report(f"product of two polynoms of {size} factors", {
+            "schoolbook": lambda: _schoolbook(a, b),
+            "Karatsuba": lambda: _karatsuba(a, b),
+        })
+
+
+def bench_pow(exponent: int = 16) -> None:
+    polynom = Polynom(*(random.uniform(-1, 1) for _ in range(4)))
+    report(f"polynom of degree 3 ** {exponent}", {
+        "reduce(mul, ...)": lambda: reduce(mul, repeat(polynom, exponent)),
+        "squaring": lambda: polynom ** exponent,
+    })
+
+
+def bench_solve(count: int = 10_000) -> None:
+    for degree in (2, 3, 4):
+        columns = [[random.uniform(-1, 1) for _ in range(count)] for _ in range(degree + 1)]
+        report(f"{count} polynoms of degree {degree} solved", {
+            "Polynom.solve": lambda: [Polynom(*factors).solve() for factors in zip(*columns)],
+            "solve_many": lambda: solve_many(*columns),
+        })
+
+
+if __name__ == '__main__':
+    bench_evaluate()
+    bench_mul()
+    bench_pow()
+    bench_solve()
@@ -0,0 +1,248 @@
+"""Benchmarks for `tools37.events`."""
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass, field, replace
+from functools import partial
+
+from tools37.events import abc, base, factory
+from tools37.events.patterns import Glob
+from tools37.ReprTable import ReprTable
+from .utils import report
+
+
+@dataclass
+class LinearEventManager(base.DirectEventManager):
+    """Dispatch by checking every registered model, as the managers did before the index."""
+
+    def register_event(self, event):
+        for model in self.models.copy():
+            if model.match(event):
+                for callback in model.functions() or ():
+                    callback(event)
+
+
+@dataclass
+class HopByHopEventManager(base.DirectEventManager):
+    """Re-emit the events at each transmitter, as the managers did before the routes."""
+
+    def register_event(self, event):
+        self._dispatch(event)
+
+
+@dataclass
+class LegacyEvent(abc.Event):
+    """Event as a dataclass, copied with `dataclasses.replace`, as before the slotted events."""
+    _manager = None
+    _pool = None
+
+    emitter: object = None
+    name: str = ''
+    args: tuple = field(default_factory=tuple)
+    kwargs: dict = field(default_factory=dict)
+
+    def emit(self):
+        self._manager.register_event(self)
+
+    def append_prefix(self, prefix: str) -> abc.Event:
+        return replace(self, name=prefix + self.name)
+
+    def with_emitter(self, emitter):
+        return replace(self, emitter=emitter)
+
+    def retarget(self, prefix, emitter, remove=False):
+        return self.append_prefix(prefix).with_emitter(emitter)
+
+
+def legacy_event_system(event_manager_factory):
+    _, EventModel, Emitter, Observer, Transmitter = factory.new_event_system(event_manager_factory)
+
+    class Event(LegacyEvent):
+        _manager = EventModel._manager
+
+    class LegacyEmitter(Emitter):
+        _event_factory = Event
+
+    class LegacyTransmitter(Transmitter):
+        _event_factory = Event
+
+        def transmit(self, name, emitter, prefix=''):
+            def function(event) -> None:
+                event.append_prefix(prefix).with_emitter(self).emit()
+
+            self._create_event_model(name, emitter).triggers(function)
+
+    return Event, EventModel, LegacyEmitter, Observer, LegacyTransmitter
+
+
+def bench_dispatch(sizes=(1_000, 10_000, 100_000), events: int = 100) -> None:
+    for size in sizes:
+        cases = {}
+        for name, manager_factory in [("linear scan", LinearEventManager), ("index", base.DirectEventManager)]:
+            _, _, Emitter, Observer, _ = factory.new_event_system(event_manager_factory=manager_factory)
+            emitters = [Emitter() for _ in range(size)]
+            observers = [Observer() for _ in range(size)]
+            for emitter, observer in zip(emitters, observers):
+                observer.on(name='changed', emitter=emitter, function=lambda event: None)
+
+            def emit(emitters=emitters, observers=observers) -> None:
+                for index in range(events):
+                    emitters[index].emit('changed')
+
+            cases[name] = emit
+
+        report(f"dispatch of {events} events ({size} models)", cases, repeat=3)
+
+
+def bench_patterns(sizes=(100, 1_000, 10_000), events: int = 100) -> None:
+    """Many prefix subscriptions on a single emitter, as made by `Transmitter.transmit_without_prefix`."""
+    for size in sizes:
+        _, _, Emitter, Observer, _ = factory.new_event_system(event_manager_factory=base.DirectEventManager)
+        cases = {}
+        for name in ["'*' and startswith", "prefix pattern"]:
+            emitter = Emitter()
+            observers = [Observer() for _ in range(size)]
+            for index, observer in enumerate(observers):
+                prefix = f".{index}"
+                if name == "prefix pattern":
+                    observer.on(name=Glob(prefix + '*'), emitter=emitter, function=lambda event: None)
+
+                else:
+                    def function(event, prefix=prefix) -> None:
+                        if event.name.startswith(prefix):
+                            pass
+
+                    observer.on(name='*', emitter=emitter, function=function)
+
+            def emit(emitter=emitter, observers=observers) -> None:
+                for index in range(events):
+                    emitter.emit(f".{index}:set")
+
+            cases[name] = emit
+
+        report(f"dispatch of {events} events ({size} prefix subscriptions)", cases, repeat=3)
+
+
+def bench_executor(emitters: int = 8, events: int = 50, delay: float = 0.001) -> None:
+    """Callbacks releasing the GIL for `delay` seconds (like I/O), until all the events are applied."""
+    cases = {}
+    for name, manager_factory in [("direct", base.DirectEventManager),
+                                  ("executor", base.ExecutorEventManager),
+                                  (f"executor ({emitters} shards)", partial(base.ExecutorEventManager,
+                                                                            shards=emitters))]:
+        Event, _, Emitter, Observer, _ = factory.new_event_system(event_manager_factory=manager_factory)
+        instances = [Emitter() for _ in range(emitters)]
+        observer = Observer()
+        for emitter in instances:
+            observer.on(name='*', emitter=emitter, function=lambda event: time.sleep(delay))
+
+        def emit(instances=instances, observer=observer, manager=Event._manager) -> None:
+            for _ in range(events):
+                for emitter in instances:
+                    emitter.emit('changed')
+
+            if isinstance(manager, base.ExecutorEventManager):
+                manager.wait()
+
+        cases[name] = emit
+
+    report(f"{emitters * events} events with {delay}s callbacks", cases, repeat=3)
+
+
+def bench_coalesce(changes: int = 1_000, frames: int = 10) -> None:
+    """An emitter changed many times per frame, each applied event triggering a redraw."""
+    def redraw(event) -> None:
+        sum(range(1_000))
+
+    cases = {}
+    for name, manager_factory in [("queue", base.QueueEventManager),
+                                  ("coalesce", partial(base.QueueEventManager, coalesce=True)),
+                                  ("batch", base.QueueEventManager)]:
+        Event, _, Emitter, Observer, _ = factory.new_event_system(event_manager_factory=manager_factory)
+        emitter = Emitter()
+        observer = Observer()
+        observer.on(name='*', emitter=emitter, function=redraw)
+
+        def frame(emitter=emitter, observer=observer, manager=Event._manager, batch=name == "batch") -> None:
+            for _ in range(frames):
+                if batch:
+                    with manager.batch():
+                        for index in range(changes):
+                            emitter.emit(':append', index=index)
+
+                else:
+                    for index in range(changes):
+                        emitter.emit(':append', index=index)
+
+                manager.update()
+
+        cases[name] = frame
+
+    report(f"{frames} frames of {changes} changes", cases, repeat=3)
+
+
+def bench_memory(count: int = 1_000_000, alive: int = 1_000) -> None:
+    """Observers subscribing to an emitter then dropped, at most `alive` of them exist at the same time."""
+    Event, _, Emitter, Observer, _ = factory.new_event_system(event_manager_factory=base.DirectEventManager)
+    emitter = Emitter()
+    rows = [["observers", "models", "traced memory (MiB)", "peak (MiB)"]]
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for created in range(0, count, alive):
+        observers = [Observer() for _ in range(alive)]
+        for observer in observers:
+            observer.on(name='changed', emitter=emitter, function=lambda event: None)
+
+        del observers, observer
+        emitter.emit('changed')  # the managers unregister the released models before dispatching
+
+        if (created + alive) % (count // 4) == 0:
+            current, peak = tracemalloc.get_traced_memory()
+            rows.append([f"{created + alive}", f"{len(Event._manager.models)}",
+                         f"{current / 2 ** 20:.2f}", f"{peak / 2 ** 20:.2f}"])
+
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+
+    print(f"{count} observers created and dropped in {elapsed:.2f}s")
+    print(ReprTable(rows))
+
+
+def bench_transmit_chain(depth: int = 10, events: int = 10_000) -> None:
+    """Events re-emitted through a chain of `depth` transmitters, as in nested dynamic containers."""
+    cases = {}
+    for name, event_system in [("dataclass events", legacy_event_system(HopByHopEventManager)),
+                               ("slotted events", factory.new_event_system(HopByHopEventManager)),
+                               ("slotted events + pool", factory.new_event_system(HopByHopEventManager,
+                                                                                  event_pool_size=64)),
+                               ("routes", factory.new_event_system(base.DirectEventManager)),
+                               ("routes + pool", factory.new_event_system(base.DirectEventManager,
+                                                                          event_pool_size=64))]:
+        _, _, Emitter, Observer, Transmitter = event_system
+        chain = [Emitter()]
+        for index in range(depth):
+            transmitter = Transmitter()
+            transmitter.transmit(name='*', emitter=chain[-1], prefix=f".{index}")
+            chain.append(transmitter)
+
+        observer = Observer()
+        observer.on(name='*', emitter=chain[-1], function=lambda event: None)
+
+        def emit(emitter=chain[0], chain=chain, observer=observer) -> None:
+            for _ in range(events):
+                emitter.emit('changed', value=0)
+
+        cases[name] = emit
+
+    report(f"{events} events through {depth} transmitters", cases, repeat=3)
+
+
+if __name__ == '__main__':
+    bench_dispatch()
+    bench_patterns()
+    bench_executor()
+    bench_coalesce()
+    bench_transmit_chain()
+    bench_memory()
@@ -0,0 +1,42 @@
+"""Benchmarks for `tools37.files`."""
+import os
+import tempfile
+import tracemalloc
+
+from tools37 import formats as f
+from tools37.files import JsonFile
+from .formats import RECORD_FORMAT, make_records
+from .utils import report
+
+
+def peak_memory(function) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+
+    finally:
+        tracemalloc.stop()
+
+
+def bench_load_parsed(size: int = 50_000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        fp = os.path.join(directory, 'records.json')
+        JsonFile.save(fp, make_records(size))
+        records_format = f.List(RECORD_FORMAT)
+
+        def count_streamed() -> int:
+            return sum(1 for _ in JsonFile.iter_parsed(fp, RECORD_FORMAT))
+
+        report(f"json records ({size} records)", {
+            "load + parse": lambda: records_format.parse(JsonFile.load(fp)),
+            "load_parsed": lambda: JsonFile.load_parsed(fp, records_format),
+            "iter_parsed": count_streamed,
+        }, repeat=3)
+
+        print(f"peak memory load + parse : {peak_memory(lambda: records_format.parse(JsonFile.load(fp))):,} B")
+        print(f"peak memory iter_parsed  : {peak_memory(count_streamed):,} B")
+
+
+if __name__ == '__main__':
+    bench_load_parsed()
@@ -0,0 +1,151 @@
+"""Benchmarks for `tools37.formats`."""
+import random
+import re
+from datetime import date, datetime
+
+from tools37 import formats as f
+from .utils import report
+
+RECORD_FORMAT = f.Dict(
+    id=f.Integer(),
+    name=f.String(),
+    score=f.Decimal(),
+    active=f.Boolean(),
+    tags=f.List(f.String()),
+    parent=f.Union(f.Integer(), f.String(optional=True)),
+)
+
+
+def make_records(size: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [
+        {
+            'id': index,
+            'name': f"record-{index}",
+            'score': f"{rng.random():.6f}" if index % 2 else rng.random(),
+            'active': rng.choice([True, False, 0, 1, "True"]),
+            'tags': [f"tag-{rng.randint(0, 9)}" for _ in range(rng.randint(0, 4))],
+            'parent': rng.choice([None, index - 1, f"{index - 1}"]),
+        }
+        for index in range(size)
+    ]
+
+
+def bench_compile(size: int = 10_000) -> None:
+    records = make_records(size)
+    parse = RECORD_FORMAT.parse
+    compiled = RECORD_FORMAT.compile()
+
+    report(f"Dict records ({size} records)", {
+        "parse": lambda: [parse(record) for record in records],
+        "compile": lambda: [compiled(record) for record in records],
+    })
+
+
+def bench_parse_many(size: int = 10_000) -> None:
+    records = make_records(size)
+    parse = RECORD_FORMAT.parse
+
+    def transpose() -> dict:
+        rows = [parse(record) for record in records]
+        return {key: [row[key] for row in rows] for key in RECORD_FORMAT.fields}
+
+    report(f"Dict columns ({size} records)", {
+        "parse + transpose": transpose,
+        "parse_many(columns=True)": lambda: RECORD_FORMAT.parse_many(records, columns=True),
+    })
+
+
+def bench_lists(size: int = 100_000) -> None:
+    items_format = f.List(f.Integer())
+    nested_format = f.List(f.Dict(value=f.Integer()))
+    items = list(range(size))
+    nested = [{'value': index} for index in range(size)]
+
+    def eager_paths() -> list:
+        """Cost of the paths previously built for each item, even for valid data."""
+        return [f"[{index}]['value']" for index in range(size)]
+
+    report(f"List paths ({size} items)", {
+        "eager paths only": eager_paths,
+        "List(Integer).parse": lambda: items_format.parse(items),
+        "List(Integer).compile": lambda: items_format.compile()(items),
+        "List(Dict).parse": lambda: nested_format.parse(nested),
+        "List(Dict).compile": lambda: nested_format.compile()(nested),
+    })
+
+
+def bench_union(size: int = 2_000, width: int = 20) -> None:
+    tags = {
+        f"kind-{index}": f.Dict(kind=f.String(), **{f"field_{index}_{key}": f.Integer() for key in range(5)})
+        for index in range(width)
+    }
+    records = [
+        {'kind': f"kind-{index % width}", **{f"field_{index % width}_{key}": str(key) for key in range(5)}}
+        for index in range(size)
+    ]
+    untagged = f.Union(*tags.values())
+    tagged = f.Union(discriminator='kind', tags=tags)
+    mixed = f.Union(*(f.List(f.Integer()) for _ in range(width)), f.Integer())
+
+    report(f"Union of {width} record types ({size} records)", {
+        "options one by one": lambda: [untagged.parse(record) for record in records],
+        "discriminator": lambda: [tagged.parse(record) for record in records],
+        "discriminator (compile)": lambda: [tagged.compile()(record) for record in records],
+    })
+    report(f"Union dispatched on type ({size} values)", {
+        "parse": lambda: [mixed.parse(index) for index in range(size)],
+        "compile": lambda: [mixed.compile()(index) for index in range(size)],
+    })
+
+
+def legacy_decimal(data: str) -> float:
+    """String branch of `Decimal` before the patterns were compiled."""
+    if data == 'inf' or data == '-inf' or data == 'nan' or re.match(r'^(\d+|\d+\.\d*|\.\d+)$', data):
+        return float(data)
+    raise f.ParsingError('', data, float, "invalid")
+
+
+def legacy_date(data: str) -> date:
+    """String branch of `Date` before the patterns were compiled."""
+    if re.match(r'^\d{4}-\d{2}-\d{2}$', data):
+        return date.fromisoformat(data)
+    raise f.ParsingError('', data, date, "invalid")
+
+
+def legacy_datetime(data: str) -> datetime:
+    """String branch of `Datetime` before the patterns were compiled."""
+    if re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}$', data):
+        return datetime.fromisoformat(data)
+    raise f.ParsingError('', data, datetime, "invalid")
+
+
+def bench_atoms(size: int = 100_000) -> None:
+    rng = random.Random(0)
+    decimals = [f"{rng.random() * 1000:.3f}" if index % 2 else str(index) for index in range(size)]
+    dates = [f"{rng.randint(1900, 2100)}-{rng.randint(1, 12):02}-{rng.randint(1, 28):02}" for _ in range(size)]
+    datetimes = [f"{value}T{rng.randint(0, 23):02}:{rng.randint(0, 59):02}:00.{rng.randint(0, 999999):06}"
+                 for value in dates]
+
+    def decimal(value: str) -> float:
+        if f.is_decimal_string(value):
+            return float(value)
+        raise f.ParsingError('', value, float, "invalid")
+
+    for name, legacy, function, values in [
+        ("Decimal", legacy_decimal, decimal, decimals),
+        ("Date", legacy_date, f.parse_iso_date, dates),
+        ("Datetime", legacy_datetime, f.parse_iso_datetime, datetimes),
+    ]:
+        report(f"{name} strings ({size} values)", {
+            "before (re.match)": lambda: [legacy(value) for value in values],
+            "after": lambda: [function(value) for value in values],
+        })
+
+
+if __name__ == '__main__':
+    bench_compile()
+    bench_parse_many()
+    bench_lists()
+    bench_union()
+    bench_atoms()
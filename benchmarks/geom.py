@@ -0,0 +1,124 @@
+"""Benchmarks for `tools37.geom`."""
+import random
+from heapq import nsmallest
+from numbers import Real
+
+from tools37.Typed import Typed, TypedArg, typedmethod
+from tools37.geom import AbsoluteBoundingBox, Circle, Coords, SpatialIndex, Vector, VectorArray, VectorBase
+from tools37.geom.SpatialIndex import distance, geometry
+from .utils import report
+
+
+class TypedVector(Typed):
+    """Vector dispatching its operators through `Typed`, as `geom.Vector` did."""
+
+    def __init__(self, x: Real, y: Real):
+        self.x: Real = x
+        self.y: Real = y
+
+    @typedmethod(Real)
+    def __add__(self, other):
+        return TypedVector(self.x + other, self.y + other)
+
+    @typedmethod(Real)
+    def __mul__(self, other):
+        return TypedVector(self.x * other, self.y * other)
+
+    @typedmethod(Real)
+    def __rmul__(self, other):
+        return TypedVector(other * self.x, other * self.y)
+
+    @typedmethod(TypedArg.CLASS)
+    def __add__(self, other):
+        return TypedVector(self.x + other.x, self.y + other.y)
+
+    @typedmethod(TypedArg.CLASS)
+    def __mul__(self, other):
+        return self.x * other.x + self.y * other.y
+
+    @typedmethod(TypedArg.CLASS)
+    def __xor__(self, other):
+        return self.x * other.y - self.y * other.x
+
+    @typedmethod(object)
+    def __add__(self, _):
+        return NotImplemented
+
+    @typedmethod(object)
+    def __mul__(self, _):
+        return NotImplemented
+
+    @typedmethod(object)
+    def __rmul__(self, _):
+        return NotImplemented
+
+    @typedmethod(object)
+    def __xor__(self, _):
+        return NotImplemented
+
+
+def bench_vector(count: int = 100_000) -> None:
+    operations = {
+        "v + w": lambda v, w: v + w,
+        "v + 1.0": lambda v, w: v + 1.0,
+        "2.0 * v": lambda v, w: 2.0 * v,
+        "v * w (inner)": lambda v, w: v * w,
+        "v ^ w (outer)": lambda v, w: v ^ w,
+        "p + dt * s (forward)": lambda v, w: v + 0.5 * w,
+    }
+    for title, operation in operations.items():
+        cases = {}
+        for name, cls in [("Typed", TypedVector), ("type() branching", Vector)]:
+            pairs = [(cls(index, 1.0), cls(2.0, index)) for index in range(count)]
+            cases[name] = lambda pairs=pairs: [operation(v, w) for v, w in pairs]
+
+        report(f"{count} x {title}", cases)
+
+
+def bench_array(count: int = 1_000_000) -> None:
+    vectors = [Vector(index % 1000, index // 1000) for index in range(count)]
+    vector_array = VectorArray.from_vectors(vectors)
+    base = VectorBase(Vector(1, 3), Vector(2, 5))
+    offset = Vector(0.5, -0.5)
+
+    report(f"{count} x base << v", {
+        "Vector": lambda: [base << v for v in vectors],
+        "VectorArray": lambda: base << vector_array,
+    }, repeat=3)
+    report(f"{count} x (v + w).__unit__()", {
+        "Vector": lambda: [(v + offset).__unit__() for v in vectors],
+        "VectorArray": lambda: (vector_array + offset).__unit__(),
+    }, repeat=3)
+
+
+def bench_spatial_index(size: int = 5_000, queries: int = 200) -> None:
+    rng = random.Random(0)
+    side = 10 * size ** 0.5
+    shapes = []
+    for _ in range(size):
+        x, y = rng.uniform(0, side), rng.uniform(0, side)
+        if rng.random() < 0.5:
+            shapes.append(Circle(Coords(x, y), rng.uniform(1, 5)))
+        else:
+            shapes.append(AbsoluteBoundingBox(x, y, x + rng.uniform(1, 10), y + rng.uniform(1, 10)))
+
+    index = SpatialIndex.of_shapes(shapes)
+    geometries = [geometry(shape) for shape in shapes]
+    points = [Coords(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(queries)]
+
+    report(f"{queries} points hit-tested against {size} shapes", {
+        "naive loop": lambda: [[key for key, shape in enumerate(shapes) if point in shape] for point in points],
+        "SpatialIndex": lambda: index.containing_many(points),
+    }, repeat=3)
+    report(f"{queries} x 5 nearest shapes among {size}", {
+        "naive loop": lambda: [[key for _, key in nsmallest(5, ((distance(*g, p.x, p.y), key)
+                                                              for key, g in enumerate(geometries)))]
+                               for p in points],
+        "SpatialIndex": lambda: index.nearest_many(points, k=5),
+    }, repeat=3)
+
+
+if __name__ == '__main__':
+    bench_vector()
+    bench_array()
+    bench_spatial_index()
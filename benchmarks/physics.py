@@ -0,0 +1,132 @@
+"""Benchmarks for `tools37.physics`."""
+import random
+from functools import partial
+
+from tools37.algebra import Polynom
+from tools37.geom import Vector
+from tools37.physics import ArraySystem, Circle, Line, ParallelSystem, ScheduledSystem, SweepAndPrune, System
+from tools37.physics import circle_circle_collision, circle_circle_impacts, circle_circle_impacts_many
+from tools37.physics import circle_line_collision, circle_line_impacts
+from .utils import report
+
+
+def new_scene(size: int, seed: int = 0) -> System:
+    """Return a system of `size` unit circles on a grid, with random offsets and speeds."""
+    rng = random.Random(seed)
+    system = System(gravity=Vector(0, -0.05), friction=0.01, max_collision_check=10 ** 9)
+    side = int(size ** 0.5)
+    for index in range(size):
+        circle = Circle(position=Vector(3 * (index % side) + rng.random(), 3 * (index // side) + rng.random()),
+                        radius=1, speed=Vector(rng.uniform(-1, 1), rng.uniform(-1, 1)), mass=rng.choice([1, 2, 3]))
+        system.objects.append(circle)
+        system.objects_searching_for_collision.append(circle)
+
+    return system
+
+
+def bench_update(sizes=(30, 100, 300)) -> None:
+    for size in sizes:
+        cases = {
+            "System": lambda size=size: new_scene(size).update(),
+            "ArraySystem": lambda size=size: ArraySystem.from_system(new_scene(size)).update(),
+        }
+        report(f"update of {size} circles", cases, repeat=3 if size < 300 else 1)
+
+
+def bench_broad_phase(sizes=(100, 300)) -> None:
+    def update(new_system, broad_phase, size) -> None:
+        system = new_system(new_scene(size))
+        system.broad_phase = broad_phase
+        system.update()
+
+    for size in sizes:
+        cases = {
+            "ArraySystem (all pairs)": partial(update, ArraySystem.from_system, None, size),
+            "ArraySystem (sweep and prune)": partial(update, ArraySystem.from_system, SweepAndPrune(), size),
+        }
+        if size <= 100:
+            cases["System (all pairs)"] = partial(update, lambda system: system, None, size)
+            cases["System (sweep and prune)"] = partial(update, lambda system: system, SweepAndPrune(), size)
+
+        report(f"update of {size} circles", cases, repeat=1)
+
+
+def bench_scheduler(sizes=(300, 1_000, 10_000)) -> None:
+    for size in sizes:
+        cases = {}
+        if size <= 1_000:
+            cases["ArraySystem"] = lambda size=size: ArraySystem.from_system(new_scene(size)).update()
+
+        cases["ScheduledSystem"] = lambda size=size: ScheduledSystem.from_system(new_scene(size)).update()
+        report(f"update of {size} circles", cases, repeat=1)
+
+
+def bench_workers(size: int = 40_000, workers=(1, 2, 4, 8), updates: int = 3) -> None:
+    """Scaling of ParallelSystem on a deterministic scene, the pools are started before timing."""
+    systems = {"ScheduledSystem": ScheduledSystem.from_system(new_scene(size))}
+    for count in workers:
+        system = systems[f"ParallelSystem ({count} workers)"] = ParallelSystem.from_system(new_scene(size))
+        system.workers = count
+        system.update()
+
+    cases = {name: partial(system.update) for name, system in systems.items()}
+    try:
+        report(f"{updates} updates of {size} circles", cases, number=updates, repeat=1)
+
+    finally:
+        for system in systems.values():
+            if isinstance(system, ParallelSystem):
+                system.close()
+
+
+def polynom_circle_circle(circle1: Circle, circle2: Circle):
+    """Impacts computed with the `Polynom` of the relative position, as `circle_circle_collision` did."""
+    rt = Polynom(circle1.position, circle1.speed) - Polynom(circle2.position, circle2.speed)
+    err = rt ** 2 - (circle1.radius + circle2.radius) ** 2
+    if err(0) >= 0:
+        for t in err.solve():
+            yield t, rt(t)
+
+
+def polynom_circle_line(circle: Circle, line: Line):
+    """Impacts computed with the `Polynom` of the relative position, as `circle_line_collision` did."""
+    rt = Polynom(circle.position, circle.speed) - Polynom(line.origin, line.speed)
+    ex = line.delta.__unit__()
+    ey = ex.__orth__()
+    err = (rt * ey) ** 2 - circle.radius ** 2
+    for t in err.solve():
+        if 0 <= rt(t) * ex <= 2 * abs(line.delta):
+            yield t, (rt(t) * ey) * ey
+
+
+def bench_kernels(count: int = 10_000) -> None:
+    circles = new_scene(count).objects
+    pairs = list(zip(circles, circles[1:]))
+    line = Line(origin=Vector(0, 0), target=Vector(100, 100), speed=Vector(0, 0), mass=float('inf'))
+    columns = [[a.position.x - b.position.x for a, b in pairs], [a.position.y - b.position.y for a, b in pairs],
+               [a.speed.x - b.speed.x for a, b in pairs], [a.speed.y - b.speed.y for a, b in pairs],
+               [a.radius + b.radius for a, b in pairs]]
+
+    report(f"{len(pairs)} circle / circle impacts", {
+        "Polynom": lambda: [list(polynom_circle_circle(a, b)) for a, b in pairs],
+        "circle_circle_collision": lambda: [list(circle_circle_collision(a, b)) for a, b in pairs],
+        "circle_circle_impacts": lambda: [circle_circle_impacts(*args) for args in zip(*columns)],
+        "circle_circle_impacts_many": lambda: circle_circle_impacts_many(*columns),
+    })
+
+    dps = [circle.position - line.origin for circle in circles]
+    report(f"{count} circle / line impacts", {
+        "Polynom": lambda: [list(polynom_circle_line(circle, line)) for circle in circles],
+        "circle_line_collision": lambda: [list(circle_line_collision(circle, line)) for circle in circles],
+        "circle_line_impacts": lambda: [circle_line_impacts(dp.x, dp.y, circle.speed.x, circle.speed.y, circle.radius,
+                                                            line.delta.x, line.delta.y)
+                                        for dp, circle in zip(dps, circles)],
+    })
+
+
+if __name__ == '__main__':
+    bench_kernels()
+    bench_update()
+    bench_broad_phase()
+    bench_scheduler()
+    bench_workers()
@@ -0,0 +1,68 @@
+"""Benchmarks for `tools37.Typed`."""
+from tools37.geom import Vector
+from tools37.physics import Line, System
+from tools37.Typed import TypedArg
+from .geom import TypedVector
+from .physics import new_scene
+from .utils import report
+
+
+def linear_dispatch(cls: type, name: str):
+    """Return the method `name` of `cls` checking every registered method at each call, as `Typed` did before."""
+    data = getattr(cls, name).registry
+
+    def check_arg(arg, arg_type):
+        if arg_type is TypedArg.CLASS:
+            return type(arg) is cls
+        elif arg_type is TypedArg.SUBCLASS:
+            return isinstance(arg, cls)
+        else:
+            return isinstance(arg, arg_type)
+
+    def method(self, *args):
+        for args_type, method in data:
+            if all(map(check_arg, args, args_type)):
+                return method(self, *args)
+
+        raise TypeError(args)
+
+    return method
+
+
+class LinearTypedVector(TypedVector):
+    pass
+
+
+class LinearSystem(System):
+    pass
+
+
+LinearTypedVector.__add__ = linear_dispatch(LinearTypedVector, '__add__')
+LinearSystem.calculate_collisions_between = linear_dispatch(LinearSystem, 'calculate_collisions_between')
+
+
+def bench_vector_add(count: int = 100_000) -> None:
+    cases = {}
+    for name, cls in [("linear scan", LinearTypedVector), ("cached", TypedVector)]:
+        vectors = [cls(index, 1.0) for index in range(count)]
+        cases[f"{name}, v + w"] = lambda vectors=vectors: [v + w for v, w in zip(vectors, reversed(vectors))]
+        cases[f"{name}, v + 1.0"] = lambda vectors=vectors: [v + 1.0 for v in vectors]
+
+    report(f"{count} x TypedVector.__add__", cases)
+
+
+def bench_pair_dispatch(size: int = 300) -> None:
+    scene = new_scene(size)
+    line = Line(origin=Vector(0, 0), target=Vector(100, 0), speed=Vector(0, 0), mass=float('inf'))
+    pairs = [(a, b) for a in scene.objects[:30] for b in scene.objects] + [(a, line) for a in scene.objects]
+    cases = {}
+    for name, cls in [("linear scan", LinearSystem), ("cached", System)]:
+        system = cls(gravity=scene.gravity, friction=scene.friction)
+        cases[name] = lambda system=system: [system.calculate_collisions_between(a, b) for a, b in pairs]
+
+    report(f"{len(pairs)} x System.calculate_collisions_between", cases)
+
+
+if __name__ == '__main__':
+    bench_vector_add()
+    bench_pair_dispatch()
@@ -0,0 +1,24 @@
+"""Helpers shared by the benchmark scripts (run them with `python -m benchmarks.<name>`)."""
+import timeit
+from typing import Callable, Dict
+
+from tools37.ReprTable import ReprTable
+
+__all__ = ['measure', 'report']
+
+
+def measure(function: Callable[[], object], number: int = 1, repeat: int = 5) -> float:
+    """Return the best time (in seconds) of a single call to `function`."""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def report(title: str, cases: Dict[str, Callable[[], object]], number: int = 1, repeat: int = 5) -> None:
+    """Time each case and print them in a table, the first case is used as the reference for the speedup."""
+    timings = {name: measure(function, number, repeat) for name, function in cases.items()}
+    reference = next(iter(timings.values()))
+
+    print(title)
+    print(ReprTable([["case", "time (s)", "speedup"]] + [
+        [name, f"{timing:.6f}", f"x{reference / timing:.2f}"]
+        for name, timing in timings.items()
+    ]))
@@ -1,11 +1,13 @@
 import unittest
 
 from tests.test_algebra import TestAlgebra
-from tests.test_geom import TestVector, TestCoords, TestVectorBase
+from tests.test_typed import TestTyped
+from tests.test_geom import TestVector, TestCoords, TestVectorBase, TestVectorArray, TestCoordsArray, TestSpatialIndex
 from tests.test_physics import TestPhysic
 from tests.test_formats import TestFormats
-from tests.test_events import TestEvents
-from tests.tests_tkfw import TestEvaluableDictItem, TestEvaluableListItem, TestEvaluablePath
+from tests.test_files import TestJsonFile
+from tests.test_events import TestEvents, TestQueueEventManager, TestAsyncEventManager, TestExecutorEventManager
+from tests.tests_tkfw import TestEvaluableDictItem, TestEvaluableListItem, TestEvaluablePath, TestComponent
 
 if __name__ == '__main__':
     unittest.main()
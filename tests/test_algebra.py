@@ -1,5 +1,8 @@
+import random
 import unittest
+
 from tools37.algebra import *
+from tools37.algebra.Polynom import solve_many
 
 
 class TestAlgebra(unittest.TestCase):
@@ -21,6 +24,56 @@ class TestAlgebra(unittest.TestCase):
         self.assertEqual(p1 * 5, Polynom(5, 10, 15))
         self.assertEqual(p1 * p2, Polynom(2, 7, 12, 9))
 
+    def test_mul_large(self):
+        """The Karatsuba multiplication of large polynoms gives the same factors as the double loop."""
+        rng = random.Random(0)
+        p1 = Polynom(*(rng.randint(-9, 9) for _ in range(150)))
+        p2 = Polynom(*(rng.randint(-9, 9) for _ in range(100)))
+        factors = [0] * (len(p1) + len(p2) - 1)
+        for i, c1 in enumerate(p1):
+            for j, c2 in enumerate(p2):
+                factors[i + j] += c1 * c2
+
+        self.assertEqual(p1 * p2, Polynom(*factors))
+
+    def test_pow(self):
+        p = Polynom(1, 2, 3)
+        self.assertEqual(p ** 0, Polynom(1))
+        self.assertEqual(p ** 1, p)
+        self.assertEqual(p ** 5, p * p * p * p * p)
+
+    def test_call(self):
+        p = Polynom(1, 2, 3)
+        self.assertEqual(p(2), 17)
+        self.assertEqual(p.evaluate_many([0, 1, 2]), [1, 6, 17])
+        self.assertEqual(Polynom(4).evaluate_many([0, 1]), [4, 4])
+        self.assertEqual(p.evaluate_many(x for x in range(3)), [1, 6, 17])
+
+    def test_solve(self):
+        """The roots of products of (x - root) are found up to the degree 4."""
+        rng = random.Random(0)
+        for degree in range(1, 5):
+            for _ in range(100):
+                roots = sorted(rng.uniform(-5, 5) for _ in range(degree))
+                p = Polynom(rng.uniform(1, 2))
+                for root in roots:
+                    p = p * Polynom(-root, 1)
+
+                solutions = p.solve()
+                self.assertEqual(len(solutions), degree)
+                for solution, root in zip(solutions, roots):
+                    self.assertAlmostEqual(solution, root, places=4)
+
+        self.assertEqual(Polynom(1, 0, 1).solve(), [])
+        self.assertEqual(Polynom(-8, 0, 0, 1).solve(), [2.0])
+        self.assertEqual(Polynom(2, 0, 1, 0, 1).solve(), [])
+        self.assertEqual(Polynom(-1, 0, 0, 0, 1).solve(), [-1.0, 1.0])
+        self.assertRaises(ValueError, Polynom(1, 2, 3, 4, 5, 6).solve)
+
+    def test_solve_many(self):
+        columns = [[1, -4, 2, 3], [0, 0, -3, 1], [-1, 1, 1, 0], [0, 0, 0, 0]]
+        self.assertEqual(solve_many(*columns), [Polynom(*factors).solve() for factors in zip(*columns)])
+
 
 if __name__ == '__main__':
     unittest.main()
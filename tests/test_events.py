@@ -1,6 +1,16 @@
+import asyncio
+import copy
+import gc
+import re
+import threading
 import unittest
+from collections import deque
+from functools import partial
 
+from tools37.events import abc, base, factory
 from tools37.events.direct import *
+from tools37.events.instrumentation import Instrumentation
+from tools37.events.patterns import Glob, PatternTrie
 
 
 class TestEvents(unittest.TestCase):
@@ -92,6 +102,485 @@ class TestEvents(unittest.TestCase):
             msg="Transmitters shall be able to re-emit events they receive with an additional prefix to the event name."
         )
 
+    def test_004(self):
+        emitter1 = Emitter()
+        emitter2 = Emitter()
+        observer = Observer()
+        calls = []
+
+        observer.on(name='abc', emitter=emitter1, function=lambda event: calls.append(('abc', event.name)))
+        observer.on(name='*', emitter=emitter1, function=lambda event: calls.append(('*', event.name)))
+        observer.on(name='xyz', emitter=emitter1, function=lambda event: calls.append(('xyz', event.name)))
+        observer.on(name='abc', emitter=emitter2, function=lambda event: calls.append(('2', event.name)))
+
+        emitter1.emit('abc')
+        emitter1.emit('xyz')
+        self.assertEqual(
+            calls,
+            [('abc', 'abc'), ('*', 'abc'), ('*', 'xyz'), ('xyz', 'xyz')],
+            msg="only the models matching the event should be called, in their registration order."
+        )
+
+        calls.clear()
+        observer.forget(name='*', emitter=emitter1)
+        emitter1.emit('abc')
+        emitter2.emit('abc')
+        self.assertEqual(calls, [('abc', 'abc'), ('2', 'abc')], msg="forgotten models should not be called.")
+
+    def test_005(self):
+        emitter = Emitter()
+        observer = Observer()
+        calls = []
+
+        names = {'glob': Glob('.items.*'), 'or': Glob(':append|:insert'), 'any': '*',
+                 'regex': re.compile(r'\.items\.\d+'), 'literal': '.items.*'}
+        for label, name in names.items():
+            observer.on(name=name, emitter=emitter,
+                        function=lambda event, label=label: calls.append((label, event.name)))
+
+        emitter.emit('.items.0')
+        emitter.emit(':insert')
+        emitter.emit(':remove')
+        emitter.emit('.items.*')
+        self.assertEqual(
+            calls,
+            [('glob', '.items.0'), ('any', '.items.0'), ('regex', '.items.0'),
+             ('or', ':insert'), ('any', ':insert'),
+             ('any', ':remove'),
+             ('glob', '.items.*'), ('any', '.items.*'), ('literal', '.items.*')],
+            msg="glob and regex names should match the events, in the models registration order."
+        )
+
+        calls.clear()
+        observer.forget(name=Glob('.items.*'), emitter=emitter)
+        observer.forget(name='*', emitter=emitter)
+        emitter.emit('.items.1')
+        self.assertEqual(len(calls), 1, msg="forgotten patterns should not be matched.")
+
+    def test_006(self):
+        trie = PatternTrie()
+        patterns = ['*', 'a*', '*b', 'a*b', 'a*b*c', 'ab|cd', '*.x*', 'abc']
+        names = ['', 'a', 'b', 'ab', 'abc', 'aabbcc', 'cd', 'acd', '.x', 'a.xb']
+        for order, pattern in enumerate(patterns):
+            trie.add(pattern, pattern, order)
+
+        for name in names:
+            expected = {pattern for pattern in patterns
+                        if EventModel(name=Glob(pattern)).match(Event(name=name))}
+            self.assertEqual(set(trie.match(name)), expected, msg=f"{name!r} should match {expected}.")
+
+        trie.remove('a*', 'a*')
+        trie.remove('ab|cd', 'ab|cd')
+        self.assertEqual(set(trie.match('ab')), {'*', '*b', 'a*b'})
+
+    def test_007(self):
+        emitter = Emitter()
+        transmitter = Transmitter()
+        observer = Observer()
+        calls = []
+
+        transmitter.transmit_without_prefix(emitter=emitter, prefix='.key')
+        transmitter.transmit_without_prefix(emitter=emitter, prefix='.a|b')
+        observer.on(name='*', emitter=transmitter, function=lambda event: calls.append(event.name))
+
+        emitter.emit('.key:set')
+        emitter.emit('.other:set')
+        emitter.emit('.a|b:set')
+        self.assertEqual(calls, [':set', ':set'], msg="only the prefixed events should be transmitted, without prefix.")
+
+        transmitter.forget_without_prefix(emitter=emitter, prefix='.key')
+        transmitter.forget_without_prefix(emitter=emitter, prefix='.a|b')
+        emitter.emit('.key:set')
+        emitter.emit('.a|b:set')
+        self.assertEqual(calls, [':set', ':set'], msg="the forgotten transmissions should stop.")
+
+        transmitter.transmit(name='*', emitter=emitter, prefix='.all')
+        transmitter.forget_without_prefix(emitter=emitter, prefix='.a|b')
+        emitter.emit(':set')
+        self.assertEqual(calls[2:], ['.all:set'], msg="forgetting should not remove the other transmissions.")
+
+        for prefix in ('*', Glob('.a*'), re.compile(r'\.a')):
+            self.assertRaises(ValueError, transmitter.transmit_without_prefix, emitter=emitter, prefix=prefix)
+            self.assertRaises(ValueError, transmitter.forget_without_prefix, emitter=emitter, prefix=prefix)
+
+    def test_008(self):
+        Event, EventModel, Emitter, Observer, Transmitter = factory.new_event_system(base.DirectEventManager)
+        manager = Event._manager
+        emitter = Emitter()
+        observer = Observer()
+        calls = []
+
+        observer.on(name='abc', emitter=emitter, function=calls.append)
+        model = EventModel(name='abc', observer=observer, emitter=emitter)
+        del observer
+        emitter.emit('abc')
+        self.assertEqual(calls, [], msg="the functions of a garbage collected observer should not be called.")
+        self.assertNotIn(model, manager.models, msg="the models of a garbage collected observer should be removed.")
+
+        observer = Observer()
+        temporary = Emitter()
+        observer.on(name='abc', emitter=temporary, function=calls.append)
+        del temporary
+        emitter.emit('abc')
+        self.assertEqual(manager.models, set(), msg="the models of a garbage collected emitter should be removed.")
+        self.assertEqual(observer._event_functions, {}, msg="the observer should not keep the removed functions.")
+
+        transmitter = Transmitter()
+        transmitter.transmit(name='*', emitter=emitter, prefix='.')
+        del transmitter
+        gc.collect()
+        emitter.emit('abc')
+        self.assertEqual(manager.models, set(), msg="the transmissions should not keep the transmitter alive.")
+
+        observer.on(name='abc', emitter=emitter, function=lambda event: calls.append('observer'))
+        shallow, deep = copy.copy(observer), copy.deepcopy(observer)
+        shallow.on(name='abc', emitter=emitter, function=lambda event: calls.append('shallow'))
+        self.assertIsNot(shallow._event_functions, observer._event_functions)
+        emitter.emit('abc')
+        self.assertEqual(calls, ['observer', 'shallow'], msg="the copies should not share the observer functions.")
+        self.assertNotIn('_event_functions', deep.__dict__)
+
+    def test_009(self):
+        emitter = Emitter()
+        transmitter = Transmitter()
+        event = Event(emitter=emitter, name=':set', args=(1,))
+
+        with self.assertRaises(AttributeError, msg="events should be immutable."):
+            event.name = ':del'
+
+        self.assertEqual(event.retarget('.key', transmitter), Event(transmitter, '.key:set', (1,), {}))
+        self.assertEqual(event.retarget(':', transmitter, remove=True).name, 'set')
+
+    def test_010(self):
+        Event, _, Emitter, Observer, Transmitter = factory.new_event_system(base.DirectEventManager,
+                                                                            event_pool_size=4)
+        emitter = Emitter()
+        transmitter = Transmitter()
+        observer = Observer()
+        transmitter.transmit(name='*', emitter=emitter, prefix='.key')
+        events = []
+        observer.on(name='*', emitter=transmitter, function=lambda event: events.append(id(event)))
+
+        emitter.emit(':set', value=1)
+        emitter.emit(':set', value=2)
+        self.assertEqual(len(set(events)), 1, msg="the events no longer referenced should be reused.")
+
+        kept, copies = [], []
+        observer.on(name='*', emitter=transmitter, function=kept.append)
+        observer.on(name='*', emitter=transmitter, function=lambda event: copies.append(event.copy()))
+        emitter.emit(':set', value=3)
+        emitter.emit(':set', value=4)
+        self.assertIs(kept[0], kept[1], msg="the events are reused once applied, even if a callback kept them.")
+        self.assertEqual([event.kwargs for event in copies], [{'value': 3}, {'value': 4}],
+                         msg="the copies of the events should not be reused.")
+
+        with self.assertRaises(ValueError, msg="the events of a queue are applied after their emission."):
+            factory.new_event_system(base.QueueEventManager, event_pool_size=4)
+
+    def test_011(self):
+        def scenario(manager_factory, cycle: bool) -> list:
+            _, _, Emitter, Observer, Transmitter = factory.new_event_system(manager_factory)
+            emitter = Emitter()
+            transmitter1 = Transmitter()
+            transmitter2 = Transmitter()
+            observer = Observer()
+            calls = []
+
+            transmitter1.transmit(name='*', emitter=emitter, prefix='.a')
+            transmitter2.transmit_without_prefix(emitter=emitter, prefix='.b')
+            transmitter2.transmit(name='*', emitter=transmitter1)
+            if cycle:
+                # the events go back and forth between the transmitters under the same names
+                transmitter1.transmit(name='*', emitter=transmitter2)
+
+            for name, source in [('t1', transmitter1), ('t2', transmitter2)]:
+                observer.on(name='*', emitter=source,
+                            function=lambda event, name=name: calls.append((name, event.name, event.kwargs)))
+
+            emitter.emit('.b:set', value=1)
+            emitter.emit(':del')
+            return calls
+
+        # the instrumentation disables the routes, the events are then re-emitted at each transmitter
+        hop_by_hop = partial(base.DirectEventManager, instrumentation=Instrumentation())
+        self.assertEqual(scenario(base.DirectEventManager, cycle=False), scenario(hop_by_hop, cycle=False),
+                         msg="the routes should deliver the events like the transmitters.")
+        self.assertEqual(
+            scenario(base.DirectEventManager, cycle=True),
+            [('t2', '.a.b:set', {'value': 1}),
+             ('t1', '.a.b:set', {'value': 1}),
+             ('t1', ':set', {'value': 1}),
+             ('t2', ':set', {'value': 1}),
+             ('t2', '.a:del', {}),
+             ('t1', '.a:del', {})],
+            msg="the routes should stop when an event comes back to a transmitter with the same name."
+        )
+
+    def test_012(self):
+        def scenario(manager_factory) -> list:
+            _, _, Emitter, Observer, Transmitter = factory.new_event_system(manager_factory)
+            emitter = Emitter()
+            transmitter1 = Transmitter()
+            transmitter2 = Transmitter()
+            observer = Observer()
+            calls = []
+
+            # ':set' reaches transmitter1 as '.a:set' then again as ':set' through transmitter2
+            transmitter1.transmit(name='*', emitter=emitter, prefix='.a')
+            transmitter2.transmit_without_prefix(emitter=transmitter1, prefix='.a')
+            transmitter1.transmit(name='*', emitter=transmitter2)
+            observer.on(name='*', emitter=transmitter1, function=lambda event: calls.append(event.name))
+
+            emitter.emit(':set')
+            return calls
+
+        hop_by_hop = partial(base.DirectEventManager, instrumentation=Instrumentation())
+        self.assertEqual(scenario(hop_by_hop), [':set', '.a:set'])
+        self.assertEqual(scenario(base.DirectEventManager), scenario(hop_by_hop),
+                         msg="the routes should follow finite chains going through a transmitter twice.")
+
+    def test_013(self):
+        """A route longer than `max_route_depth` falls back to re-emitting at each transmitter."""
+        _, _, Emitter, Observer, Transmitter = factory.new_event_system(partial(base.DirectEventManager,
+                                                                                max_route_depth=3))
+        emitter = Emitter()
+        transmitters = [Transmitter() for _ in range(6)]
+        observer = Observer()
+        calls = []
+
+        source = emitter
+        for transmitter in transmitters:
+            transmitter.transmit(name='*', emitter=source, prefix='.x')
+            source = transmitter
+
+        observer.on(name='*', emitter=source, function=lambda event: calls.append(event.name))
+        emitter.emit(':set')
+        emitter.emit(':set')
+        self.assertEqual(calls, ['.x.x.x.x.x.x:set'] * 2)
+
+    def test_014(self):
+        """The subclasses implementing only the abstract methods work with the default implementations."""
+        Event, _, Emitter, _, _ = factory.new_event_system(base.DirectEventManager)
+        manager = Event._manager
+
+        class NameModel(abc.EventModel):
+            def __init__(self, name, emitter):
+                self.name, self.emitter = name, emitter
+
+            def __hash__(self):
+                return hash((self.name, id(self.emitter)))
+
+            def triggers(self, callback):
+                manager.register_function(self, callback)
+
+            def match(self, event):
+                return event.emitter is self.emitter and event.name == self.name
+
+            def forget(self):
+                manager.unregister_model(self)
+
+        emitter = Emitter()
+        calls = []
+        model = NameModel('abc', emitter)
+        model.triggers(calls.append)
+        emitter.emit('abc')
+        model.forget()
+        emitter.emit('abc')
+        self.assertEqual([event.name for event in calls], ['abc'])
+        self.assertIsNone(model.functions())
+
+        class NameTransmitter(abc.Transmitter):
+            _create_event_model = on = forget = _create_event = emit = transmit = transmit_without_prefix = None
+
+        self.assertRaises(NotImplementedError, NameTransmitter().forget_without_prefix, emitter, '.key')
+
+        class NameEvent(abc.Event):
+            emit = with_emitter = None
+
+        self.assertRaises(NotImplementedError, NameEvent().retarget, '.key', emitter)
+
+
+class TestQueueEventManager(unittest.TestCase):
+    def test_001(self):
+        Event, _, Emitter, Observer, _ = factory.new_event_system(partial(base.QueueEventManager, coalesce=True))
+        emitter1 = Emitter()
+        emitter2 = Emitter()
+        observer = Observer()
+        calls = []
+
+        for emitter in (emitter1, emitter2):
+            observer.on(name='*', emitter=emitter, function=lambda event: calls.append((event.name, event.args)))
+
+        emitter1.emit('a', 1)
+        emitter2.emit('a', 1)
+        emitter1.emit('b', 1)
+        emitter1.emit('a', 2)
+        Event._manager.update()
+        self.assertEqual(
+            calls,
+            [('a', (1,)), ('b', (1,)), ('a', (2,))],
+            msg="only the newest event of an emitter with a given name should be applied."
+        )
+
+    def test_002(self):
+        Event, _, Emitter, Observer, _ = factory.new_event_system(base.QueueEventManager)
+        manager = Event._manager
+        emitter = Emitter()
+        calls = []
+
+        observer = Observer()
+        observer.on(name='*', emitter=emitter, function=calls.append)
+
+        with manager.batch():
+            emitter.emit(':pop', index=-1)
+            with manager.batch():
+                emitter.emit(':append', index=0)
+                emitter.emit(':append', index=1)
+
+            emitter.emit(':pop', index=-1)
+            self.assertEqual(manager.queue, deque(), msg="the events should be queued at the end of the batch.")
+
+        manager.update()
+        self.assertEqual([event.name for event in calls], [':pop', ':append'])
+        self.assertEqual([event.kwargs for event in calls[1].kwargs['events']], [{'index': 0}, {'index': 1}])
+
+        calls.clear()
+        with manager.batch():
+            emitter.emit(':insert', index=0)
+
+        manager.update()
+        self.assertEqual(calls[0].kwargs, {'index': 0}, msg="a single event should be applied unchanged.")
+
+    def test_003(self):
+        Event, EventModel, Emitter, Observer, _ = factory.new_event_system(base.QueueEventManager)
+        manager = Event._manager
+        manager.instrumentation = instrumentation = Instrumentation(window=4)
+        emitter = Emitter()
+        observer = Observer()
+
+        def fast(event: Event) -> None:
+            pass
+
+        def slow(event: Event) -> None:
+            sum(range(10_000))
+
+        observer.on(name='abc', emitter=emitter, function=fast)
+        observer.on(name='*', emitter=emitter, function=slow)
+        for _ in range(10):
+            emitter.emit('abc')
+
+        manager.update()
+        manager.update()
+        snapshot = instrumentation.snapshot()
+
+        self.assertEqual(snapshot.dispatches, {repr(EventModel('abc', observer, emitter)): 10,
+                                               repr(EventModel('*', observer, emitter)): 10})
+        self.assertEqual([stats.callback.split('.')[-1] for stats in snapshot.callbacks], ['slow', 'fast'],
+                         msg="the most expensive callbacks should come first.")
+        self.assertTrue(all(stats.count == 10 and stats.p50 <= stats.p99 <= stats.maximum
+                            for stats in snapshot.callbacks))
+        self.assertEqual([depth for _, depth in snapshot.depths], [10, 0])
+        self.assertIn('slow', str(instrumentation))
+
+        instrumentation.clear()
+        other = Observer()
+        other.on(name='abc', emitter=emitter, function=lambda event: None)
+        other.on(name='abc', emitter=emitter, function=lambda event: None)
+        emitter.emit('abc')
+        manager.update()
+        self.assertEqual([stats.count for stats in instrumentation.snapshot().callbacks
+                          if stats.callback.endswith('<lambda>')], [1, 1], msg="the lambdas should be told apart.")
+
+        other.forget(emitter, 'abc')
+        self.assertNotIn(EventModel('abc', other, emitter), instrumentation.dispatches,
+                         msg="the unregistered models should be forgotten.")
+        self.assertEqual(len(instrumentation.callbacks), 2)
+
+
+class TestAsyncEventManager(unittest.TestCase):
+    def test_001(self):
+        Event, _, Emitter, Observer, _ = factory.new_event_system(partial(base.AsyncEventManager, maxsize=2))
+        manager = Event._manager
+        emitter = Emitter()
+        observer = Observer()
+        calls = []
+
+        async def slow(event: Event) -> None:
+            await asyncio.sleep(0.01)
+            calls.append(('slow', event.name))
+
+        observer.on(name='*', emitter=emitter, function=lambda event: calls.append(event.name))
+        observer.on(name='slow', emitter=emitter, function=slow)
+        emitter.emit('before')
+
+        async def main() -> None:
+            async with manager:
+                for index in range(10):
+                    emitter.emit(str(index))
+
+                thread = threading.Thread(target=lambda: [emitter.emit(f"t{index}") for index in range(5)])
+                thread.start()
+                await asyncio.get_running_loop().run_in_executor(None, thread.join)
+                emitter.emit('slow')
+
+        asyncio.run(main())
+
+        self.assertEqual(calls[0], 'before', msg="the events emitted before the start should be applied first.")
+        self.assertEqual(
+            [name for name in calls if name in map(str, range(10))],
+            list(map(str, range(10))),
+            msg="the events emitted from the loop should be applied in order, even beyond the queue size."
+        )
+        self.assertEqual(
+            [name for name in calls if isinstance(name, str) and name.startswith('t')],
+            [f"t{index}" for index in range(5)],
+            msg="the events emitted from another thread should be applied in order."
+        )
+        self.assertEqual(calls[-2:], ['slow', ('slow', 'slow')], msg="coroutine callbacks should be awaited.")
+
+
+class TestExecutorEventManager(unittest.TestCase):
+    def test_001(self):
+        Event, _, Emitter, Observer, _ = factory.new_event_system(partial(base.ExecutorEventManager, shards=2))
+        manager = Event._manager
+        observer = Observer()
+        emitters = [Emitter() for _ in range(16)]
+        # two emitters applied in different lanes
+        emitter1 = emitters[0]
+        emitter2 = next(emitter for emitter in emitters if manager.lane(emitter) != manager.lane(emitter1))
+        barrier = threading.Barrier(2, timeout=5)
+        calls = {emitter1: [], emitter2: []}
+
+        def function(event: Event) -> None:
+            if event.name == 'barrier':
+                barrier.wait()
+
+            calls[event.emitter].append(event.name)
+
+        for emitter in (emitter1, emitter2):
+            observer.on(name='*', emitter=emitter, function=function)
+            emitter.emit('barrier')
+            for index in range(100):
+                emitter.emit(str(index))
+
+        manager.shutdown()
+        expected = ['barrier', *map(str, range(100))]
+        self.assertEqual(calls[emitter1], expected, msg="the events of an emitter should be applied in order.")
+        self.assertEqual(calls[emitter2], expected, msg="the lanes should be applied in parallel.")
+
+    def test_002(self):
+        Event, _, Emitter, Observer, _ = factory.new_event_system(base.ExecutorEventManager)
+        emitter = Emitter()
+
+        def function(event: Event) -> None:
+            raise ValueError(event.name)
+
+        observer = Observer()
+        observer.on(name='*', emitter=emitter, function=function)
+        emitter.emit('abc')
+        with self.assertRaises(ValueError, msg="the exceptions of the callbacks should be raised by .wait"):
+            Event._manager.wait()
+
 
 if __name__ == '__main__':
     unittest.main()
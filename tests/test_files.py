@@ -0,0 +1,76 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from tools37 import formats as f
+from tools37.files import JsonFile
+from tools37.files.JsonFile import iter_json_array
+
+
+class TestJsonFile(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.fp = os.path.join(self.directory.name, 'data.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_iter_json_array(self):
+        data = [1, 2.5, -3e10, "a, ]string", None, True, False, [], {}, {"key": [1, {"x": "y"}]}, 12345.6789]
+        text = json.dumps(data, indent=2)
+
+        for chunk_size in (1, 2, 3, 7, 64, 1 << 16):
+            self.assertEqual(list(iter_json_array(io.StringIO(text), chunk_size)), data)
+
+        self.assertEqual(list(iter_json_array(io.StringIO(" [ ] "))), [])
+
+        for text in ('{"a": 1}', '[1, 2', '[1 2]', '[1,]', '[1, tru]'):
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_json_array(io.StringIO(text), 2))
+
+        # a malformed item stops the reading once followed by its delimiter
+        for item in ('tru', '{"a": 1 "b": 2}', '["x", 1}', '{"a": "]", ]'):
+            file = io.StringIO('[1, ' + item + ', ' + ', '.join(['{"key": "value"}'] * 10000) + ']')
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_json_array(file, 16))
+
+            self.assertLess(file.tell(), 1000)
+
+    def test_load_parsed(self):
+        JsonFile.save(self.fp, [{'id': '1', 'score': 2}, {'id': 3, 'score': '0.5'}])
+
+        records_format = f.List(f.Dict(id=f.Integer(), score=f.Decimal()))
+        self.assertEqual(JsonFile.load_parsed(self.fp, records_format), [
+            {'id': 1, 'score': 2.0},
+            {'id': 3, 'score': 0.5},
+        ])
+        self.assertEqual(JsonFile.load_parsed(self.fp, f.Union(records_format)), [
+            {'id': 1, 'score': 2.0},
+            {'id': 3, 'score': 0.5},
+        ])
+
+        JsonFile.save(self.fp, [{'id': 1}, {'id': 'x'}, {'id': 2}])
+
+        items = JsonFile.iter_parsed(self.fp, f.Dict(id=f.Integer()), 'data')
+        self.assertEqual(next(items), {'id': 1})
+        with self.assertRaises(f.ParsingError) as context:
+            next(items)
+
+        self.assertEqual(str(context.exception.path), 'data[1]')
+
+        JsonFile.save(self.fp, {'id': 1})
+
+        for data_format in (f.List(f.Dict(id=f.Integer())), f.Dict(id=f.List(f.Integer()))):
+            with self.assertRaises(f.ParsingError) as context:
+                JsonFile.load_parsed(self.fp, data_format, 'data')
+
+            with self.assertRaises(f.ParsingError) as expected:
+                data_format.parse({'id': 1}, 'data')
+
+            self.assertEqual(str(context.exception), str(expected.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from datetime import date, datetime, timedelta, timezone
 from math import isnan
 
 from tools37 import formats as f
@@ -70,13 +71,37 @@ class TestFormats(unittest.TestCase):
         self.check_parse_equal(field, False, "False")
         self.check_parse_equal(field, True, "True")
 
-    # TODO : write tests for f.Date
     def test_Date(self):
-        ...
+        field = f.Date()
+
+        self.check_parse_equal(field, date(2020, 1, 31), date(2020, 1, 31))
+        self.check_parse_equal(field, "2020-01-31", date(2020, 1, 31))
+
+        self.check_parse_error(field, "2020-02-31")
+        self.check_parse_error(field, "2020-1-31")
+        self.check_parse_error(field, "2020-01-31\n")
+        self.check_parse_error(field, 20200131)
 
-    # TODO : write tests for f.Datetime
     def test_Datetime(self):
-        ...
+        field = f.Datetime()
+
+        self.check_parse_equal(field, "2020-01-31T12:30:45", datetime(2020, 1, 31, 12, 30, 45))
+        self.check_parse_equal(field, "2020-01-31T12:30:45.123456", datetime(2020, 1, 31, 12, 30, 45, 123456))
+        self.check_parse_equal(field, "2020-01-31T12:30:45.5", datetime(2020, 1, 31, 12, 30, 45, 500000))
+        self.check_parse_equal(field, "2020-01-31T12:30:45.1234567", datetime(2020, 1, 31, 12, 30, 45, 123456))
+        self.check_parse_equal(field, "2020-01-31T12:30:45Z", datetime(2020, 1, 31, 12, 30, 45, tzinfo=timezone.utc))
+        self.check_parse_equal(field, "2020-01-31T12:30:45.5-02:30",
+                               datetime(2020, 1, 31, 12, 30, 45, 500000, timezone(-timedelta(hours=2, minutes=30))))
+        self.check_parse_equal(field, "2020-01-31T12:30:45+0100",
+                               datetime(2020, 1, 31, 12, 30, 45, tzinfo=timezone(timedelta(hours=1))))
+
+        self.check_parse_error(field, "2020-01-31T25:30:45")
+        self.check_parse_error(field, "2020-01-31T12:30:45.")
+        self.check_parse_error(field, "2020-01-31 12:30:45")
+        self.check_parse_error(field, "2020-01-31")
+        self.check_parse_error(field, "2020-01-31T12:30:45+05:99")
+        self.check_parse_error(field, "2020-01-31T12:30:45+0560")
+        self.check_parse_error(field, "2020-01-31T12:30:45-24:00")
 
     # TODO : write tests for f.List
     def test_List(self):
@@ -94,6 +119,141 @@ class TestFormats(unittest.TestCase):
     def test_Union(self):
         ...
 
+    def check_compile(self, field: f.Format, input_value):
+        try:
+            expected = field.parse(input_value, 'data')
+
+        except f.ParsingError as error:
+            with self.assertRaises(f.ParsingError) as context:
+                field.compile()(input_value, 'data')
+
+            self.assertEqual(str(context.exception), str(error))
+
+        else:
+            self.assertEqual(field.compile()(input_value, 'data'), expected)
+
+    def test_compile(self):
+        field = f.Dict(
+            id=f.Integer(),
+            name=f.String(),
+            score=f.Decimal(default=0.0),
+            tags=f.List(f.String()),
+            point=f.Tuple(f.Integer()),
+            value=f.Union(f.Integer(), f.Boolean()),
+            nested=f.Dict(__strict__=True, flag=f.Boolean(optional=True)),
+        )
+
+        self.assertIs(field.compile(), field.compile())
+
+        for input_value in [
+            {'id': 1, 'name': 'a', 'tags': ['x', 'y'], 'point': (1, 2), 'value': 1},
+            {'id': '12', 'name': 3, 'score': '1.5', 'tags': [1, 2.5], 'value': 'True', 'nested': {'flag': 1}},
+            {'id': 'x', 'name': 'a', 'tags': ['x', None], 'point': (1, '2.5'), 'value': 'xyz'},
+            {'id': 1, 'nested': {'flag': True, 'other': 0}},
+            {'id': 1, 'tags': 'x'},
+            None,
+            [],
+        ]:
+            self.check_compile(field, input_value)
+
+    def test_error_path(self):
+        field = f.Dict(tags=f.List(f.Tuple(f.Integer())))
+        data = {'tags': [(1,), (2, 'x')]}
+
+        for parse in (field.parse, field.compile()):
+            with self.assertRaises(f.ParsingError) as context:
+                parse(data, 'data')
+
+            self.assertIn("data['tags'][1][1]: str = 'x'", str(context.exception))
+
+        self.assertEqual(str(f.ParsingPath(f.ParsingPath('data', 'key'), 0)), "data['key'][0]")
+
+        # only the failing values are parsed again with their paths, once per level
+        field, valid, data = f.Integer(), 1, 'x'
+        for _ in range(20):
+            field, valid, data = f.List(field), [valid], [valid, data]
+
+        with self.assertRaises(f.ParsingError) as context:
+            field.compile()(data, 'data')
+
+        self.assertEqual(str(context.exception.path), "data" + "[1]" * 20)
+
+    def test_fail_fast(self):
+        for field, count in [
+            (f.Dict(a=f.Integer(), b=f.Integer(), c=f.Integer()), 3),
+            (f.Dict(__fail_fast__=True, a=f.Integer(), b=f.Integer(), c=f.Integer()), 1),
+            (f.Dict(__max_errors__=2, a=f.Integer(), b=f.Integer(), c=f.Integer()), 2),
+        ]:
+            for parse in (field.parse, field.compile()):
+                with self.assertRaises(f.ParsingError) as context:
+                    parse({})
+
+                self.assertEqual(context.exception.reason.count(" -> "), count)
+
+        field = f.Union(f.Integer(), f.Decimal(), fail_fast=True)
+        for parse in (field.parse, field.compile()):
+            self.assertEqual(parse('1.5'), field.options[1].parse('1.5'))
+
+            with self.assertRaises(f.ParsingError) as context:
+                parse('x')
+
+            self.assertEqual(context.exception.reason, 'should be composed only of digits.')
+
+    def test_Union_dispatch(self):
+        field = f.Union(f.Dict(x=f.Integer()), f.List(f.Integer()), f.Date(), f.String())
+
+        self.assertEqual(field.candidates(list), (field.options[1],))
+        self.assertEqual(field.candidates(str), (field.options[2], field.options[3]))
+        self.assertEqual(field.candidates(set), ())
+
+        for parse in (field.parse, field.compile()):
+            self.assertEqual(parse({'x': '1'}), {'x': 1})
+            self.assertEqual(parse(['1']), [1])
+            self.assertEqual(parse('2020-01-01'), '2020-01-01')
+            self.assertRaises(f.ParsingError, parse, {1, 2})
+
+        field = f.Union(discriminator='kind', tags={
+            'point': f.Dict(kind=f.String(), x=f.Integer()),
+            'label': f.Dict(kind=f.String(), text=f.String()),
+        })
+
+        for parse in (field.parse, field.compile()):
+            self.assertEqual(parse({'kind': 'point', 'x': '1'}), {'kind': 'point', 'x': 1})
+            self.assertEqual(parse({'kind': 'label', 'text': 2}), {'kind': 'label', 'text': '2'})
+            self.assertRaises(f.ParsingError, parse, {'kind': 'other'})
+            self.assertRaises(f.ParsingError, parse, ['point'])
+
+        compiled = field.compile()
+        for data in [{'kind': 'point', 'x': 1.0}, {'kind': 'label'}, {'kind': 'point', 'x': 'y'}, {}, None]:
+            self.check_compile(field, data)
+
+        self.assertEqual(field.options, tuple(field.tags.values()))
+        self.assertEqual(compiled({'kind': 'point', 'x': '2'}), field.parse({'kind': 'point', 'x': '2'}))
+        self.assertRaises(ValueError, f.Union, f.Integer(), discriminator='kind', tags={'point': f.Integer()})
+
+    def test_parse_many(self):
+        field = f.Dict(id=f.Integer(), score=f.Decimal(), name=f.String(optional=True))
+        records = [{'id': 1, 'score': '0.5'}, {'id': 'x'}, {'id': '3', 'score': 2, 'name': 'c'}]
+
+        self.assertRaises(f.ParsingError, field.parse_many, records)
+
+        errors = []
+        self.assertEqual(field.parse_many(records, errors=errors), [
+            {'id': 1, 'score': 0.5, 'name': None},
+            {'id': 3, 'score': 2.0, 'name': 'c'},
+        ])
+        self.assertEqual([str(error.path) for error in errors], ['[1]'])
+
+        columns = field.parse_many(records, columns=True, errors=[])
+        self.assertEqual(columns['id'].tolist(), [1, 3])
+        self.assertEqual(columns['score'].tolist(), [0.5, 2.0])
+        self.assertEqual(columns['name'], [None, 'c'])
+
+        columns = field.parse_many([{'id': 1, 'score': 0}, {'id': 2 ** 64, 'score': 0}, {'id': 3, 'score': 0}],
+                                   columns=True)
+        self.assertEqual(columns['id'], [1, 2 ** 64, 3])
+        self.assertEqual(columns['score'].tolist(), [0.0, 0.0, 0.0])
+
 
 if __name__ == '__main__':
     unittest.main()
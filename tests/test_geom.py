@@ -229,5 +229,124 @@ class TestVectorBase(unittest.TestCase):
         self.assertEqual(v * b, Vector(3, 8))
 
 
+class TestVectorArray(unittest.TestCase):
+    def test_getitem(self):
+        """Indexing returns plain vectors, slicing returns arrays."""
+        a = VectorArray.from_vectors(VECTOR_LIST)
+        self.assertEqual(len(a), len(VECTOR_LIST))
+        self.assertEqual(a[3], VECTOR_LIST[3])
+        self.assertIs(type(a[3]), Vector)
+        self.assertEqual(list(a[2:5]), VECTOR_LIST[2:5])
+
+    def test_operations(self):
+        """The bulk operations equal the operations on each vector."""
+        a = VectorArray.from_vectors(VECTOR_LIST)
+        b = VectorArray.from_vectors(reversed(VECTOR_LIST))
+        w = Vector(2, -3)
+        pairs = list(zip(VECTOR_LIST, reversed(VECTOR_LIST)))
+        self.assertEqual(list(a + b), [u + v for u, v in pairs])
+        self.assertEqual(list(a - w), [u - w for u in VECTOR_LIST])
+        self.assertEqual(list(w - a), [w - u for u in VECTOR_LIST])
+        self.assertEqual(list(2.5 * a / 3), [2.5 * u / 3 for u in VECTOR_LIST])
+        self.assertEqual(list(a * b), [u * v for u, v in pairs])
+        self.assertEqual(list(a ^ b), [u ^ v for u, v in pairs])
+        self.assertEqual(list(w ^ a), [w ^ u for u in VECTOR_LIST])
+        self.assertEqual(list(abs(a)), [abs(u) for u in VECTOR_LIST])
+        self.assertEqual(list(a.__unit__()), [u.__unit__() for u in VECTOR_LIST])
+        self.assertEqual(list(a.__orth__()), [u.__orth__() for u in VECTOR_LIST])
+
+    def test_errors(self):
+        a = VectorArray([1, 2], [3, 4])
+        self.assertRaises(ValueError, a.__add__, VectorArray([1], [2]))
+        self.assertRaises(TypeError, lambda: a + 'a')
+        self.assertRaises(TypeError, lambda: a / a)
+
+    def test_base(self):
+        """The bulk projections in a base equal the projections of each vector."""
+        b = VectorBase(Vector(1, 3), Vector(2, 5))
+        a = VectorArray.from_vectors(VECTOR_LIST)
+        self.assertEqual(list(b << a), [b << u for u in VECTOR_LIST])
+        self.assertEqual(list(a >> b), [u >> b for u in VECTOR_LIST])
+        self.assertEqual(list(b * a), [b * u for u in VECTOR_LIST])
+
+
+class TestCoordsArray(unittest.TestCase):
+    def test_operations(self):
+        """The bulk operations equal the operations on each coordinates."""
+        a = CoordsArray.from_coords(COORDS_LIST)
+        b = CoordsArray.from_coords(reversed(COORDS_LIST))
+        c = Coords(2, -3)
+        pairs = list(zip(COORDS_LIST, reversed(COORDS_LIST)))
+        self.assertIs(type(a[0]), Coords)
+        self.assertEqual(list(a + b), [u + v for u, v in pairs])
+        self.assertEqual(list(a * b - c), [u * v - c for u, v in pairs])
+        self.assertEqual(list(1 / a), [1 / u for u in COORDS_LIST])
+        self.assertEqual(list(a / c), [u / c for u in COORDS_LIST])
+        self.assertEqual(list(abs(a)), [abs(u) for u in COORDS_LIST])
+
+
+class TestSpatialIndex(unittest.TestCase):
+    @staticmethod
+    def random_shapes(rng: random.Random, size: int):
+        shapes = []
+        for _ in range(size):
+            x, y, kind = rng.uniform(-50, 50), rng.uniform(-50, 50), rng.randrange(3)
+            if kind == 0:
+                shapes.append(Coords(x, y))
+            elif kind == 1:
+                shapes.append(Circle(Coords(x, y), rng.uniform(0.1, 3)))
+            else:
+                shapes.append(AbsoluteBoundingBox(x, y, x + rng.uniform(0.1, 5), y + rng.uniform(0.1, 5)))
+
+        return shapes
+
+    def test_containing(self):
+        """The shapes containing the points are the ones of the naive loop, after moves and removals too."""
+        rng = random.Random(0)
+        shapes = self.random_shapes(rng, 1000)
+        index = SpatialIndex.of_shapes(shapes)
+        for key in range(0, len(shapes), 4):
+            shapes[key] = self.random_shapes(rng, 1)[0]
+            index.move(key, shapes[key])
+
+        removed = set(range(1, len(shapes), 9))
+        for key in removed:
+            index.remove(key)
+
+        points = [Coords(rng.uniform(-55, 55), rng.uniform(-55, 55)) for _ in range(300)]
+        expected = [[key for key, shape in enumerate(shapes)
+                     if key not in removed and (shape == point if type(shape) is Coords else point in shape)]
+                    for point in points]
+        self.assertEqual(index.containing_many(points), expected)
+        self.assertEqual(index.containing_many(CoordsArray.from_coords(points)), expected)
+        self.assertGreater(sum(map(len, expected)), 10)
+
+    def test_intersecting(self):
+        rng = random.Random(1)
+        index = SpatialIndex.of_shapes([Coords(0, 0), Circle(Coords(3, 0), 1), AbsoluteBoundingBox(5, -1, 6, 1)])
+        self.assertEqual(index.intersecting(Circle(Coords(0, 0), 2)), [0, 1])
+        self.assertEqual(index.intersecting(AbsoluteBoundingBox(3.9, -5, 5, 5)), [1, 2])
+        self.assertEqual(index.intersecting(Coords(5.5, 0)), [2])
+        self.assertEqual(index.intersecting(AbsoluteBoundingBox(0.5, 0.5, 1.5, 1.5)), [])
+
+        shapes = self.random_shapes(rng, 1000)
+        index = SpatialIndex.of_shapes(shapes)
+        for x, y in [(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(100)]:
+            box = AbsoluteBoundingBox(x, y, x + 10, y + 5)
+            points = [key for key, shape in enumerate(shapes) if type(shape) is Coords and shape in box]
+            self.assertEqual([key for key in index.intersecting(box) if type(shapes[key]) is Coords], points)
+
+    def test_nearest(self):
+        rng = random.Random(2)
+        points = [Coords(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(1000)]
+        index = SpatialIndex.of_shapes(points)
+        for query in [Coords(rng.uniform(-60, 60), rng.uniform(-60, 60)) for _ in range(100)] + [Coords(500, 0)]:
+            expected = sorted(range(len(points)), key=lambda key: (abs(points[key] - query), key))[:5]
+            self.assertEqual(index.nearest(query, k=5), expected)
+
+        self.assertEqual(index.nearest_many([points[3], points[7]]), [[3], [7]])
+        self.assertEqual(SpatialIndex(1.0).nearest(Coords(0, 0)), [])
+
+
 if __name__ == '__main__':
     unittest.main()
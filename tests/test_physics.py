@@ -1,5 +1,8 @@
+import random
+import sys
 import unittest
 
+from tools37.algebra import Polynom
 from tools37.geom import Vector
 from tools37.physics import *
 
@@ -47,6 +50,227 @@ class TestPhysic(unittest.TestCase):
         ]:
             self.assertEqual(elastic_collision(v1, m1, v2, m2), (r1, r2))
 
+    def test_004(self):
+        rng = random.Random(4)
+        system = System(gravity=Vector(0, -0.05), friction=0.01, max_collision_check=10_000)
+        for row in range(5):
+            for column in range(6):
+                circle = Circle(position=Vector(3 * column + rng.random(), 3 * row + rng.random()), radius=1,
+                                speed=Vector(rng.uniform(-1, 1), rng.uniform(-1, 1)),
+                                mass=float('inf') if row == 0 else rng.choice([1, 2, 3]))
+                circle.friction = rng.choice([0.0, 0.1])
+                system.objects.append(circle)
+                if row:
+                    system.objects_searching_for_collision.append(circle)
+
+        array_system = ArraySystem.from_system(system)
+        collided = []
+        for _ in range(20):
+            system.update(col_callback=collided.append)
+            array_system.update()
+
+        self.assertTrue(collided)
+        for index, circle in enumerate(system.objects):
+            self.assertEqual(array_system.circle(index).position, circle.position)
+            self.assertEqual(array_system.circle(index).speed, circle.speed)
+
+    def test_005(self):
+        rng = random.Random(5)
+        boxes = [SweptBoundingBox.of_disk(rng.uniform(0, 50), rng.uniform(0, 50), rng.uniform(-3, 3), 0,
+                                          rng.uniform(0.5, 2), 1) for _ in range(200)]
+        broad_phase = SweepAndPrune()
+        for _ in range(2):
+            neighbours = broad_phase.neighbours_of_boxes(boxes)
+            for index, box in enumerate(boxes):
+                self.assertEqual(neighbours[index], [other for other, candidate in enumerate(boxes)
+                                                     if other != index and box.intersects(candidate)])
+
+            for box in boxes:
+                box.x += rng.uniform(-1, 1)
+
+    def test_006(self):
+        systems = []
+        for broad_phase in [None, SweepAndPrune()]:
+            rng = random.Random(6)
+            system = System(gravity=Vector(0, -0.1), friction=0.0, max_collision_check=10_000)
+            system.broad_phase = broad_phase
+            system.objects.append(Line(origin=Vector(-2, -2), target=Vector(20, -2), speed=Vector(0, 0),
+                                       mass=float('inf')))
+            for index in range(16):
+                circle = Circle(position=Vector(5 * (index % 4) + rng.random(), 5 * (index // 4) + rng.random()),
+                                radius=1, speed=Vector(rng.uniform(-1, 1), rng.uniform(-1, 1)), mass=1)
+                system.objects.append(circle)
+                system.objects_searching_for_collision.append(circle)
+
+            for _ in range(10):
+                system.update()
+
+            systems.append(system)
+
+        for o1, o2 in zip(*(system.objects for system in systems)):
+            self.assertEqual(o1.position, o2.position)
+            self.assertEqual(o1.speed, o2.speed)
+
+    def test_007(self):
+        queue = ImpactQueue(3)
+        queue.push(2.0, 0, 1)
+        queue.push(1.0, 1, 2)
+        queue.push(3.0, 0, 2)
+        queue.invalidate(2)
+        self.assertEqual(queue.pop(), (2.0, 0, 1))
+        self.assertEqual(queue.pop(until=2.5), None)
+        queue.push(3.0, 0, 2)
+        self.assertEqual(queue.pop(), (3.0, 0, 2))
+
+        queue.push(4.0, 2, 1)
+        queue.push(4.0, 0, 2)
+        self.assertEqual([queue.pop(), queue.pop()], [(4.0, 0, 2), (4.0, 1, 2)])
+
+    def test_008(self):
+        rng = random.Random(8)
+        system = System(gravity=Vector(0, -0.05), friction=0.01)
+        for index in range(36):
+            circle = Circle(position=Vector(3 * (index % 6) + rng.random(), 3 * (index // 6) + rng.random()),
+                            radius=1, speed=Vector(rng.uniform(-1, 1), rng.uniform(-1, 1)), mass=rng.choice([1, 2]))
+            system.objects.append(circle)
+            system.objects_searching_for_collision.append(circle)
+
+        array_system, scheduled_system = ArraySystem.from_system(system), ScheduledSystem.from_system(system)
+        collisions, scheduled_collisions = [], []
+        for _ in range(5):
+            array_system.update(col_callback=collisions.append)
+            scheduled_system.update(col_callback=scheduled_collisions.append)
+
+        self.assertTrue(collisions)
+        self.assertEqual(sorted(scheduled_collisions), sorted(collisions))
+        for name in ['px', 'py', 'sx', 'sy']:
+            for expected, value in zip(getattr(array_system, name), getattr(scheduled_system, name)):
+                self.assertAlmostEqual(expected, value, places=9)
+
+        # simultaneous impacts : the middle circle is hit from both sides at t = 1
+        system = System(gravity=Vector(0, 0), friction=0)
+        for x, speed in [(-3, 1), (0, 0), (3, -1)]:
+            circle = Circle(position=Vector(x, 0), radius=1, speed=Vector(speed, 0), mass=1)
+            system.objects.append(circle)
+            system.objects_searching_for_collision.append(circle)
+
+        array_system, scheduled_system = ArraySystem.from_system(system), ScheduledSystem.from_system(system)
+        array_system.update()
+        scheduled_system.update()
+        self.assertEqual(list(scheduled_system.px), [-2, 0, 2])
+        self.assertEqual(list(scheduled_system.sx), [-1, 0, 1])
+        self.assertEqual(list(array_system.sx), [0, -1, 1])
+
+    @unittest.skipIf(sys.version_info < (3, 8), "requires multiprocessing.shared_memory")
+    def test_009(self):
+        rng = random.Random(9)
+        circles = []
+        for index in range(64):
+            circle = Circle(position=Vector(3 * (index % 8) + rng.random(), 3 * (index // 8) + rng.random()),
+                            radius=1, speed=Vector(rng.uniform(-1, 1), rng.uniform(-1, 1)), mass=rng.choice([1, 2]))
+            circles.append(circle)
+
+        scheduled_system = ScheduledSystem(gravity=Vector(0, -0.05), friction=0.01)
+        for circle in circles:
+            scheduled_system.add(circle)
+
+        for _ in range(3):
+            scheduled_system.update()
+
+        for workers in [1, 3]:
+            with ParallelSystem(gravity=Vector(0, -0.05), friction=0.01, workers=workers) as parallel_system:
+                for circle in circles:
+                    parallel_system.add(circle)
+
+                for _ in range(3):
+                    parallel_system.update()
+
+            for name in ['px', 'py', 'sx', 'sy']:
+                self.assertEqual(getattr(parallel_system, name), getattr(scheduled_system, name))
+
+        # simultaneous impacts in every tile : aligned circles hit in the middle from both sides
+        circles = []
+        for row in range(8):
+            for x, speed, mass in [(3, -1, 3), (0, 0, 2), (-3, 1, 1)]:
+                circles.append(Circle(position=Vector(x + 10 * (row % 2), 4 * row), radius=1,
+                                      speed=Vector(speed, 0), mass=mass))
+
+        scheduled_system = ScheduledSystem(gravity=Vector(0, 0), friction=0)
+        for circle in circles:
+            scheduled_system.add(circle)
+
+        scheduled_system.update()
+        for workers in [1, 3]:
+            with ParallelSystem(gravity=Vector(0, 0), friction=0, workers=workers) as parallel_system:
+                for circle in circles:
+                    parallel_system.add(circle)
+
+                parallel_system.update()
+
+            for name in ['px', 'py', 'sx', 'sy']:
+                self.assertEqual(getattr(parallel_system, name), getattr(scheduled_system, name))
+
+    def test_010(self):
+        """The impact kernels give the same impacts as solving the `Polynom` of the relative position."""
+        def polynom_circle_circle(circle1, circle2):
+            rt = Polynom(circle1.position, circle1.speed) - Polynom(circle2.position, circle2.speed)
+            err = rt ** 2 - (circle1.radius + circle2.radius) ** 2
+            return [(t, rt(t)) for t in err.solve()] if err(0) >= 0 else []
+
+        def polynom_circle_line(circle, line):
+            rt = Polynom(circle.position, circle.speed) - Polynom(line.origin, line.speed)
+            ex = line.delta.__unit__()
+            ey = ex.__orth__()
+            err = (rt * ey) ** 2 - circle.radius ** 2
+            return [(t, (rt(t) * ey) * ey) for t in err.solve() if 0 <= rt(t) * ex <= 2 * abs(line.delta)]
+
+        rng = random.Random(0)
+        impacts = 0
+        for _ in range(500):
+            c1, c2 = (Circle(position=Vector(rng.uniform(-5, 5), rng.uniform(-5, 5)), radius=rng.choice([0.5, 1, 2]),
+                             speed=Vector(rng.uniform(-2, 2), rng.uniform(-2, 2)), mass=1) for _ in range(2))
+            line = Line(origin=Vector(rng.randint(-5, 5), rng.randint(-5, 5)), target=Vector(rng.random(), 6),
+                        speed=Vector(rng.uniform(-1, 1), 0), mass=float('inf'))
+            self.assertEqual(list(circle_circle_collision(c1, c2)), polynom_circle_circle(c1, c2))
+            self.assertEqual(list(circle_line_collision(c1, line)), polynom_circle_line(c1, line))
+            impacts += len(polynom_circle_circle(c1, c2)) + len(polynom_circle_line(c1, line))
+
+            dp, dv = c1.position - c2.position, c1.speed - c2.speed
+            self.assertEqual(circle_circle_impacts_many([dp.x], [dp.y], [dv.x], [dv.y], [c1.radius + c2.radius]),
+                             [circle_circle_impacts(dp.x, dp.y, dv.x, dv.y, c1.radius + c2.radius)])
+
+        self.assertGreater(impacts, 100)
+
+    def test_011(self):
+        """The path of a fast object is not spread over the cells of the grid, the results are unchanged."""
+        rng = random.Random(11)
+        system = System(gravity=Vector(0, 0), friction=0)
+        for index in range(40):
+            circle = Circle(position=Vector(4 * (index % 20), 4 * (index // 20) + rng.random()), radius=1,
+                            speed=Vector(rng.uniform(-1, 1), rng.uniform(-1, 1)), mass=1)
+            system.objects.append(circle)
+            system.objects_searching_for_collision.append(circle)
+
+        fast = Circle(position=Vector(-10, 0), radius=1, speed=Vector(3000, 0.5), mass=1)
+        system.objects.append(fast)
+        system.objects_searching_for_collision.append(fast)
+
+        array_system, scheduled_system = ArraySystem.from_system(system), ScheduledSystem.from_system(system)
+        grid, _ = scheduled_system.prepare(1.0)
+        self.assertEqual(grid.oversized, {40})
+        self.assertEqual(grid.keys[40], [])
+        self.assertEqual(grid.query(40), {index for index in range(40) if 40 in grid.query(index)})
+
+        collisions, scheduled_collisions = [], []
+        array_system.update(col_callback=collisions.append)
+        scheduled_system.update(col_callback=scheduled_collisions.append)
+
+        self.assertTrue(collisions)
+        self.assertEqual(sorted(scheduled_collisions), sorted(collisions))
+        for name in ['px', 'py', 'sx', 'sy']:
+            for expected, value in zip(getattr(array_system, name), getattr(scheduled_system, name)):
+                self.assertAlmostEqual(expected, value, places=9)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from tools37.Typed import Typed, TypedArg, typedmethod
+
+
+class Number(Typed):
+    @typedmethod(TypedArg.CLASS)
+    def describe(self, other):
+        return 'class'
+
+    @typedmethod(bool)
+    def describe(self, other):
+        return 'bool'
+
+    @typedmethod(int)
+    def describe(self, other):
+        return 'int'
+
+
+class SubNumber(Number):
+    pass
+
+
+class TestTyped(unittest.TestCase):
+    def test_priority(self):
+        """The first registered method matching the args is called."""
+        number = Number()
+        self.assertEqual(number.describe(Number()), 'class')
+        self.assertEqual(number.describe(True), 'bool')
+        self.assertEqual(number.describe(1), 'int')
+        self.assertEqual(number.describe(True), 'bool')
+
+    def test_no_match(self):
+        """A TypeError is raised when no method matches the args, subclasses do not match TypedArg.CLASS."""
+        number = Number()
+        for _ in range(2):
+            self.assertRaises(TypeError, number.describe, 'a')
+            self.assertRaises(TypeError, number.describe, SubNumber())
+
+    def test_cache(self):
+        """The method is resolved once per tuple of argument types."""
+        number = Number()
+        Number.describe.cache.clear()
+        number.describe(1)
+        number.describe(2)
+        self.assertEqual(set(Number.describe.cache), {(int,)})
+        self.assertRaises(TypeError, number.describe, 1.5)
+        self.assertEqual(set(Number.describe.cache), {(int,), (float,)})
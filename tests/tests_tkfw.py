@@ -1,5 +1,9 @@
+import gc
 import unittest
 
+from tools37.tkfw.core import Component
+from tools37.tkfw.dynamic import DynamicData
+from tools37.tkfw.dynamic.base import DynamicDictItem
 from tools37.tkfw.evaluable import EvaluableDictItem, EvaluableListItem, EvaluablePath
 
 
@@ -146,3 +150,28 @@ class TestEvaluablePath(unittest.TestCase):
 
     if __name__ == '__main__':
         unittest.main()
+
+
+class TestComponent(unittest.TestCase):
+    def test_binder_events(self):
+        class Node(Component):
+            def __init_subclass__(cls, **kwargs):
+                cls._init_component_class(kwargs)
+
+            def _update_local(self, *_, **__):
+                calls.append(self.binder.view())
+
+        class Bound(Node, BIND='key'):
+            pass
+
+        calls = []
+        component = Bound.__new__(Bound)
+        component.data = DynamicData({'key': 'value'}, None)
+        component.binder = DynamicDictItem(data=component.data, key='key')
+        component.style = {}
+        component._setup_events()
+
+        # the binding should outlive the collection of the temporary objects
+        gc.collect()
+        component.data['key'] = 'modified'
+        self.assertEqual(["modified"], calls)
@@ -26,13 +26,34 @@ class Typed:
 
     @classmethod
     def __create(cls, name, data):
-        def method(self, *args):
+        """
+            Create the method `name` dispatching on the types of its args, in the order of registration.
+            The chosen method only depends on the concrete types of the args, so it is resolved once per
+            tuple of types and cached in `method.cache` (to clear if a class is registered to an ABC afterwards).
+        """
+        cache = {}
+
+        def resolve(args):
             for args_type, method in data:
                 if all(map(cls.__check_arg, args, args_type)):
-                    return method(self, *args)
+                    return method
+
+            return None
+
+        def method(self, *args):
+            key = tuple(map(type, args))
+            try:
+                resolved = cache[key]
+            except KeyError:
+                resolved = cache[key] = resolve(args)
+
+            if resolved is None:
+                raise TypeError(args)
 
-            raise TypeError(args)
+            return resolved(self, *args)
 
+        method.registry = data
+        method.cache = cache
         setattr(cls, name, method)
 
     @staticmethod
@@ -1,12 +1,137 @@
-from functools import reduce
 from itertools import repeat, zip_longest, starmap
+from math import acos, copysign, cos, pi
 from operator import add, sub, mul, truediv
-from typing import List, Iterator, TypeVar, Generic
+from typing import Iterable, List, Iterator, Sequence, TypeVar, Generic
 
 from tools37.Typed import Typed, TypedArg, typedmethod
 
 C = TypeVar('C')
 
+# products of polynoms with at least this number of factors each use the Karatsuba multiplication
+KARATSUBA_THRESHOLD = 64
+
+
+def _schoolbook(a: Sequence, b: Sequence) -> list:
+    factors = [0 for p in range(len(a) + len(b))]
+    for p1, c1 in enumerate(a):
+        for p2, c2 in enumerate(b):
+            factors[p1 + p2] += c1 * c2
+
+    return factors
+
+
+def _karatsuba(a: Sequence, b: Sequence) -> list:
+    """Return the factors of the product of the polynoms of factors `a` and `b`, padded with zeros."""
+    if len(a) < KARATSUBA_THRESHOLD or len(b) < KARATSUBA_THRESHOLD:
+        return _schoolbook(a, b)
+
+    m = min(len(a), len(b)) // 2
+    a0, a1, b0, b1 = a[:m], a[m:], b[:m], b[m:]
+    z0 = _karatsuba(a0, b0)
+    z2 = _karatsuba(a1, b1)
+    z1 = _karatsuba(list(starmap(add, zip_longest(a0, a1, fillvalue=0))),
+                    list(starmap(add, zip_longest(b0, b1, fillvalue=0))))
+
+    factors = [0 for p in range(len(a) + len(b))]
+    for p, c in enumerate(z0):
+        factors[p] += c
+        z1[p] -= c
+
+    for p, c in enumerate(z2):
+        factors[p + 2 * m] += c
+        z1[p] -= c
+
+    for p, c in enumerate(z1):
+        factors[p + m] += c
+
+    return factors
+
+
+def _cbrt(x: float) -> float:
+    return copysign(abs(x) ** (1 / 3), x)
+
+
+def solve_quadratic(c0, c1, c2) -> List[float]:
+    """Return the sorted real roots of c0 + c1.x + c2.x^2, with c2 != 0."""
+    delta = c1 ** 2 - 4 * c0 * c2
+    if delta < 0:
+        return []
+
+    alpha = - c1 / (2 * c2)
+
+    if delta == 0:
+        return [alpha]
+
+    beta = delta ** 0.5 / abs(2 * c2)
+
+    return [alpha - beta, alpha + beta]
+
+
+def solve_cubic(c0, c1, c2, c3) -> List[float]:
+    """Return the sorted real roots of c0 + c1.x + c2.x^2 + c3.x^3, with c3 != 0 (Cardano and Viete)."""
+    a, b, c = c2 / c3, c1 / c3, c0 / c3
+    shift = a / 3
+    p = b - a * shift
+    q = (2 * shift ** 2 - b) * shift + c
+
+    if p == 0:
+        return [_cbrt(-q) - shift]
+
+    delta = (q / 2) ** 2 + (p / 3) ** 3
+    if delta > 0:
+        sqrt_delta = delta ** 0.5
+        return [_cbrt(-q / 2 + sqrt_delta) + _cbrt(-q / 2 - sqrt_delta) - shift]
+
+    if delta == 0:
+        return sorted({3 * q / p - shift, -3 * q / (2 * p) - shift})
+
+    m = 2 * (-p / 3) ** 0.5
+    theta = acos(max(-1.0, min(1.0, 3 * q / (p * m)))) / 3
+    return sorted(m * cos(theta - 2 * pi * k / 3) - shift for k in range(3))
+
+
+def solve_quartic(c0, c1, c2, c3, c4) -> List[float]:
+    """Return the sorted real roots of c0 + c1.x + ... + c4.x^4, with c4 != 0 (Ferrari)."""
+    a, b, c, d = c3 / c4, c2 / c4, c1 / c4, c0 / c4
+    shift = a / 4
+    p = b - 6 * shift ** 2
+    q = c - 2 * b * shift + 8 * shift ** 3
+    r = d - c * shift + b * shift ** 2 - 3 * shift ** 4
+
+    # y^4 + p.y^2 + q.y + r = (y^2 + p/2 + m)^2 - (s.y - q/2s)^2 with s = sqrt(2m), m being a root of the resolvent
+    m = max(solve_cubic(-q ** 2, 2 * p ** 2 - 8 * r, 8 * p, 8)) if q != 0 else 0.0
+    if m <= 0:
+        roots = set()
+        for z in solve_quadratic(r, p, 1):
+            if z >= 0:
+                roots.update([-z ** 0.5, z ** 0.5])
+
+        return sorted(root - shift for root in roots)
+
+    s = (2 * m) ** 0.5
+    roots = solve_quadratic(p / 2 + m + q / (2 * s), -s, 1) + solve_quadratic(p / 2 + m - q / (2 * s), s, 1)
+    return sorted(root - shift for root in roots)
+
+
+def solve_many(*columns: Sequence[float]) -> List[List[float]]:
+    """
+        Return the real roots of a batch of polynoms given by the columns of their factors (c0s, c1s, ...),
+        without building a Polynom for each of them. The polynoms may have trailing zero factors.
+    """
+    solvers = [lambda c0: [], lambda c0, c1: [-c0 / c1], solve_quadratic, solve_cubic, solve_quartic]
+    if len(columns) > len(solvers):
+        raise ValueError(f"cannot solve polynoms of degree > {len(solvers) - 1} : {len(columns) - 1}")
+
+    results = []
+    for factors in zip(*columns):
+        size = len(factors)
+        while size > 1 and factors[size - 1] == 0:
+            size -= 1
+
+        results.append(solvers[size - 1](*factors[:size]))
+
+    return results
+
 
 class Polynom(Generic[C], Typed):
     def __init__(self, *factors: C):
@@ -34,7 +159,26 @@ class Polynom(Generic[C], Typed):
         self.factors[index] = value
 
     def __call__(self, x):
-        return sum(c * x ** p for p, c in enumerate(self.factors))
+        """Evaluate the polynom at `x` with the Horner scheme."""
+        factors = self.factors
+        result = factors[-1]
+        for index in range(len(factors) - 2, -1, -1):
+            result = result * x + factors[index]
+
+        return result
+
+    def evaluate_many(self, xs: Iterable) -> list:
+        """Return the values of the polynom at each of `xs`."""
+        factors = self.factors
+        xs = list(xs)
+        if len(factors) == 1:
+            return [factors[0] for _ in xs]
+
+        values = [factors[-1] * x + factors[-2] for x in xs]
+        for factor in reversed(factors[:-2]):
+            values = [value * x + factor for value, x in zip(values, xs)]
+
+        return values
 
     @typedmethod(TypedArg.CLASS)
     def __add__(self, other):
@@ -46,12 +190,7 @@ class Polynom(Generic[C], Typed):
 
     @typedmethod(TypedArg.CLASS)
     def __mul__(self, other):
-        factors = [0 for p in range(len(self) + len(other))]
-        for p1, c1 in enumerate(self):
-            for p2, c2 in enumerate(other):
-                factors[p1 + p2] += c1 * c2
-
-        return Polynom(*factors)
+        return Polynom(*_karatsuba(self.factors, other.factors))
 
     @typedmethod(object)
     def __add__(self, other):
@@ -94,7 +233,16 @@ class Polynom(Generic[C], Typed):
         if other < 0:
             return NotImplemented
 
-        return reduce(mul, repeat(self, other))
+        result, square = None, self
+        while other:
+            if other & 1:
+                result = square if result is None else result * square
+
+            other >>= 1
+            if other:
+                square = square * square
+
+        return Polynom(1) if result is None else result
 
     @typedmethod(object)
     def __pow__(self, other):
@@ -110,25 +258,25 @@ class Polynom(Generic[C], Typed):
         return [-self[0] / self[1]]
 
     def _solve_3(self):
-        delta = self[1] ** 2 - 4 * self[0] * self[2]
-        if delta < 0:
-            return []
-
-        alpha = - self[1] / (2 * self[2])
-
-        if delta == 0:
-            return [alpha]
+        return solve_quadratic(*self.factors)
 
-        beta = delta ** 0.5 / abs(2 * self[2])
+    def _solve_4(self):
+        return solve_cubic(*self.factors)
 
-        return [alpha - beta, alpha + beta]
+    def _solve_5(self):
+        return solve_quartic(*self.factors)
 
     def solve(self):
+        """Return the sorted real roots of the polynom, up to the degree 4."""
         if len(self) == 1:
             return self._solve_1()
         elif len(self) == 2:
             return self._solve_2()
         elif len(self) == 3:
             return self._solve_3()
+        elif len(self) == 4:
+            return self._solve_4()
+        elif len(self) == 5:
+            return self._solve_5()
         else:
-            raise ValueError(f"cannot solve polynoms of degree > 2 : {len(self) - 1}")
+            raise ValueError(f"cannot solve polynoms of degree > 4 : {len(self) - 1}")
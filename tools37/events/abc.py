@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, ClassVar, Type, Optional
+from typing import Callable, ClassVar, Type, Optional, Hashable, Tuple, List
 
 __all__ = [
     'Event',
@@ -13,6 +13,8 @@ __all__ = [
 
 
 class Event(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def emit(self) -> None:
         """Emit the event to it's manager."""
@@ -21,11 +23,20 @@ class Event(ABC):
     def with_emitter(self, emitter) -> 'Event':
         """Return a copy of the event with a new emitter."""
 
+    def retarget(self, prefix: str, emitter, remove: bool = False) -> 'Event':
+        """
+            Return a copy of the event with a new emitter, with `prefix` added to its name (or removed if `remove`).
+            The transmitters re-emit the events through it, the events not implementing it cannot be transmitted.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} cannot be retargeted")
+
 
 EVENT_FUNCTION = Callable[[Event], None]
 
 
 class EventModel(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __hash__(self):
         """return hash(self)"""
@@ -42,6 +53,29 @@ class EventModel(ABC):
     def forget(self) -> None:
         """The functions (registered using self.triggers) will no longer be called when events are matching `self`."""
 
+    def functions(self, create: bool = False) -> Optional[List[EVENT_FUNCTION]]:
+        """
+            Return the list of the functions triggered by `self` (created if missing and `create`) or None.
+            By default, the list is kept by the model in its `_functions` attribute.
+        """
+        functions = getattr(self, '_functions', None)
+        if functions is None and create:
+            functions = self._functions = []
+
+        return functions
+
+    def release_functions(self) -> None:
+        """Remove the list of the functions triggered by `self`."""
+        self._functions = None
+
+    def index_key(self) -> Optional[Hashable]:
+        """Return a key used by managers to look up the model, None if the model should be checked for any event."""
+        return None
+
+    def pattern_key(self) -> Optional[Tuple[Hashable, object]]:
+        """Return the key and the pattern under which managers store the model, None if its name is not a pattern."""
+        return None
+
 
 class EventManager(ABC):
     @abstractmethod
@@ -60,6 +94,10 @@ class EventManager(ABC):
     def unregister_function(self, model: EventModel, function: EVENT_FUNCTION) -> None:
         """Remove a specific registered `function` of `model` functions."""
 
+    def release_model(self, model: EventModel) -> None:
+        """Remove all the registered `model` functions, after its observer or emitter was garbage collected."""
+        self.unregister_model(model)
+
 
 class Emitter(ABC):
     _event_factory: ClassVar[Type[Event]]
@@ -97,3 +135,12 @@ class Transmitter(Observer, Emitter, ABC):
     @abstractmethod
     def transmit_without_prefix(self, emitter: Optional[Emitter], prefix: str = '') -> None:
         """"""
+
+    def forget_without_prefix(self, emitter: Optional[Emitter], prefix: str = '') -> None:
+        """
+            Stop the transmission made by `transmit_without_prefix` with the same `emitter` and `prefix`
+            (it is registered as the pattern of the names starting with `prefix`, which cannot be a pattern itself).
+            Only the transmitters knowing the name they registered implement it, the others use `forget` with it.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} cannot forget a transmission by its prefix, "
+                                  f"use `forget` with the name registered by `transmit_without_prefix`")
@@ -1,19 +1,33 @@
+import asyncio
+import inspect
 import re
+import threading
+import weakref
 from abc import ABC
 from collections import deque
-from dataclasses import dataclass, field, replace
-from typing import Optional, Dict, List, ClassVar, Tuple, Deque, Type, Union
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait as wait_futures
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import count, chain
+from operator import itemgetter
+from typing import Optional, Dict, List, ClassVar, Tuple, Deque, Type, Union, Hashable, Iterator, Set, Callable
 
 from . import abc
+from .instrumentation import Instrumentation
+from .patterns import Glob, is_pattern, pattern_regex, PatternTrie
 
 __all__ = [
     'BaseEventManager',
     'DirectEventManager',
     'QueueEventManager',
+    'AsyncEventManager',
+    'ExecutorEventManager',
     'Event',
+    'EventPool',
     'EventModel',
     'Emitter',
     'Observer',
+    'Transmission',
     'Transmitter'
 ]
 
@@ -25,55 +39,602 @@ DEBUG = False
 
 @dataclass
 class BaseEventManager(abc.EventManager, ABC):
-    functions: Dict[abc.EventModel, List[abc.EVENT_FUNCTION]] = field(default_factory=dict)
+    # registered models, their functions are stored by the models (see `EventModel.functions`)
+    models: Set[abc.EventModel] = field(default_factory=set)
+    # registered models (with their registration order) by key (see `EventModel.index_key`)
+    index: Dict[Hashable, Dict[abc.EventModel, int]] = field(default_factory=dict)
+    # registered models whose name is a pattern (see `EventModel.pattern_key`)
+    patterns: Dict[Hashable, PatternTrie] = field(default_factory=dict)
+    # registered models which cannot be indexed, they are checked for every event
+    unindexed: Dict[abc.EventModel, int] = field(default_factory=dict)
+    # models whose observer or emitter was garbage collected, they are unregistered before the next dispatch
+    released: Deque[abc.EventModel] = field(default_factory=deque, repr=False)
+    # records the dispatches when set (see `events.instrumentation`)
+    instrumentation: Optional[Instrumentation] = field(default=None, repr=False)
+    _counter: Iterator[int] = field(default_factory=count, repr=False)
 
     def register_function(self, model, function):
-        self.functions.setdefault(model, [])
-        functions = self.functions[model]
+        self._unregister_released()
+
+        if model not in self.models:
+            self.models.add(model)
+            self._index_model(model)
+
+        functions = model.functions(create=True)
         if function not in functions:
             functions.append(function)
 
     def unregister_function(self, model, function):
-        if model in self.functions:
-            if function in self.functions[model]:
-                self.functions[model].remove(function)
+        if model in self.models:
+            functions = model.functions()
+            if functions and function in functions:
+                # the stored function, a bound method is a new object at each access
+                function = functions.pop(functions.index(function))
+
+                if self.instrumentation is not None:
+                    self.instrumentation.forget(model, function)
 
     def unregister_model(self, model):
-        if model in self.functions:
-            del self.functions[model]
+        if model in self.models:
+            self.models.remove(model)
+            self._unindex_model(model)
+            model.release_functions()
+
+            if self.instrumentation is not None:
+                self.instrumentation.forget(model)
+
+    def release_model(self, model: abc.EventModel) -> None:
+        """Unregister the `model` before the next dispatch, it can be called from a garbage collection."""
+        self.released.append(model)
+
+    def _unregister_released(self) -> None:
+        released = self.released
+        while released:
+            try:
+                model = released.popleft()
+
+            except IndexError:  # emptied by another thread
+                return
+
+            self.unregister_model(model)
+
+    def _index_model(self, model: abc.EventModel) -> None:
+        order = next(self._counter)
+
+        pattern_key = model.pattern_key()
+        if pattern_key is not None:
+            key, pattern = pattern_key
+            trie = self.patterns.get(key)
+            if trie is None:
+                trie = self.patterns[key] = PatternTrie()
+
+            trie.add(pattern, model, order)
+            return
+
+        key = model.index_key()
+        if key is None:
+            self.unindexed[model] = order
+
+        else:
+            self.index.setdefault(key, {})[model] = order
+
+    def _unindex_model(self, model: abc.EventModel) -> None:
+        pattern_key = model.pattern_key()
+        if pattern_key is not None:
+            key, pattern = pattern_key
+            trie = self.patterns[key]
+            trie.remove(pattern, model)
+            if not trie:
+                del self.patterns[key]
+
+            return
+
+        key = model.index_key()
+        if key is None:
+            del self.unindexed[model]
+
+        else:
+            bucket = self.index[key]
+            del bucket[model]
+            if not bucket:
+                del self.index[key]
+
+    def _matching(self, event: abc.Event) -> List[abc.EventModel]:
+        """Return the models matching the `event`, in their registration order."""
+        emitter_id = id(event.emitter)
+        trie = self.patterns.get(emitter_id)
+        matched = trie.match(event.name) if trie is not None else None
+        buckets = [
+            bucket
+            for bucket in (
+                self.index.get((emitter_id, event.name)),
+                matched,
+                {model: order for model, order in self.unindexed.items() if model.match(event)},
+            )
+            if bucket
+        ]
+
+        if not buckets:
+            return []
+
+        if len(buckets) == 1 and not matched:
+            # the buckets are filled in registration order, unlike the models found in the trie
+            return list(buckets[0])
+
+        return [model for model, _ in sorted(chain.from_iterable(bucket.items() for bucket in buckets),
+                                             key=itemgetter(1))]
+
+    def _dispatch(self, event: abc.Event) -> None:
+        """Call the functions of the models matching the `event`."""
+        if self.released:
+            self._unregister_released()
+
+        instrumentation = self.instrumentation
+        for model in self._matching(event):
+            callbacks = model.functions()
+            if callbacks:
+                if instrumentation is not None:
+                    instrumentation.dispatch(model, callbacks, event)
+                    continue
+
+                for callback in callbacks:
+                    callback(event)
 
 
 @dataclass
 class DirectEventManager(BaseEventManager):
-    """This kind of event managers apply events as soon as they are registered."""
+    """
+        This kind of event managers apply events as soon as they are registered.
+
+        Rather than re-emitting an event at each transmitter it goes through (see `Transmission`),
+        the manager follows the transmissions once to list the callbacks reached by the events of an emitter
+        with a given name (a route), the events are then only created for the transmitters having observers.
+        The routes are cached until a function is registered or unregistered.
+        A route reaching a transmitter twice with the same name is a cycle and stops there, a route longer than
+        `max_route_depth` (transmitters growing the names in a cycle) is replaced by re-emitting at each transmitter.
+    """
+
+    # callbacks reached by (emitter id, name), see `._build_route`, None to re-emit at each transmitter
+    routes: Dict[Tuple[int, str], Optional[List['RouteStep']]] = field(default_factory=dict, repr=False)
+    # the routes are dropped when there are more, many names can be emitted (like indexes)
+    max_routes: int = 4096
+    max_route_depth: int = 64
+
+    def register_function(self, model, function):
+        super().register_function(model, function)
+        self.routes.clear()
+
+    def unregister_function(self, model, function):
+        super().unregister_function(model, function)
+        self.routes.clear()
+
+    def unregister_model(self, model):
+        super().unregister_model(model)
+        self.routes.clear()
 
     def register_event(self, event):
         if DEBUG:
-            console.success("\n".join(f"{key!s} -> {value!r}" for key, value in event.__dict__.items()))
+            console.success("\n".join(f"{key!s} -> {getattr(event, key)!r}" for key in Event.__slots__))
 
-        for model, callbacks in self.functions.copy().items():
-            if model.match(event):
-                for callback in callbacks:
-                    callback(event)
+        if self.unindexed or self.instrumentation is not None or not isinstance(event, Event):
+            # the unindexed models can match on anything, the instrumentation records each transmission
+            self._dispatch(event)
+
+        else:
+            self._dispatch_route(event)
+
+    def _build_route(self, emitter: object, name: str, source: Optional[abc.EventModel],
+                     path: Set[Tuple[int, str]], route: List['RouteStep']) -> List['RouteStep']:
+        """
+            Append to `route` the callbacks reached by an event emitted by `emitter` with `name`,
+            `path` holds the (transmitter id, name) of the events transmitted on the way.
+        """
+        if len(path) > self.max_route_depth:
+            raise RouteTooDeep(len(path))
+
+        for model in self._matching(RouteProbe(emitter, name)):
+            callbacks = model.functions()
+            if not callbacks:
+                continue
+
+            for position, callback in enumerate(callbacks):
+                if callback.__class__ is not Transmission:
+                    route.append((model, position, source, name))
+                    continue
+
+                transmitted = callback.transmitted_name(name)
+                transmitter = callback.transmitter
+                step = id(transmitter), transmitted
+                if transmitted is None or step in path:
+                    # filtered out, or a cycle of transmissions
+                    continue
+
+                path.add(step)
+                self._build_route(transmitter, transmitted, model, path, route)
+                path.remove(step)
+
+        return route
+
+    def _dispatch_route(self, event: 'Event') -> None:
+        if self.released:
+            self._unregister_released()
+
+        key = id(event.emitter), event.name
+        if key in self.routes:
+            route = self.routes[key]
+
+        else:
+            if len(self.routes) >= self.max_routes:
+                self.routes.clear()
+
+            try:
+                route = self._build_route(event.emitter, event.name, None, {key}, [])
+            except RouteTooDeep:
+                route = None
+
+            self.routes[key] = route
+
+        if route is None:
+            self._dispatch(event)
+            return
+
+        # the events created for the transmitters, by (transmission model, name)
+        transmitted = {}
+        for model, position, source, name in route:
+            callbacks = model.functions()
+            if not callbacks or position >= len(callbacks):
+                continue
+
+            if source is None:
+                target = event
+
+            else:
+                target = transmitted.get((source, name))
+                if target is None:
+                    emitter = source.observer
+                    if emitter is None:
+                        continue
+
+                    target = transmitted[source, name] = event.renamed(emitter, name)
+
+            callbacks[position](target)
+
+        pool = event._pool
+        if pool is not None:
+            while transmitted:
+                _, target = transmitted.popitem()
+                pool.recycle(target)
 
 
 @dataclass
 class QueueEventManager(BaseEventManager):
-    """This kind of event managers apply events only when the .update method is called."""
+    """
+        This kind of event managers apply events only when the .update method is called.
+        If `coalesce`, only the newest of the events in queue with the same emitter and name is applied.
+    """
 
     queue: Deque[abc.Event] = field(default_factory=deque)
+    coalesce: bool = False
+    # the newest coalesced event by (emitter id, name)
+    _latest: Dict[Tuple[int, str], abc.Event] = field(default_factory=dict, repr=False)
+    # the events registered in batch by (emitter id, name), None when not batching
+    _batch: Optional[Dict[Tuple[int, str], List[abc.Event]]] = field(default=None, repr=False)
+    _batch_depth: int = field(default=0, repr=False)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+            Group the events registered within the context by emitter and name (batches can be nested).
+            When the outermost batch ends, a single event per group is queued, with the events of the group
+            in its kwargs as `events` (a group of a single event is queued unchanged).
+        """
+        if self._batch_depth == 0:
+            self._batch = {}
+
+        self._batch_depth += 1
+        try:
+            yield
+
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                batch, self._batch = self._batch, None
+                for events in batch.values():
+                    if len(events) == 1:
+                        self._enqueue(events[0])
+
+                    else:
+                        last = events[-1]
+                        self._enqueue(last.__class__(emitter=last.emitter, name=last.name, kwargs={'events': events}))
 
     def register_event(self, event):
+        if self._batch is not None:
+            self._batch.setdefault((id(event.emitter), event.name), []).append(event)
+
+        else:
+            self._enqueue(event)
+
+    def _enqueue(self, event: abc.Event) -> None:
+        if self.coalesce:
+            self._latest[id(event.emitter), event.name] = event
+
         self.queue.append(event)
 
     def update(self):
         """This method will apply all the events in queue then remove them."""
-        while self.queue:
-            event = self.queue.popleft()
-            for model, callbacks in self.functions.copy().items():
-                if model.match(event):
-                    for callback in callbacks:
-                        callback(event)
+        queue = self.queue
+        latest = self._latest
+
+        if self.instrumentation is not None:
+            self.instrumentation.record_depth(len(queue))
+
+        while queue:
+            event = queue.popleft()
+
+            if latest:
+                key = id(event.emitter), event.name
+                newest = latest.get(key)
+                if newest is not None:
+                    if newest is not event:
+                        # a newer event with the same emitter and name is in queue
+                        continue
+
+                    del latest[key]
+
+            self._dispatch(event)
+
+
+@dataclass
+class AsyncEventManager(BaseEventManager):
+    """
+        This kind of event managers apply events on an asyncio loop, once started from this loop with `.start`.
+        The callbacks returning awaitables (coroutine functions) are run as tasks.
+
+        The events wait in a queue of at most `maxsize` events :
+        emitting from another thread blocks until the queue has room for the event,
+        emitting from the loop itself never blocks (the loop would be stuck), the extra events are put by a task.
+        The events emitted before the start are kept until then.
+    """
+
+    maxsize: int = 1024
+    loop: Optional[asyncio.AbstractEventLoop] = field(default=None, repr=False)
+    backlog: Deque[abc.Event] = field(default_factory=deque, repr=False)
+    _queue: Optional[asyncio.Queue] = field(default=None, repr=False)
+    _overflow: Deque[abc.Event] = field(default_factory=deque, repr=False)
+    _flusher: Optional[asyncio.Task] = field(default=None, repr=False)
+    _worker: Optional[asyncio.Task] = field(default=None, repr=False)
+    _tasks: Set[asyncio.Task] = field(default_factory=set, repr=False)
+
+    async def __aenter__(self) -> 'AsyncEventManager':
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop(drain=exc_type is None)
+
+    def start(self) -> None:
+        """Start to apply the events on the running loop."""
+        if self.loop is not None:
+            raise RuntimeError(f"{self.__class__.__name__} is already started.")
+
+        self.loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._worker = self.loop.create_task(self._run())
+
+        while self.backlog:
+            self._put_nowait(self.backlog.popleft())
+
+    async def join(self) -> None:
+        """Wait until all the events are applied, including the ones emitted meanwhile and the running callbacks."""
+        while True:
+            await self._queue.join()
+            pending = set(self._tasks)
+            if self._flusher is not None:
+                pending.add(self._flusher)
+
+            if not pending:
+                return
+
+            await asyncio.wait(pending)
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop to apply the events, after applying the pending ones if `drain`, otherwise they are kept in backlog."""
+        if self.loop is None:
+            return
+
+        if drain:
+            await self.join()
+
+        for task in (self._worker, self._flusher, *self._tasks):
+            if task is not None:
+                task.cancel()
+
+        while not self._queue.empty():
+            self.backlog.append(self._queue.get_nowait())
+
+        self.backlog.extend(self._overflow)
+        self._overflow.clear()
+        self.loop = self._queue = self._worker = self._flusher = None
+        self._tasks.clear()
+
+    async def put(self, event: abc.Event) -> None:
+        """Register the `event` from a coroutine of the loop, waiting for room in the queue."""
+        if self._flusher is not None:
+            await asyncio.shield(self._flusher)
+
+        await self._queue.put(event)
+
+    def register_event(self, event):
+        loop = self.loop
+        if loop is None:
+            self.backlog.append(event)
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is loop:
+            self._put_nowait(event)
+
+        else:
+            asyncio.run_coroutine_threadsafe(self._queue.put(event), loop).result()
+
+    def _put_nowait(self, event: abc.Event) -> None:
+        """Put the `event` in queue without waiting, the events which do not fit are put later in the same order."""
+        if not self._overflow:
+            try:
+                self._queue.put_nowait(event)
+                return
+
+            except asyncio.QueueFull:
+                pass
+
+        self._overflow.append(event)
+        if self._flusher is None:
+            self._flusher = self.loop.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        try:
+            while self._overflow:
+                await self._queue.put(self._overflow[0])
+                self._overflow.popleft()
+
+        finally:
+            if self._flusher is asyncio.current_task():
+                self._flusher = None
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            event = await queue.get()
+            try:
+                self._dispatch(event)
+
+            except Exception as exception:
+                self.loop.call_exception_handler({
+                    'message': f"exception while applying {event!r}",
+                    'exception': exception,
+                })
+
+            finally:
+                queue.task_done()
+
+    def _dispatch(self, event: abc.Event) -> None:
+        if self.released:
+            self._unregister_released()
+
+        instrumentation = self.instrumentation
+        for model in self._matching(event):
+            callbacks = model.functions()
+            if callbacks:
+                if instrumentation is not None:
+                    results = instrumentation.dispatch(model, callbacks, event)
+
+                else:
+                    results = [callback(event) for callback in callbacks]
+
+                for result in results:
+                    if inspect.isawaitable(result):
+                        task = self.loop.create_task(result)
+                        self._tasks.add(task)
+                        task.add_done_callback(self._tasks.discard)
+
+
+@dataclass
+class ExecutorEventManager(BaseEventManager):
+    """
+        This kind of event managers apply events in the threads of an executor, the emitters do not wait for them.
+        The events are applied one after the other in their emission order, unless `shards` is set :
+        the emitters are then split into `shards` lanes (see `.lane`) which are applied in parallel,
+        the events of an emitter being still applied in their emission order.
+
+        The callbacks are called by the executor workers, so the executor must share the memory of the emitters
+        (a ThreadPoolExecutor, a process pool cannot call them).
+        The exceptions raised by the callbacks are kept in `exceptions` and the first one is raised by `.wait`.
+    """
+
+    executor_factory: Callable[[], Executor] = ThreadPoolExecutor
+    shards: Optional[int] = None
+    exceptions: List[Exception] = field(default_factory=list, repr=False)
+    _executor: Optional[Executor] = field(default=None, repr=False)
+    # the events waiting in each lane, a lane is present while it is drained by a worker
+    _lanes: Dict[int, Deque[abc.Event]] = field(default_factory=dict, repr=False)
+    _futures: Set[Future] = field(default_factory=set, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def lane(self, emitter: object) -> int:
+        """Return the lane in which the events of the `emitter` are applied."""
+        if self.shards:
+            # ids are aligned addresses, their bits are mixed so that the emitters are spread over all the lanes
+            return hash((id(emitter),)) % self.shards
+
+        return 0
+
+    def register_event(self, event):
+        lane = self.lane(event.emitter)
+
+        with self._lock:
+            events = self._lanes.get(lane)
+            if events is not None:
+                events.append(event)
+                return
+
+            self._lanes[lane] = deque([event])
+            if self._executor is None:
+                self._executor = self.executor_factory()
+
+            future = self._executor.submit(self._drain, lane)
+            self._futures.add(future)
+
+        future.add_done_callback(self._discard)
+
+    def wait(self) -> None:
+        """Wait until all the events are applied, including the ones emitted meanwhile."""
+        while True:
+            with self._lock:
+                futures = set(self._futures)
+
+            if not futures:
+                break
+
+            wait_futures(futures)
+
+        if self.exceptions:
+            exception = self.exceptions[0]
+            self.exceptions.clear()
+            raise exception
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shutdown the executor, after applying all the events if `wait`."""
+        if wait:
+            self.wait()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _discard(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def _drain(self, lane: int) -> None:
+        events = self._lanes[lane]
+        while True:
+            with self._lock:
+                if not events:
+                    del self._lanes[lane]
+                    return
+
+                event = events.popleft()
+
+            try:
+                self._dispatch(event)
+
+            except Exception as exception:
+                self.exceptions.append(exception)
 
 
 def remove_prefix(string: str, prefix: str) -> str:
@@ -92,61 +653,299 @@ def remove_suffix(string: str, suffix: str) -> str:
         return string
 
 
-@dataclass
 class Event(abc.Event):
+    """
+        The events are immutable, their copies (see `.retarget`) are made without going through `__init__`.
+        When the event system has a pool (see `EventPool`), the events are taken from it.
+    """
+
     _manager: ClassVar[abc.EventManager]
+    _pool: ClassVar[Optional['EventPool']] = None
+
+    __slots__ = ('emitter', 'name', 'args', 'kwargs')
 
-    emitter: Optional[object] = None
-    name: str = ''
-    args: tuple = field(default_factory=tuple)
-    kwargs: dict = field(default_factory=dict)
+    emitter: Optional[object]
+    name: str
+    args: tuple
+    kwargs: dict
+
+    def __init__(self, emitter: Optional[object] = None, name: str = '', args: tuple = (), kwargs: dict = None):
+        set_event(self, emitter, name, args, {} if kwargs is None else kwargs)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(emitter={self.emitter!r}, name={self.name!r}, " \
+               f"args={self.args!r}, kwargs={self.kwargs!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (self.emitter, self.name, self.args, self.kwargs) == \
+               (other.emitter, other.name, other.args, other.kwargs)
+
+    __hash__ = None
+
+    def _copy(self, emitter: Optional[object], name: str) -> 'Event':
+        pool = self._pool
+        if pool is not None:
+            return pool.acquire(self.__class__, emitter, name, self.args, self.kwargs)
+
+        event = new_object(self.__class__)
+        set_event(event, emitter, name, self.args, self.kwargs)
+        return event
 
     def emit(self):
         self._manager.register_event(self)
 
+    def renamed(self, emitter: Optional[object], name: str) -> 'Event':
+        """Return a copy of the event emitted by `emitter` with `name`."""
+        return self._copy(emitter, name)
+
+    def retarget(self, prefix: str, emitter: Optional[object], remove: bool = False) -> 'Event':
+        """Return a copy of the event emitted by `emitter`, with `prefix` added to its name (or removed if `remove`)."""
+        if remove:
+            return self._copy(emitter, remove_prefix(self.name, prefix))
+
+        return self._copy(emitter, prefix + self.name)
+
     def remove_prefix(self, prefix: str) -> abc.Event:
-        return replace(self, name=remove_prefix(self.name, prefix))
+        return self._copy(self.emitter, remove_prefix(self.name, prefix))
 
     def remove_suffix(self, suffix: str) -> abc.Event:
-        return replace(self, name=remove_suffix(self.name, suffix))
+        return self._copy(self.emitter, remove_suffix(self.name, suffix))
 
     def append_prefix(self, prefix: str) -> abc.Event:
-        return replace(self, name=prefix + self.name)
+        return self._copy(self.emitter, prefix + self.name)
 
     def append_suffix(self, suffix: str) -> abc.Event:
-        return replace(self, name=self.name + suffix)
+        return self._copy(self.emitter, self.name + suffix)
 
     def with_emitter(self, emitter):
-        return replace(self, emitter=emitter)
+        return self._copy(emitter, self.name)
+
+    def copy(self) -> 'Event':
+        """Return a copy of the event which is never recycled, for the callbacks keeping the events of a pool."""
+        event = new_object(self.__class__)
+        set_event(event, self.emitter, self.name, self.args, self.kwargs)
+        return event
+
+
+new_object = object.__new__
+_set_emitter, _set_name, _set_args, _set_kwargs = (Event.__dict__[slot].__set__ for slot in Event.__slots__)
+
+
+def set_event(event: Event, emitter: Optional[object], name: str, args: tuple, kwargs: dict) -> None:
+    """Set the attributes of the immutable `event`, only for events not yet (or no longer) in use."""
+    _set_emitter(event, emitter)
+    _set_name(event, name)
+    _set_args(event, args)
+    _set_kwargs(event, kwargs)
+
+
+class EventPool:
+    """
+        Keep up to `size` events which are no longer used, to be reused instead of allocating new ones.
+        The creator of an event gives it back with `.recycle` once the manager applied it, which requires
+        a `DirectEventManager` (see `new_event_system`) : the events are applied when they are emitted.
+        The callbacks must not keep the events they receive, a recycled event is overwritten when it is reused :
+        they keep a `.copy()` instead.
+    """
+
+    __slots__ = ('size', 'free')
+
+    def __init__(self, size: int = 1024):
+        self.size: int = size
+        self.free: List[Event] = []
+
+    def acquire(self, cls: Type[Event], emitter: Optional[object], name: str, args: tuple, kwargs: dict) -> Event:
+        free = self.free
+        event = free.pop() if free else new_object(cls)
+        set_event(event, emitter, name, args, kwargs)
+        return event
+
+    def recycle(self, event: Event) -> None:
+        if len(self.free) < self.size:
+            set_event(event, None, '', (), None)
+            self.free.append(event)
+
+
+class RouteProbe:
+    """Stands for the events emitted by `emitter` with `name` when the manager looks for the models they match."""
+
+    __slots__ = ('emitter', 'name')
+
+    def __init__(self, emitter: object, name: str):
+        self.emitter = emitter
+        self.name = name
+
+
+# (model, position of the callback in the model functions, model of the last transmission or None, event name)
+RouteStep = Tuple[abc.EventModel, int, Optional[abc.EventModel], str]
+
+
+class RouteTooDeep(Exception):
+    """Raised while building a route going through more transmissions than `DirectEventManager.max_route_depth`."""
+
+
+class StrongRef:
+    """Same interface as `weakref.ref`, for the objects which are kept alive (None or not weakly referenceable)."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: object):
+        self.value = value
+
+    def __call__(self) -> object:
+        return self.value
+
+
+NONE_REF = StrongRef(None)
 
 
 class EventModel(abc.EventModel):
-    _manager: ClassVar[abc.EventManager]
+    """
+        The models keep weak references to their observer and emitter, when either of them is garbage collected,
+        the model is removed from the instances and unregistered from the manager.
+        The functions of the model are stored by its observer (in its `_event_functions` dict),
+        so that they do not keep the observer alive, or by the model itself when the observer is kept alive anyway
+        (None or not weakly referenceable).
+        The models are unique per (observer, emitter, name), the copies of a model are the model itself.
+    """
 
-    __instances: ClassVar[Dict[Tuple[int, int, int], abc.EventModel]] = {}
+    _manager: ClassVar[abc.EventManager]
 
-    __slots__ = ('name', 'observer', 'emitter')
+    __instances: ClassVar[Dict[Tuple[int, int, Hashable], abc.EventModel]] = {}
 
-    name: Union[str, re.Pattern]
-    observer: Optional[object]
-    emitter: Optional[object]
+    __slots__ = ('name', '_observer', '_emitter', '_emitter_id', '_hash', '_functions')
 
-    def __new__(cls, name: Union[str, re.Pattern], observer=None, emitter=None):
-        key = (id(observer), id(emitter), hash(name))
+    name: Union[str, Glob, re.Pattern]
+    _observer: Callable[[], Optional[object]]
+    _emitter: Callable[[], Optional[object]]
+    _emitter_id: int
+    _hash: int
+    # the functions of the model when they are not stored by the observer (see `.functions`), NONE_REF otherwise
+    _functions: Union[List[abc.EVENT_FUNCTION], StrongRef, None]
 
-        try:
-            instance = cls.__instances[key]
+    def __new__(cls, name: Union[str, Glob, re.Pattern], observer=None, emitter=None):
+        key = (id(observer), id(emitter), name)
+        instance = cls.__instances.get(key)
 
-        except KeyError:
+        if instance is None or instance._observer() is not observer or instance._emitter() is not emitter:
             cls.__instances[key] = instance = super().__new__(cls)
             instance.name = name
-            instance.observer = observer
-            instance.emitter = emitter
+            instance._emitter_id = id(emitter)
+            instance._hash = hash(key)
+
+            def release(_, instance=instance) -> None:
+                if cls.__instances.get(key) is instance:
+                    del cls.__instances[key]
+
+                instance._manager.release_model(instance)
+
+            instance._observer = cls._reference(observer, release)
+            instance._emitter = cls._reference(emitter, release)
+
+            if isinstance(instance._observer, StrongRef) or not hasattr(observer, '__dict__'):
+                instance._functions = None
+
+            else:
+                instance._functions = NONE_REF
 
         return instance
 
+    @staticmethod
+    def _reference(value: object, callback: Callable[[weakref.ref], None]) -> Callable[[], Optional[object]]:
+        if value is None:
+            return NONE_REF
+
+        try:
+            return weakref.ref(value, callback)
+
+        except TypeError:
+            return StrongRef(value)
+
+    @property
+    def observer(self) -> Optional[object]:
+        return self._observer()
+
+    @property
+    def emitter(self) -> Optional[object]:
+        return self._emitter()
+
     def __hash__(self):
-        return hash((id(self.observer), id(self.emitter), hash(self.name)))
+        return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        def label(value: object) -> str:
+            return 'None' if value is None else f"{type(value).__name__}@{id(value):x}"
+
+        return f"{self.__class__.__name__}({self.name!r}, observer={label(self.observer)}, " \
+               f"emitter={label(self.emitter)})"
+
+    def functions(self, create=False):
+        functions = self._functions
+        if functions is not NONE_REF:
+            if functions is None and create:
+                functions = self._functions = []
+
+            return functions
+
+        observer = self._observer()
+        if observer is None:
+            return None
+
+        store = observer.__dict__.get('_event_functions')
+        if store is None:
+            if not create:
+                return None
+
+            store = observer.__dict__['_event_functions'] = {}
+
+        functions = store.get(self)
+        if functions is None and create:
+            functions = store[self] = []
+
+        return functions
+
+    def release_functions(self):
+        if self._functions is not NONE_REF:
+            self._functions = None
+            return
+
+        observer = self._observer()
+        if observer is not None:
+            store = observer.__dict__.get('_event_functions')
+            if store:
+                store.pop(self, None)
+
+    def index_key(self) -> Optional[Hashable]:
+        """Return the key under which the manager indexes the model, the events are looked up by the same keys."""
+        if isinstance(self.name, str) and not is_pattern(self.name):
+            return self._emitter_id, self.name
+
+        return None
+
+    def pattern_key(self) -> Optional[Tuple[Hashable, Union[str, re.Pattern]]]:
+        """Return the emitter key and the pattern of the model if its name is a pattern (see `events.patterns`)."""
+        if isinstance(self.name, Glob):
+            return self._emitter_id, self.name.pattern
+
+        if is_pattern(self.name):
+            return self._emitter_id, self.name
+
+        return None
 
     def triggers(self, function):
         self._manager.register_function(self, function)
@@ -158,21 +957,17 @@ class EventModel(abc.EventModel):
             self._manager.unregister_function(self, function)
 
     def match(self, event: Event) -> bool:
-        if self.emitter is not event.emitter:
+        if self._emitter() is not event.emitter:
             return False
 
         if isinstance(self.name, str):
-            if self.name == '*':
-                return True
-
-            elif self.name == event.name:
-                return True
+            return self.name == '*' or self.name == event.name
 
-            else:
-                return False
+        elif isinstance(self.name, Glob):
+            return pattern_regex(self.name.pattern).fullmatch(event.name) is not None
 
         elif isinstance(self.name, re.Pattern):
-            raise NotImplementedError
+            return self.name.fullmatch(event.name) is not None
 
         else:
             return False
@@ -182,12 +977,20 @@ class Emitter(abc.Emitter):
     _event_factory: ClassVar[Type[abc.Event]]
 
     def _create_event(self, name, args, kwargs):
-        return self._event_factory(emitter=self, name=name, args=args, kwargs=kwargs)
+        factory = self._event_factory
+        pool = factory._pool
+        if pool is not None:
+            return pool.acquire(factory, self, name, args, kwargs)
+
+        return factory(emitter=self, name=name, args=args, kwargs=kwargs)
 
     def emit(self, name: str, *args, **kwargs):
         event = self._create_event(name=name, args=args, kwargs=kwargs)
         event.emit()
 
+        if event._pool is not None:
+            event._pool.recycle(event)
+
 
 class Observer(abc.Observer):
     _event_model_factory: ClassVar[Type[abc.EventModel]]
@@ -203,21 +1006,75 @@ class Observer(abc.Observer):
         model = self._create_event_model(name, emitter)
         model.forget()
 
+    def __reduce_ex__(self, protocol):
+        # the functions registered by the observer (see `EventModel.functions`) are not copied nor pickled with it
+        reduced = super().__reduce_ex__(protocol)
+        if len(reduced) < 3 or '_event_functions' not in self.__dict__:
+            return reduced
+
+        state, slots = reduced[2], None
+        if isinstance(state, tuple):
+            state, slots = state
+
+        if isinstance(state, dict):
+            state = {key: value for key, value in state.items() if key != '_event_functions'}
+
+        return reduced[:2] + ((state, slots) if slots is not None else state,) + reduced[3:]
+
+
+class Transmission:
+    """
+        The function registered by the transmitters, re-emitting the events they receive as their own.
+        The direct event managers recognise them to deliver the transmitted events without re-emitting them.
+    """
+
+    __slots__ = ('transmitter', 'prefix', 'remove')
+
+    def __init__(self, transmitter: 'Transmitter', prefix: str, remove: bool = False):
+        self.transmitter = transmitter
+        self.prefix = prefix
+        self.remove = remove
+
+    def transmitted_name(self, name: str) -> Optional[str]:
+        """Return the name of the event transmitted for an event named `name`, None if it is not transmitted."""
+        if not self.remove:
+            return self.prefix + name
+
+        if name.startswith(self.prefix):
+            return name[len(self.prefix):]
+
+        return None
+
+    def __call__(self, event: Event) -> None:
+        if self.remove and not event.name.startswith(self.prefix):
+            return
+
+        transmitted = event.retarget(self.prefix, self.transmitter, self.remove)
+        transmitted.emit()
+
+        if transmitted._pool is not None:
+            transmitted._pool.recycle(transmitted)
+
 
 class Transmitter(Observer, Emitter, abc.Transmitter):
     def transmit(self, name, emitter, prefix=''):
         model = self._create_event_model(name, emitter)
+        model.triggers(Transmission(self, prefix))
 
-        def function(event: Event) -> None:
-            event.append_prefix(prefix).with_emitter(self).emit()
+    @staticmethod
+    def _without_prefix_name(prefix: str) -> Union[Glob, re.Pattern]:
+        """Return the name of the model registered by `transmit_without_prefix`, the one to `forget`."""
+        if not isinstance(prefix, str) or is_pattern(prefix):
+            raise ValueError(f"the prefix should be a name, not a pattern : {prefix!r}")
 
-        model.triggers(function)
+        if '*' in prefix or '|' in prefix:
+            return re.compile(re.escape(prefix) + '.*', re.DOTALL)
 
-    def transmit_without_prefix(self, emitter, prefix=''):
-        model = self._create_event_model(name='*', emitter=emitter)
+        return Glob(prefix + '*')
 
-        def function(event: Event):
-            if event.name.startswith(prefix):
-                event.remove_prefix(prefix).with_emitter(self).emit()
+    def transmit_without_prefix(self, emitter, prefix=''):
+        model = self._create_event_model(name=self._without_prefix_name(prefix), emitter=emitter)
+        model.triggers(Transmission(self, prefix, remove=True))
 
-        model.triggers(function)
+    def forget_without_prefix(self, emitter, prefix=''):
+        self.forget(emitter, self._without_prefix_name(prefix))
@@ -2,13 +2,22 @@ from . import abc, base
 from typing import Type, Tuple
 
 
-def new_event_system(event_manager_factory: Type[abc.EventManager]) -> Tuple[Type[abc.Event], Type[abc.EventModel], Type[abc.Emitter], Type[abc.Observer], Type[abc.Transmitter]]:
+def new_event_system(event_manager_factory: Type[abc.EventManager], event_pool_size: int = 0) -> Tuple[Type[abc.Event], Type[abc.EventModel], Type[abc.Emitter], Type[abc.Observer], Type[abc.Transmitter]]:
+    """
+        Create the classes of an event system sharing a new manager, its events are reused if `event_pool_size`
+        (see `base.EventPool`, the manager must then be a `base.DirectEventManager`).
+    """
     event_manager = event_manager_factory()
+    if event_pool_size and not isinstance(event_manager, base.DirectEventManager):
+        raise ValueError(f"an event pool requires a DirectEventManager, not {event_manager.__class__.__name__}")
 
     class Event(base.Event):
+        __slots__ = ()
         _manager = event_manager
+        _pool = base.EventPool(event_pool_size) if event_pool_size else None
 
     class EventModel(base.EventModel):
+        __slots__ = ()
         _manager = event_manager
 
     class Emitter(base.Emitter):
@@ -0,0 +1,181 @@
+"""
+    Instrumentation of the event managers.
+
+    Attach an `Instrumentation` to a manager (`manager.instrumentation = Instrumentation()`) to record
+    the dispatches of each model, the latency of each of their callbacks and the depth of the queue over time.
+"""
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from tools37.ReprTable import ReprTable
+from . import abc
+
+__all__ = [
+    'CallbackStats',
+    'CallbackSnapshot',
+    'Snapshot',
+    'Instrumentation'
+]
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Return the `q` percentile (nearest rank) of the sorted `values`, 0.0 if empty."""
+    if not values:
+        return 0.0
+
+    return values[min(len(values) - 1, max(0, round(q / 100 * len(values)) - 1))]
+
+
+def callback_label(callback: abc.EVENT_FUNCTION) -> str:
+    return getattr(callback, '__qualname__', None) or repr(callback)
+
+
+@dataclass
+class CallbackStats:
+    """Statistics of a callback, the percentiles are computed over the `latencies` of the latest calls."""
+    label: str = ''
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+    latencies: Deque[float] = field(default_factory=deque)
+
+
+@dataclass(frozen=True)
+class CallbackSnapshot:
+    model: str
+    callback: str
+    count: int
+    total: float
+    p50: float
+    p90: float
+    p99: float
+    maximum: float
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    # number of events dispatched to each model
+    dispatches: Dict[str, int]
+    # statistics of each (model, callback), the most expensive first
+    callbacks: List[CallbackSnapshot]
+    # (time, number of events) in the queue of the manager, at each update
+    depths: List[Tuple[float, int]]
+
+    def table(self, limit: int = None) -> ReprTable:
+        """Return a table of the `limit` most expensive callbacks (times in ms)."""
+        return ReprTable.from_items(self.callbacks[:limit], {
+            "model": lambda stats: stats.model,
+            "callback": lambda stats: stats.callback,
+            "calls": lambda stats: str(stats.count),
+            "total": lambda stats: f"{stats.total * 1e3:.3f}",
+            "p50": lambda stats: f"{stats.p50 * 1e3:.3f}",
+            "p90": lambda stats: f"{stats.p90 * 1e3:.3f}",
+            "p99": lambda stats: f"{stats.p99 * 1e3:.3f}",
+            "max": lambda stats: f"{stats.maximum * 1e3:.3f}",
+        })
+
+
+class Instrumentation:
+    """
+        Record the activity of an event manager, the latest `window` latencies of each callback
+        and the latest `window` queue depths are kept.
+    """
+
+    def __init__(self, window: int = 1024, clock: Callable[[], float] = time.perf_counter):
+        self.window: int = window
+        self.clock: Callable[[], float] = clock
+        # the models and callbacks are forgotten when they are unregistered (see `.forget`)
+        self.dispatches: Dict[abc.EventModel, int] = {}
+        # statistics of the callbacks of each model, by callback id (two lambdas are two callbacks)
+        self.callbacks: Dict[abc.EventModel, Dict[int, CallbackStats]] = {}
+        self.depths: Deque[Tuple[float, int]] = deque(maxlen=window)
+        self._lock: threading.Lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.dispatches.clear()
+            self.callbacks.clear()
+            self.depths.clear()
+
+    def dispatch(self, model: abc.EventModel, callbacks: List[abc.EVENT_FUNCTION], event: abc.Event) -> list:
+        """Call the `callbacks` of the `model` with the `event` while recording them, return their results."""
+        clock = self.clock
+        results = []
+        timings = []
+        try:
+            for callback in callbacks:
+                start = clock()
+                try:
+                    results.append(callback(event))
+
+                finally:
+                    timings.append((callback, clock() - start))
+
+        finally:
+            self._record(model, timings)
+
+        return results
+
+    def _record(self, model: abc.EventModel, timings: List[Tuple[abc.EVENT_FUNCTION, float]]) -> None:
+        with self._lock:
+            self.dispatches[model] = self.dispatches.get(model, 0) + 1
+            callbacks = self.callbacks.get(model)
+            if callbacks is None:
+                callbacks = self.callbacks[model] = {}
+
+            for callback, latency in timings:
+                stats = callbacks.get(id(callback))
+                if stats is None:
+                    stats = callbacks[id(callback)] = CallbackStats(label=callback_label(callback),
+                                                                    latencies=deque(maxlen=self.window))
+
+                stats.count += 1
+                stats.total += latency
+                stats.maximum = max(stats.maximum, latency)
+                stats.latencies.append(latency)
+
+    def forget(self, model: abc.EventModel, callback: Optional[abc.EVENT_FUNCTION] = None) -> None:
+        """Drop the statistics of the `model`, or only of its `callback`, called when they are unregistered."""
+        with self._lock:
+            if callback is None:
+                self.dispatches.pop(model, None)
+                self.callbacks.pop(model, None)
+
+            else:
+                callbacks = self.callbacks.get(model)
+                if callbacks is not None:
+                    callbacks.pop(id(callback), None)
+
+    def record_depth(self, depth: int) -> None:
+        """Record the number of events waiting in the queue of the manager."""
+        self.depths.append((self.clock(), depth))
+
+    def snapshot(self) -> Snapshot:
+        with self._lock:
+            callbacks = []
+            for model, model_callbacks in self.callbacks.items():
+                for stats in model_callbacks.values():
+                    latencies = sorted(stats.latencies)
+                    callbacks.append(CallbackSnapshot(
+                        model=repr(model),
+                        callback=stats.label,
+                        count=stats.count,
+                        total=stats.total,
+                        p50=percentile(latencies, 50),
+                        p90=percentile(latencies, 90),
+                        p99=percentile(latencies, 99),
+                        maximum=stats.maximum,
+                    ))
+
+            callbacks.sort(key=lambda stats: stats.total, reverse=True)
+            return Snapshot(
+                dispatches={repr(model): count for model, count in self.dispatches.items()},
+                callbacks=callbacks,
+                depths=list(self.depths),
+            )
+
+    def __str__(self):
+        return str(self.snapshot().table())
@@ -0,0 +1,186 @@
+"""
+    Event name patterns.
+
+    The names are matched literally, except the name '*' alone which matches any event name.
+    The patterns are opt-in, by using a `Glob` as name : '*' matches any sequence of characters and '|' separates
+    alternatives, for example Glob('.items.*') or Glob(':append|:insert').
+    Compiled regexes (`re.Pattern`) can also be used as names, they must match the whole event name.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Hashable, Optional, List, Tuple, Union
+
+__all__ = [
+    'Glob',
+    'is_pattern',
+    'pattern_regex',
+    'PatternTrie'
+]
+
+
+class Glob:
+    """Event name pattern, where '*' matches any sequence of characters and '|' separates alternatives."""
+
+    __slots__ = ('pattern',)
+
+    def __init__(self, pattern: str):
+        self.pattern: str = pattern
+
+    def __eq__(self, other):
+        return isinstance(other, Glob) and other.pattern == self.pattern
+
+    def __hash__(self):
+        return hash((Glob, self.pattern))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.pattern!r})"
+
+
+def is_pattern(name: Union[str, Glob, re.Pattern]) -> bool:
+    """Return True if the event `name` is a pattern."""
+    return name == '*' or isinstance(name, (Glob, re.Pattern))
+
+
+@lru_cache(maxsize=None)
+def pattern_regex(pattern: str) -> re.Pattern:
+    """Return the regex equivalent to the `pattern`."""
+    return re.compile('|'.join(
+        '.*'.join(map(re.escape, alternative.split('*')))
+        for alternative in pattern.split('|')
+    ), re.DOTALL)
+
+
+class _Node:
+    __slots__ = ('children', 'star', 'is_star', 'values')
+
+    def __init__(self, is_star: bool = False):
+        self.children: Dict[str, _Node] = {}
+        self.star: Optional[_Node] = None
+        self.is_star: bool = is_star
+        self.values: Dict[Hashable, int] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.children or self.star or self.values)
+
+
+class PatternTrie:
+    """
+        Store patterns in a trie of characters (a '*' being a node looping on any character),
+        so that a name is matched against all the stored patterns in a single pass over its characters.
+        Regexes cannot be merged in the trie, they are checked one by one.
+    """
+
+    __slots__ = ('root', 'regexes')
+
+    def __init__(self):
+        self.root: _Node = _Node()
+        self.regexes: Dict[Hashable, Tuple[re.Pattern, int]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.root or self.regexes)
+
+    def _path(self, alternative: str, create: bool) -> List[_Node]:
+        """Return the nodes along the `alternative`, an empty list if it is missing (and `create` is False)."""
+        node = self.root
+        path = [node]
+        for char in alternative:
+            if char == '*':
+                if node.is_star:
+                    continue
+
+                if node.star is None:
+                    if not create:
+                        return []
+                    node.star = _Node(is_star=True)
+
+                node = node.star
+
+            else:
+                child = node.children.get(char)
+                if child is None:
+                    if not create:
+                        return []
+                    child = node.children[char] = _Node()
+
+                node = child
+
+            path.append(node)
+
+        return path
+
+    def add(self, pattern: Union[str, re.Pattern], value: Hashable, order: int) -> None:
+        """Store the `value` (with its `order`) under each alternative of the `pattern`."""
+        if isinstance(pattern, re.Pattern):
+            self.regexes[value] = pattern, order
+            return
+
+        for alternative in pattern.split('|'):
+            self._path(alternative, create=True)[-1].values[value] = order
+
+    def remove(self, pattern: Union[str, re.Pattern], value: Hashable) -> None:
+        """Remove the `value` stored under the `pattern`, the nodes left empty are pruned."""
+        if isinstance(pattern, re.Pattern):
+            self.regexes.pop(value, None)
+            return
+
+        for alternative in pattern.split('|'):
+            path = self._path(alternative, create=False)
+            if not path:
+                continue
+
+            path[-1].values.pop(value, None)
+
+            for parent, node in zip(reversed(path[:-1]), reversed(path[1:])):
+                if node:
+                    break
+
+                if parent.star is node:
+                    parent.star = None
+
+                else:
+                    for char, child in parent.children.items():
+                        if child is node:
+                            del parent.children[char]
+                            break
+
+    @staticmethod
+    def _enter(node: _Node, states: list, found: Dict[Hashable, int]) -> None:
+        """Add the `node` to the active `states`, following the stars which can match an empty sequence."""
+        while node is not None:
+            if node.is_star and not node.children:
+                # a trailing '*' matches any remaining characters
+                found.update(node.values)
+                return
+
+            states.append(node)
+            node = node.star
+
+    def match(self, name: str) -> Dict[Hashable, int]:
+        """Return the values (with their order) of all the patterns matching the `name`."""
+        found = {value: order for value, (regex, order) in self.regexes.items() if regex.fullmatch(name)}
+        states = []
+        enter = self._enter
+        enter(self.root, states, found)
+
+        for char in name:
+            if not states:
+                return found
+
+            next_states = []
+            for node in states:
+                if node.is_star:
+                    next_states.append(node)
+
+                child = node.children.get(char)
+                if child is not None:
+                    enter(child, next_states, found)
+
+            if len(next_states) > 1:
+                next_states = list({id(node): node for node in next_states}.values())
+
+            states = next_states
+
+        for node in states:
+            found.update(node.values)
+
+        return found
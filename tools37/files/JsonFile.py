@@ -1,8 +1,117 @@
 import os
 import json
-from typing import Union
+import re
+from typing import Optional, Union, Iterator, TextIO
+
+from tools37.formats import Format, List, ParsingPath
 from .BaseFile import BaseFile
 
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+DELIMITER = re.compile(r'[ \t\n\r,\]]')
+STRUCTURE = re.compile(r'[\[\]{},"]')
+STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+def item_end(text: str, start: int) -> Optional[int]:
+    """
+        Return the position of the delimiter ending the item starting at `start` in `text`
+        (a comma or an unmatched closing bracket out of the strings), None if the item goes on past the end of `text`.
+    """
+    depth = 0
+    match = STRUCTURE.search(text, start)
+    while match is not None:
+        char, position = match.group(), match.end()
+
+        if char == '"':
+            string = STRING.match(text, match.start())
+            if string is None:
+                return None
+
+            position = string.end()
+
+        elif char in '[{':
+            depth += 1
+
+        elif depth == 0:
+            return match.start()
+
+        elif char != ',':
+            depth -= 1
+
+        match = STRUCTURE.search(text, position)
+
+    return None
+
+
+def iter_json_array(file: TextIO, chunk_size: int = 1 << 16) -> Iterator[object]:
+    """
+        Yield the items of the top-level array of a json `file`, one by one.
+        The file is read by chunks, so that only the item being decoded is kept in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+    opened = False
+    after_item = False
+    after_comma = False
+
+    while True:
+        position = WHITESPACE.match(buffer, position).end()
+
+        if position == len(buffer):
+            if eof:
+                raise json.JSONDecodeError("Unexpected end of array", buffer, position)
+
+            chunk = file.read(chunk_size)
+            buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+            continue
+
+        char = buffer[position]
+
+        if not opened:
+            if char != '[':
+                raise json.JSONDecodeError("Expecting '['", buffer, position)
+
+            opened = True
+            position += 1
+            continue
+
+        if after_item:
+            if char == ']':
+                return
+
+            if char != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+
+            after_item, after_comma = False, True
+            position += 1
+            continue
+
+        if char == ']' and not after_comma:
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+            complete = eof or DELIMITER.search(buffer, end) is not None
+
+        except json.JSONDecodeError:
+            # the next chunks cannot fix an item already followed by its delimiter
+            if eof or item_end(buffer, position) is not None:
+                raise
+
+            complete = False
+
+        if not complete:
+            # the item may continue in the next chunk (the read size grows with the item to stay linear)
+            chunk = file.read(max(chunk_size, len(buffer) - position))
+            buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+            continue
+
+        position = end
+        after_item, after_comma = True, False
+        yield item
+
 
 class JsonFile(BaseFile):
     extension = ".json"
@@ -23,3 +132,38 @@ class JsonFile(BaseFile):
             cls.save(fp, default)
 
         return cls.load(fp)
+
+    @classmethod
+    def iter_items(cls, fp: str, chunk_size: int = 1 << 16) -> Iterator[object]:
+        """Yield the items of the top-level array of the file without loading the whole document."""
+        with cls._open_r(fp) as file:
+            yield from iter_json_array(file, chunk_size)
+
+    @classmethod
+    def iter_parsed(cls, fp: str, items_format: Format, path: str = '') -> Iterator[object]:
+        """Yield the items of the top-level array of the file, parsed by `items_format` as soon as decoded."""
+        compiled = items_format.compile()
+        for index, item in enumerate(cls.iter_items(fp)):
+            yield compiled(item, ParsingPath(path, index))
+
+    @classmethod
+    def is_array(cls, fp: str, chunk_size: int = 1 << 12) -> bool:
+        """Return True if the top-level value of the file is an array, reading only up to its first character."""
+        with cls._open_r(fp) as file:
+            while True:
+                chunk = file.read(chunk_size)
+                text = chunk.lstrip(' \t\n\r')
+                if text or not chunk:
+                    return text.startswith('[')
+
+    @classmethod
+    def load_parsed(cls, fp: str, data_format: Format, path: str = '') -> object:
+        """
+            Load the file parsed by `data_format`.
+            For a `List` format, the items of a top-level array are parsed while the file is read,
+            which stops at the first invalid item.
+        """
+        if isinstance(data_format, List) and cls.is_array(fp):
+            return list(cls.iter_parsed(fp, data_format.items_format, path))
+
+        return data_format.compile()(cls.load(fp), path)
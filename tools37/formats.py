@@ -4,8 +4,9 @@ import re
 import typing
 import typing as t
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
 
 # from typing import Optional, Callable, TypeVar, Generic, Type, Tuple
 
@@ -21,6 +22,7 @@ __all__ = [
     'Atom',
     'Iter',
     # utils
+    'ParsingPath',
     'ParsingError',
     # simples
     'Boolean',
@@ -89,9 +91,46 @@ class DataParser(t.Generic[E, F], Parser[F]):
 # ERRORS
 ########################################################################################################################
 
+class ParsingPath:
+    """
+        Path of a nested data, stored as a linked list of segments (list indexes or dict keys).
+        The path is rendered only when displayed, ie when a `ParsingError` is reported.
+    """
+
+    __slots__ = ('parent', 'segment')
+
+    def __init__(self, parent: AnyPath, segment: object):
+        self.parent: AnyPath = parent
+        self.segment: object = segment
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.parent!r}, {self.segment!r})"
+
+    def __str__(self) -> str:
+        segments = []
+        node = self
+        while isinstance(node, ParsingPath):
+            segments.append(node.segment)
+            node = node.parent
+
+        return str(node) + ''.join(f"[{segment!r}]" for segment in reversed(segments))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (str, ParsingPath)):
+            return str(self) == str(other)
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+AnyPath = t.Union[str, ParsingPath]
+
+
 @dataclass
 class ParsingError(Exception):
-    path: str
+    path: AnyPath
     data: object
     output_type: type
     reason: str
@@ -147,6 +186,77 @@ def to_float(value: t.Union[bool, int, str]) -> float:
     return float(value)
 
 
+########################################################################################################################
+# STRING PATTERNS
+########################################################################################################################
+
+DECIMAL_PATTERN = re.compile(r'\d+|\d+\.\d*|\.\d+')
+DATETIME_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?')
+SPECIAL_DECIMALS = frozenset(('inf', '-inf', 'nan'))
+
+
+def is_decimal_string(value: str) -> bool:
+    """Return True if `value` is 'inf', '-inf', 'nan', or a positive decimal number."""
+    return value.isdecimal() or value in SPECIAL_DECIMALS or DECIMAL_PATTERN.fullmatch(value) is not None
+
+
+def parse_iso_date(value: str) -> t.Optional[date]:
+    """Return the date written as 'YYYY-MM-DD', or None if `value` is not a valid date."""
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        return None
+
+    if not (value[0:4].isdecimal() and value[5:7].isdecimal() and value[8:10].isdecimal()):
+        return None
+
+    try:
+        return date.fromisoformat(value)
+
+    except ValueError:
+        return None
+
+
+def parse_iso_datetime(value: str) -> t.Optional[datetime]:
+    """
+        Return the datetime written as 'YYYY-MM-DDTHH:MM:SS[.f][tz]', or None if `value` is not a valid datetime.
+        The fractional seconds can have any number of digits (truncated to microseconds), and the timezone is
+        either 'Z' or an offset '+HH:MM' / '+HHMM'.
+    """
+    match = DATETIME_PATTERN.fullmatch(value)
+
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+
+    # `fromisoformat` carries the minutes over to the hours ('+05:99' is '+06:39')
+    if offset is not None and offset != 'Z' and (int(offset[1:3]) >= 24 or int(offset[-2:]) >= 60):
+        return None
+
+    try:
+        return datetime.fromisoformat(value)
+
+    except ValueError:
+        # the layouts which are not handled by `fromisoformat` on older python versions (or invalid values)
+        pass
+
+    if offset is None:
+        tzinfo = None
+
+    elif offset == 'Z':
+        tzinfo = timezone.utc
+
+    else:
+        sign = -1 if offset[0] == '-' else 1
+        tzinfo = timezone(sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[-2:])))
+
+    try:
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                        int(fraction[:6].ljust(6, '0')) if fraction else 0, tzinfo)
+
+    except ValueError:
+        return None
+
+
 ########################################################################################################################
 # ABSTRACT FORMATS
 ########################################################################################################################
@@ -154,10 +264,10 @@ def to_float(value: t.Union[bool, int, str]) -> float:
 
 class Format(ABC):
     @abstractmethod
-    def get_parser(self, data: object, path: str = '') -> t.Union[Parser[E], ParsingError]:
+    def get_parser(self, data: object, path: AnyPath = '') -> t.Union[Parser[E], ParsingError]:
         """"""
 
-    def parse(self, data, path: str = ''):
+    def parse(self, data, path: AnyPath = ''):
         parser = self.get_parser(data, path)
 
         if isinstance(parser, ParsingError):
@@ -165,12 +275,41 @@ class Format(ABC):
 
         return parser()
 
+    def compile(self) -> t.Callable[..., E]:
+        """
+            Return a function `compiled(data, path='')` which validates and converts the data in a single pass.
+            The function is built once per format, then reused : it behaves like `parse` (same results, same
+            `ParsingError`) without building a tree of parsers for each call.
+            The nested values are parsed with `path=None`, which raises a `ParsingError` as soon as possible without
+            details : only the failing value is then parsed again with its path.
+        """
+        try:
+            return self._compiled
+
+        except AttributeError:
+            self._compiled = self._compile()
+            return self._compiled
+
+    def _compile(self) -> t.Callable[..., E]:
+        """Build the function returned by `compile`, by default it falls back to `parse`."""
+        return self.parse
+
+    def _is_identity(self, data: object) -> bool:
+        """Return True if the data would be returned as is by the format."""
+        return False
+
+    def _accepted_types(self) -> t.Tuple[type, ...]:
+        """Return the types of the data which can be parsed (any instance of other types is rejected)."""
+        return object,
+
 
 class TypedFormat(t.Generic[E], Format, ABC):
     datatype: t.Type[E]
 
 
 class Atom(t.Generic[E], TypedFormat[E], ABC):
+    input_types: t.Tuple[type, ...] = (object,)
+
     def __init__(self,
                  default: E = None,
                  default_factory: t.Callable[[], E] = None,
@@ -201,7 +340,8 @@ class Atom(t.Generic[E], TypedFormat[E], ABC):
 
         return f"{self.__class__.__name__}({', '.join(contents)})"
 
-    def get_parser(self, data: object, path: str = '') -> t.Union[Parser[E], ParsingError]:
+    def _base_parser(self, data: object) -> t.Optional[Parser[E]]:
+        """Return the parser of None or of data of the exact datatype, None if the data needs a conversion."""
         if data is None:
             if self.optional:
                 return Identity(data)
@@ -212,12 +352,46 @@ class Atom(t.Generic[E], TypedFormat[E], ABC):
             if self.default_factory is not None:
                 return ParserFromFunction(self.default_factory)
 
-            return ParsingError(path, data, self.datatype, "wrong data type.")
+            return None
 
         if type(data) is self.datatype:
             return Identity(data)
 
-        return ParsingError(path, data, self.datatype, "wrong data type.")
+        return None
+
+    def get_parser(self, data: object, path: AnyPath = '') -> t.Union[Parser[E], ParsingError]:
+        parser = self._base_parser(data)
+
+        if parser is None:
+            return ParsingError(path, data, self.datatype, "wrong data type.")
+
+        return parser
+
+    def _is_identity(self, data: object) -> bool:
+        return type(data) is self.datatype or (data is None and self.optional)
+
+    def _accepted_types(self) -> t.Tuple[type, ...]:
+        if self.optional or self.default is not None or self.default_factory is not None:
+            return self.input_types + (type(None),)
+
+        return self.input_types
+
+    def _compile(self) -> t.Callable[..., E]:
+        datatype = self.datatype
+        get_parser = self.get_parser
+
+        def compiled(data, path=''):
+            if type(data) is datatype:
+                return data
+
+            parser = get_parser(data, path)
+
+            if isinstance(parser, ParsingError):
+                raise parser
+
+            return parser()
+
+        return compiled
 
 
 class Iter(t.Generic[E], TypedFormat[E], ABC):
@@ -227,6 +401,39 @@ class Iter(t.Generic[E], TypedFormat[E], ABC):
     def __repr__(self):
         return f"{self.__class__.__name__}({self.items_format!r})"
 
+    def _accepted_types(self) -> t.Tuple[type, ...]:
+        return self.datatype, type(None)
+
+    def _compile(self) -> t.Callable[..., E]:
+        datatype = self.datatype
+        compiled_item = self.items_format.compile()
+
+        def compiled(data, path=''):
+            if data is None:
+                return datatype()
+
+            if isinstance(data, datatype):
+                items = []
+                append = items.append
+                try:
+                    for item in data:
+                        append(compiled_item(item, None))
+
+                except ParsingError:
+                    if path is None:
+                        raise
+
+                    # the failing item is parsed again with its path, so that valid data never builds them
+                    index = len(items)
+                    compiled_item(data[index], ParsingPath(path, index))
+                    raise
+
+                return items if datatype is list else datatype(items)
+
+            raise ParsingError(path, data, datatype, "wrong data type.")
+
+        return compiled
+
 
 ########################################################################################################################
 # SIMPLE FORMATS
@@ -235,11 +442,12 @@ class Iter(t.Generic[E], TypedFormat[E], ABC):
 
 class Integer(Atom[int]):
     datatype = int
+    input_types = (int, float, str)
 
-    def get_parser(self, data: object, path: str = '') -> t.Union[Parser[int], ParsingError]:
-        parser = super().get_parser(data, path)
+    def get_parser(self, data: object, path: AnyPath = '') -> t.Union[Parser[int], ParsingError]:
+        parser = self._base_parser(data)
 
-        if not isinstance(parser, ParsingError):
+        if parser is not None:
             return parser
 
         if isinstance(data, float):
@@ -257,16 +465,17 @@ class Integer(Atom[int]):
 
             return ParsingError(path, data, int, "should be composed only of digits.")
 
-        return parser
+        return ParsingError(path, data, self.datatype, "wrong data type.")
 
 
 class String(Atom[str]):
     datatype = str
+    input_types = (str, int, float, date)
 
-    def get_parser(self, data, path: str = '') -> t.Union[Parser[str], ParsingError]:
-        parser = super().get_parser(data, path)
+    def get_parser(self, data, path: AnyPath = '') -> t.Union[Parser[str], ParsingError]:
+        parser = self._base_parser(data)
 
-        if not isinstance(parser, ParsingError):
+        if parser is not None:
             return parser
 
         if isinstance(data, bool):
@@ -284,16 +493,17 @@ class String(Atom[str]):
         if isinstance(data, datetime):
             return datetime_to_string(data)
 
-        return parser
+        return ParsingError(path, data, self.datatype, "wrong data type.")
 
 
 class Decimal(Atom[float]):
     datatype = float
+    input_types = (float, int, str)
 
-    def get_parser(self, data, path: str = '') -> t.Union[Parser[float], ParsingError]:
-        parser = super().get_parser(data, path)
+    def get_parser(self, data, path: AnyPath = '') -> t.Union[Parser[float], ParsingError]:
+        parser = self._base_parser(data)
 
-        if not isinstance(parser, ParsingError):
+        if parser is not None:
             return parser
 
         if isinstance(data, int):
@@ -303,30 +513,22 @@ class Decimal(Atom[float]):
             return to_float(data)
 
         if isinstance(data, str):
-            if data == 'inf':
-                return to_float(data)
-
-            if data == '-inf':
-                return to_float(data)
-
-            if data == 'nan':
-                return to_float(data)
-
-            if re.match(r'^(\d+|\d+\.\d*|\.\d+)$', data):
+            if is_decimal_string(data):
                 return to_float(data)
 
             return ParsingError(path, data, float, "should be 'inf', '-inf', 'nan', or any valid decimal number.")
 
-        return parser
+        return ParsingError(path, data, self.datatype, "wrong data type.")
 
 
 class Boolean(Atom[bool]):
     datatype = bool
+    input_types = (bool, int, float, str)
 
-    def get_parser(self, data, path: str = '') -> t.Union[Parser[bool], ParsingError]:
-        parser = super().get_parser(data, path)
+    def get_parser(self, data, path: AnyPath = '') -> t.Union[Parser[bool], ParsingError]:
+        parser = self._base_parser(data)
 
-        if not isinstance(parser, ParsingError):
+        if parser is not None:
             return parser
 
         if isinstance(data, int):
@@ -356,43 +558,49 @@ class Boolean(Atom[bool]):
 
             return ParsingError(path, data, bool, "should be 'False' or 'True'.")
 
-        return parser
+        return ParsingError(path, data, self.datatype, "wrong data type.")
 
 
 class Date(Atom[date]):
     datatype = date
+    input_types = (date, str)
 
-    def get_parser(self, data, path: str = '') -> t.Union[Parser[date], ParsingError]:
-        parser = super().get_parser(data, path)
+    def get_parser(self, data, path: AnyPath = '') -> t.Union[Parser[date], ParsingError]:
+        parser = self._base_parser(data)
 
-        if not isinstance(parser, ParsingError):
+        if parser is not None:
             return parser
 
         if isinstance(data, str):
-            if re.match(r'^\d{4}-\d{2}-\d{2}$', data):
-                return string_to_date(data)
+            value = parse_iso_date(data)
+
+            if value is not None:
+                return ParserFromValue(value)
 
             return ParsingError(path, data, date, "invalid date iso-format.")
 
-        return parser
+        return ParsingError(path, data, self.datatype, "wrong data type.")
 
 
 class Datetime(Atom[datetime]):
     datatype = datetime
+    input_types = (datetime, str)
 
-    def get_parser(self, data, path: str = '') -> t.Union[Parser[datetime], ParsingError]:
-        parser = super().get_parser(data, path)
+    def get_parser(self, data, path: AnyPath = '') -> t.Union[Parser[datetime], ParsingError]:
+        parser = self._base_parser(data)
 
-        if not isinstance(parser, ParsingError):
+        if parser is not None:
             return parser
 
         if isinstance(data, str):
-            if re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}$', data):
-                return string_to_datetime(data)
+            value = parse_iso_datetime(data)
+
+            if value is not None:
+                return ParserFromValue(value)
 
             return ParsingError(path, data, self.datatype, "invalid datetime iso-format.")
 
-        return parser
+        return ParsingError(path, data, self.datatype, "wrong data type.")
 
 
 ########################################################################################################################
@@ -401,16 +609,22 @@ class Datetime(Atom[datetime]):
 
 
 class List(Iter[list]):
-    def get_parser(self, data: object, path: str = '') -> t.Union[Parser[list], ParsingError]:
+    datatype = list
+
+    def get_parser(self, data: object, path: AnyPath = '') -> t.Union[Parser[list], ParsingError]:
         if data is None:
             return ParserFromFunction(list)
 
         if isinstance(data, list):
             item_parsers = [
-                self.items_format.get_parser(item, path=f"{path}[{index}]")
+                self.items_format.get_parser(item, path=ParsingPath(path, index))
                 for index, item in enumerate(data)
             ]
 
+            for item_parser in item_parsers:
+                if isinstance(item_parser, ParsingError):
+                    return item_parser
+
             def parser() -> list:
                 return list(item_parser() for item_parser in item_parsers)
 
@@ -420,16 +634,22 @@ class List(Iter[list]):
 
 
 class Tuple(Iter[tuple]):
-    def get_parser(self, data, path: str = '') -> t.Union[Parser[tuple], ParsingError]:
+    datatype = tuple
+
+    def get_parser(self, data, path: AnyPath = '') -> t.Union[Parser[tuple], ParsingError]:
         if data is None:
             return ParserFromFunction(tuple)
 
         if isinstance(data, tuple):
             item_parsers = [
-                self.items_format.get_parser(item, path=f"{path}[{index}]")
+                self.items_format.get_parser(item, path=ParsingPath(path, index))
                 for index, item in enumerate(data)
             ]
 
+            for item_parser in item_parsers:
+                if isinstance(item_parser, ParsingError):
+                    return item_parser
+
             def parser() -> tuple:
                 return tuple(item_parser() for item_parser in item_parsers)
 
@@ -438,14 +658,38 @@ class Tuple(Iter[tuple]):
         return ParsingError(path, data, self.datatype, "wrong data type.")
 
 
+def _new_column(field: Format) -> t.MutableSequence:
+    """Return an empty column to store the values parsed by `field`."""
+    if isinstance(field, Atom) and not field.optional:
+        if isinstance(field, Integer):
+            return array('q')
+
+        if isinstance(field, Decimal):
+            return array('d')
+
+    return []
+
+
 class Dict(TypedFormat[dict]):
     datatype = dict
 
     def __init__(self,
                  __strict__: bool = False,
+                 __fail_fast__: bool = False,
+                 __max_errors__: t.Optional[int] = None,
                  **fields: Format,
                  ):
+        """
+
+        :param __strict__: if True, the keys which are not in the fields are not allowed
+        :param __fail_fast__: if True, the parsing stops at the first invalid field
+        :param __max_errors__: if specified, the parsing stops once this number of invalid fields is reached
+        :param fields: the format of each key
+        """
+        assert __max_errors__ is None or __max_errors__ > 0, '`__max_errors__` should be positive'
         self.__strict__: bool = __strict__
+        self.__fail_fast__: bool = __fail_fast__
+        self.__max_errors__: t.Optional[int] = __max_errors__
         self.fields: typing.Dict[str, Format] = fields
 
     def __repr__(self) -> str:
@@ -454,9 +698,27 @@ class Dict(TypedFormat[dict]):
             contents.append(f"{key!s}={field!r}")
         if self.__strict__:
             contents.append("__strict__=True")
+        if self.__fail_fast__:
+            contents.append("__fail_fast__=True")
+        if self.__max_errors__ is not None:
+            contents.append(f"__max_errors__={self.__max_errors__!r}")
         return f"{self.__class__.__name__}({', '.join(contents)})"
 
-    def get_parser(self, data, path: str = '') -> t.Union[Parser[dict], ParsingError]:
+    @property
+    def _errors_limit(self) -> t.Optional[int]:
+        """Number of invalid fields after which the parsing stops (None if it never stops)."""
+        return 1 if self.__fail_fast__ else self.__max_errors__
+
+    def _errors_reason(self, errors: t.List[t.Tuple[str, ParsingError]]) -> str:
+        lines = [f"  - {key!s} -> {error}" for key, error in errors]
+        if len(errors) == self._errors_limit and len(errors) < len(self.fields):
+            lines.append(f"  - ... (stopped after {len(errors)} invalid fields)")
+        return "\n\t".join(lines)
+
+    def _accepted_types(self) -> t.Tuple[type, ...]:
+        return self.datatype, type(None)
+
+    def get_parser(self, data, path: AnyPath = '') -> t.Union[Parser[dict], ParsingError]:
         if data is None:
             data = {}
 
@@ -471,18 +733,23 @@ class Dict(TypedFormat[dict]):
                     # TODO : make it return a parsing error
                     return ParsingError(path, data, self.datatype, f"the keys : {invalid_keys!r} are not allowed !")
 
-            field_parsers = {
-                key: field.get_parser(data=data.get(key), path=f"{path}[{key!r}]")
-                for key, field in self.fields.items()
-            }
-            if any(isinstance(field_parser, ParsingError) for field_parser in field_parsers.values()):
-                return ParsingError(path, data, self.datatype,
-                                    "\n\t".join(
-                                        f"  - {key!s} -> {field_parser}"
-                                        for key, field_parser in field_parsers.items()
-                                        if isinstance(field_parser, ParsingError)
-                                    )
-                                    )
+            limit = self._errors_limit
+            errors = []
+            field_parsers = {}
+            for key, field in self.fields.items():
+                field_parser = field.get_parser(data=data.get(key), path=ParsingPath(path, key))
+
+                if isinstance(field_parser, ParsingError):
+                    errors.append((key, field_parser))
+
+                    if len(errors) == limit:
+                        break
+
+                else:
+                    field_parsers[key] = field_parser
+
+            if errors:
+                return ParsingError(path, data, self.datatype, self._errors_reason(errors))
 
             def parser():
                 return {key: field_parser() for key, field_parser in field_parsers.items()}
@@ -491,10 +758,113 @@ class Dict(TypedFormat[dict]):
 
         return ParsingError(path, data, self.datatype, "wrong data type.")
 
+    def _compile(self) -> t.Callable[..., dict]:
+        datatype = self.datatype
+        strict = self.__strict__
+        limit = self._errors_limit
+        errors_reason = self._errors_reason
+        fields = self.fields
+        compiled_fields = [(key, field.compile()) for key, field in fields.items()]
+
+        def compiled(data, path=''):
+            if data is None:
+                data = {}
+
+            if type(data) is not datatype:
+                raise ParsingError(path, data, datatype, "wrong data type.")
+
+            if strict:
+                invalid_keys = [key for key in data.keys() if key not in fields]
+
+                if invalid_keys:
+                    raise ParsingError(path, data, datatype, f"the keys : {invalid_keys!r} are not allowed !")
+
+            result = {}
+            errors = []
+            get = data.get
+            for key, compiled_field in compiled_fields:
+                try:
+                    result[key] = compiled_field(get(key), None)
+
+                except ParsingError:
+                    if path is None:
+                        raise
+
+                    # the field is parsed again with its path, so that valid data never builds it
+                    try:
+                        compiled_field(get(key), ParsingPath(path, key))
+
+                    except ParsingError as error:
+                        errors.append((key, error))
+
+                    if len(errors) == limit:
+                        break
+
+            if errors:
+                raise ParsingError(path, data, datatype, errors_reason(errors))
+
+            return result
+
+        return compiled
+
+    def parse_stream(self,
+                     records: t.Iterable[object],
+                     errors: t.Optional[t.List[ParsingError]] = None,
+                     path: AnyPath = '',
+                     ) -> t.Iterator[dict]:
+        """
+            Lazily parse the `records`, yielding one dict per valid record.
+            If an `errors` list is given, the invalid records are skipped and their errors appended to it,
+            otherwise the first error is raised.
+        """
+        compiled = self.compile()
+        for index, record in enumerate(records):
+            try:
+                yield compiled(record, ParsingPath(path, index))
+
+            except ParsingError as error:
+                if errors is None:
+                    raise
+
+                errors.append(error)
+
+    def parse_many(self,
+                   records: t.Iterable[object],
+                   columns: bool = False,
+                   errors: t.Optional[t.List[ParsingError]] = None,
+                   path: AnyPath = '',
+                   ) -> t.Union[t.List[dict], t.Dict[str, t.MutableSequence]]:
+        """
+            Parse all the `records` (see `parse_stream`).
+            If `columns` is True, return a dict mapping each field to the list of its values, the values of the
+            non-optional `Integer` and `Decimal` fields are stored in an `array` (typecodes 'q' and 'd'),
+            an `Integer` column is turned into a list when one of its values does not fit in 64 bits.
+        """
+        rows = self.parse_stream(records, errors, path)
+
+        if not columns:
+            return list(rows)
+
+        result = {key: _new_column(field) for key, field in self.fields.items()}
+        appenders = [(key, column.append) for key, column in result.items()]
+        for row in rows:
+            for index, (key, append) in enumerate(appenders):
+                try:
+                    append(row[key])
+
+                except OverflowError:
+                    column = result[key] = list(result[key])
+                    column.append(row[key])
+                    appenders[index] = key, column.append
+
+        return result
+
     def omit(self, *keys_to_omit, __strict__: bool = None) -> Dict:
         """Return a new format where some keys are omitted."""
         return Dict(
             __strict__=self.__strict__ if __strict__ is None else __strict__,
+            __fail_fast__=self.__fail_fast__,
+            __max_errors__=self.__max_errors__,
             **{
                 key: field
                 for key, field in self.fields.items()
@@ -506,6 +876,8 @@ class Dict(TypedFormat[dict]):
         """Return a new format where only some keys are keeped."""
         return Dict(
             __strict__=self.__strict__ if __strict__ is None else __strict__,
+            __fail_fast__=self.__fail_fast__,
+            __max_errors__=self.__max_errors__,
             **{
                 key: field
                 for key, field in self.fields.items()
@@ -520,35 +892,184 @@ class Dict(TypedFormat[dict]):
 
 
 class Union(Format):
-    def __init__(self, *options: Format, unique: bool = False):
-        self.options: t.Tuple[Format, ...] = options
+    def __init__(self,
+                 *options: Format,
+                 unique: bool = False,
+                 fail_fast: bool = False,
+                 max_errors: t.Optional[int] = None,
+                 discriminator: t.Optional[str] = None,
+                 tags: t.Optional[t.Dict[object, Format]] = None,
+                 ):
+        """
+
+        :param options: the formats to try (only those accepting the type of the data are tried), not with `tags`
+        :param unique: if True, the data should be accepted by only one option
+        :param fail_fast: if True, only the error of the first failing option is kept (all the options are still tried)
+        :param max_errors: if specified, the number of option errors reported
+        :param discriminator: if specified, the key of the data (dict) used to select the option in `tags`
+        :param tags: the option to use for each value of the `discriminator` key
+        """
+        assert (discriminator is None) == (tags is None), '`discriminator` and `tags` should be specified together'
+        assert max_errors is None or max_errors > 0, '`max_errors` should be positive'
+        if options and tags is not None:
+            raise ValueError("`options` cannot be specified with `tags`, the options are the values of `tags`")
+
+        self.options: t.Tuple[Format, ...] = tuple(tags.values()) if tags is not None else options
         self.unique: bool = unique
+        self.fail_fast: bool = fail_fast
+        self.max_errors: t.Optional[int] = max_errors
+        self.discriminator: t.Optional[str] = discriminator
+        self.tags: t.Optional[t.Dict[object, Format]] = tags
+        self._candidates: t.Dict[type, t.Tuple[Format, ...]] = {}
+
+    def __repr__(self) -> str:
+        if self.tags is None:
+            contents = list(map(repr, self.options))
+        else:
+            contents = [f"discriminator={self.discriminator!r}", f"tags={self.tags!r}"]
+        if self.unique:
+            contents.append("unique=True")
+        if self.fail_fast:
+            contents.append("fail_fast=True")
+        if self.max_errors is not None:
+            contents.append(f"max_errors={self.max_errors!r}")
+        return f"{self.__class__.__name__}({', '.join(contents)})"
+
+    def candidates(self, datatype: type) -> t.Tuple[Format, ...]:
+        """Return the options accepting the `datatype`, the result is indexed by `datatype`."""
+        try:
+            return self._candidates[datatype]
+
+        except KeyError:
+            candidates = self._candidates[datatype] = tuple(
+                option
+                for option in self.options
+                if issubclass(datatype, option._accepted_types())
+            )
+            return candidates
+
+    def _select(self, data, path: AnyPath) -> t.Union[Format, ParsingError]:
+        """Return the option selected by the `discriminator` key of the data."""
+        if type(data) is not dict:
+            return ParsingError(path, data, dict, "wrong data type.")
+
+        tag = data.get(self.discriminator)
+        try:
+            return self.tags[tag]
+
+        except (KeyError, TypeError):
+            return ParsingError(path, data, object, f"unknown {self.discriminator!s} : {tag!r}.")
+
+    def _errors_reason(self, data, errors: t.List[ParsingError]) -> str:
+        if not errors:
+            return f"no option for {data.__class__.__name__!s}."
+
+        lines = list(map(str, errors[:self.max_errors]))
+        if self.max_errors is not None and len(errors) > self.max_errors:
+            lines.append(f"... ({len(errors) - self.max_errors} more errors)")
+        return "\n\t| ".join(lines)
+
+    def get_parser(self, data, path: AnyPath = '') -> t.Union[Parser[object], ParsingError]:
+        if self.discriminator is not None:
+            option = self._select(data, path)
+
+            if isinstance(option, ParsingError):
+                return option
+
+            return option.get_parser(data, path)
 
-    def get_parser(self, data, path: str = '') -> t.Union[Parser[object], ParsingError]:
         errors = []
         parsers = []
-        for option in self.options:
+        for option in self.candidates(type(data)):
             option_parser = option.get_parser(data, path)
 
             if isinstance(option_parser, Identity):
                 return option_parser
 
             elif isinstance(option_parser, ParsingError):
-                errors.append(option_parser)
+                if not (self.fail_fast and errors):
+                    errors.append(option_parser)
 
             else:
-                parsers.append(option_parser)
+                parsers.append((option, option_parser))
 
         if len(parsers) > 1 and self.unique:
             return ParsingError(path, data, object,
-                                f"multiple parsers {', '.join(map(repr, (parser.__name__ for parser in parsers)))}.")
+                                f"multiple options {', '.join(repr(option) for option, _ in parsers)}.")
         if len(parsers) > 0:
-            return parsers[0]
+            return parsers[0][1]
 
         if len(errors) == 1:
             return errors[0]
 
-        return ParsingError(path, data, object, "\n\t| ".join(
-            str(option_parser)
-            for option_parser in parsers
-        ))
+        return ParsingError(path, data, object, self._errors_reason(data, errors))
+
+    def _is_identity(self, data: object) -> bool:
+        return any(option._is_identity(data) for option in self.options)
+
+    def _accepted_types(self) -> t.Tuple[type, ...]:
+        if self.discriminator is not None:
+            return dict,
+
+        return tuple(datatype for option in self.options for datatype in option._accepted_types())
+
+    def _compile(self) -> t.Callable[..., object]:
+        if self.discriminator is not None:
+            return self._compile_tagged()
+
+        candidates = self.candidates
+        compiled_options = {option: option.compile() for option in self.options}
+        unique = self.unique
+        fail_fast = self.fail_fast
+        errors_reason = self._errors_reason
+
+        def compiled(data, path=''):
+            options = candidates(type(data))
+
+            for option in options:
+                if option._is_identity(data):
+                    return data
+
+            errors = []
+            results = []
+            for option in options:
+                try:
+                    result = compiled_options[option](data, path)
+
+                except ParsingError as error:
+                    if not (fail_fast and errors):
+                        errors.append(error)
+
+                    continue
+
+                if not unique:
+                    return result
+
+                results.append((option, result))
+
+            if len(results) > 1:
+                raise ParsingError(path, data, object,
+                                   f"multiple options {', '.join(repr(option) for option, _ in results)}.")
+            if len(results) > 0:
+                return results[0][1]
+
+            if len(errors) == 1 or (errors and path is None):
+                raise errors[0]
+
+            raise ParsingError(path, data, object, errors_reason(data, errors))
+
+        return compiled
+
+    def _compile_tagged(self) -> t.Callable[..., object]:
+        select = self._select
+        compiled_options = {option: option.compile() for option in self.tags.values()}
+
+        def compiled(data, path=''):
+            option = select(data, path)
+
+            if isinstance(option, ParsingError):
+                raise option
+
+            return compiled_options[option](data, path)
+
+        return compiled
@@ -29,6 +29,9 @@ class BoundingBox:
     xf: Real
     yf: Real
 
+    def __contains__(self, other: Coords) -> bool:
+        return self.xi <= other.x <= self.xf and self.yi <= other.y <= self.yf
+
     @property
     def nw(self) -> Coords:
         return Coords(self.xi, self.yi)
@@ -3,10 +3,16 @@ from __future__ import annotations
 from numbers import Real
 from typing import Generator
 
-from tools37.Typed import Typed, typedmethod, TypedArg
+from .Vector import SCALARS
 
 
-class Coords(Typed):
+class Coords:
+    """
+        2D coordinates, the operators between two coordinates are elementwise.
+        The operators branch on the exact type of the other operand, subclasses of Coords are not supported.
+    """
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: Real, y: Real):
         self.x: Real = x
         self.y: Real = y
@@ -47,125 +53,95 @@ class Coords(Typed):
         return self / abs(self)
 
     ####################################################################################################################
-    # COORDS x SCALAR operations
+    # COORDS x COORDS and COORDS x SCALAR operations, NotImplemented otherwise
     ####################################################################################################################
 
-    @typedmethod(Real)
     def __add__(self, other) -> Coords:
-        return Coords(self.x + other, self.y + other)
+        cls = type(other)
+        if cls is Coords:
+            return Coords(self.x + other.x, self.y + other.y)
+        elif cls in SCALARS or isinstance(other, Real):
+            return Coords(self.x + other, self.y + other)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __radd__(self, other) -> Coords:
-        return Coords(other + self.x, other + self.y)
+        if type(other) in SCALARS or isinstance(other, Real):
+            return Coords(other + self.x, other + self.y)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __sub__(self, other) -> Coords:
-        return Coords(self.x - other, self.y - other)
+        cls = type(other)
+        if cls is Coords:
+            return Coords(self.x - other.x, self.y - other.y)
+        elif cls in SCALARS or isinstance(other, Real):
+            return Coords(self.x - other, self.y - other)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __rsub__(self, other) -> Coords:
-        return Coords(other - self.x, other - self.y)
+        if type(other) in SCALARS or isinstance(other, Real):
+            return Coords(other - self.x, other - self.y)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __mul__(self, other) -> Coords:
-        return Coords(self.x * other, self.y * other)
+        cls = type(other)
+        if cls is Coords:
+            return Coords(self.x * other.x, self.y * other.y)
+        elif cls in SCALARS or isinstance(other, Real):
+            return Coords(self.x * other, self.y * other)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __rmul__(self, other) -> Coords:
-        return Coords(other * self.x, other * self.y)
+        if type(other) in SCALARS or isinstance(other, Real):
+            return Coords(other * self.x, other * self.y)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __truediv__(self, other) -> Coords:
-        return Coords(self.x / other, self.y / other)
+        cls = type(other)
+        if cls is Coords:
+            return Coords(self.x / other.x, self.y / other.y)
+        elif cls in SCALARS or isinstance(other, Real):
+            return Coords(self.x / other, self.y / other)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __rtruediv__(self, other) -> Coords:
-        return Coords(other / self.x, other / self.y)
+        if type(other) in SCALARS or isinstance(other, Real):
+            return Coords(other / self.x, other / self.y)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __floordiv__(self, other) -> Coords:
-        return Coords(self.x // other, self.y // other)
+        cls = type(other)
+        if cls is Coords:
+            return Coords(self.x // other.x, self.y // other.y)
+        elif cls in SCALARS or isinstance(other, Real):
+            return Coords(self.x // other, self.y // other)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __rfloordiv__(self, other) -> Coords:
-        return Coords(other // self.x, other // self.y)
+        if type(other) in SCALARS or isinstance(other, Real):
+            return Coords(other // self.x, other // self.y)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __mod__(self, other) -> Coords:
-        return Coords(self.x % other, self.y % other)
+        cls = type(other)
+        if cls is Coords:
+            return Coords(self.x % other.x, self.y % other.y)
+        elif cls in SCALARS or isinstance(other, Real):
+            return Coords(self.x % other, self.y % other)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __rmod__(self, other) -> Coords:
-        return Coords(other % self.x, other % self.y)
-
-    ####################################################################################################################
-    # COORDS x COORDS operations
-    ####################################################################################################################
-
-    @typedmethod(TypedArg.CLASS)
-    def __add__(self, other) -> Coords:
-        return Coords(self.x + other.x, self.y + other.y)
-
-    @typedmethod(TypedArg.CLASS)
-    def __sub__(self, other) -> Coords:
-        return Coords(self.x - other.x, self.y - other.y)
-
-    @typedmethod(TypedArg.CLASS)
-    def __mul__(self, other) -> Coords:
-        return Coords(self.x * other.x, self.y * other.y)
-
-    @typedmethod(TypedArg.CLASS)
-    def __truediv__(self, other) -> Coords:
-        return Coords(self.x / other.x, self.y / other.y)
-
-    @typedmethod(TypedArg.CLASS)
-    def __floordiv__(self, other) -> Coords:
-        return Coords(self.x // other.x, self.y // other.y)
-
-    @typedmethod(TypedArg.CLASS)
-    def __mod__(self, other) -> Coords:
-        return Coords(self.x % other.x, self.y % other.y)
-
-    ####################################################################################################################
-    # COORDS x ??? operations -> NotImplemented
-    ####################################################################################################################
-
-    @typedmethod(object)
-    def __add__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __radd__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __sub__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __rsub__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __mul__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __rmul__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __xor__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __rxor__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __truediv__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __rtruediv__(self, _):
-        return NotImplemented
+        if type(other) in SCALARS or isinstance(other, Real):
+            return Coords(other % self.x, other % self.y)
+        else:
+            return NotImplemented
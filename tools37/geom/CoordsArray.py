@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from array import array
+from operator import add, mul, sub, truediv
+from typing import Generator, Iterable, Optional, Union
+
+from .Coords import Coords
+from .VectorArray import COLUMNS, broadcast
+
+
+class CoordsArray:
+    """
+        Array of 2D coordinates stored as two `array('d')` of x and y, with the operators of `Coords` applied in bulk.
+        The other operand is another CoordsArray of the same length, a single Coords, a scalar or an `array('d')`
+        of a scalar per coordinates. Indexing returns a plain Coords.
+    """
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x: Iterable[float] = (), y: Iterable[float] = ()):
+        self.x: array = array('d', x)
+        self.y: array = array('d', y)
+        if len(self.x) != len(self.y):
+            raise ValueError(f"length mismatch: {len(self.x)} != {len(self.y)}")
+
+    @classmethod
+    def from_coords(cls, coords: Iterable[Coords]) -> CoordsArray:
+        coords = list(coords)
+        return cls([item.x for item in coords], [item.y for item in coords])
+
+    def __iter__(self) -> Generator[Coords, None, None]:
+        for x, y in zip(self.x, self.y):
+            yield Coords(x, y)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self.x)!r}, {list(self.y)!r})"
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.x == other.x and self.y == other.y
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Coords, CoordsArray]:
+        if isinstance(index, slice):
+            return CoordsArray(self.x[index], self.y[index])
+        else:
+            return Coords(self.x[index], self.y[index])
+
+    def __setitem__(self, index: int, value: Coords) -> None:
+        self.x[index] = value.x
+        self.y[index] = value.y
+
+    def append(self, coords: Coords) -> None:
+        self.x.append(coords.x)
+        self.y.append(coords.y)
+
+    def __abs__(self) -> array:
+        """Return the norms of the coordinates."""
+        return array('d', [(x ** 2 + y ** 2) ** 0.5 for x, y in zip(self.x, self.y)])
+
+    def __unit__(self) -> CoordsArray:
+        return self / abs(self)
+
+    ####################################################################################################################
+    # ELEMENTWISE OPERATIONS
+    ####################################################################################################################
+
+    def _columns(self, other) -> Optional[COLUMNS]:
+        return broadcast(len(self.x), other, CoordsArray, Coords)
+
+    def _map(self, operation, other, reflected: bool = False) -> CoordsArray:
+        columns = self._columns(other)
+        if columns is None:
+            return NotImplemented
+
+        x, y = columns
+        if reflected:
+            return CoordsArray(map(operation, x, self.x), map(operation, y, self.y))
+        else:
+            return CoordsArray(map(operation, self.x, x), map(operation, self.y, y))
+
+    def __add__(self, other) -> CoordsArray:
+        return self._map(add, other)
+
+    def __radd__(self, other) -> CoordsArray:
+        return self._map(add, other, reflected=True)
+
+    def __sub__(self, other) -> CoordsArray:
+        return self._map(sub, other)
+
+    def __rsub__(self, other) -> CoordsArray:
+        return self._map(sub, other, reflected=True)
+
+    def __mul__(self, other) -> CoordsArray:
+        return self._map(mul, other)
+
+    def __rmul__(self, other) -> CoordsArray:
+        return self._map(mul, other, reflected=True)
+
+    def __truediv__(self, other) -> CoordsArray:
+        return self._map(truediv, other)
+
+    def __rtruediv__(self, other) -> CoordsArray:
+        return self._map(truediv, other, reflected=True)
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from heapq import nsmallest
+from math import floor
+from numbers import Real
+from operator import sub
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .BoundingBox import BoundingBox
+from .Circle import Circle
+from .Coords import Coords
+from .CoordsArray import CoordsArray
+
+POINT, CIRCLE, BOX = range(3)
+
+SHAPE = Union[Coords, Circle, BoundingBox]
+GEOMETRY = Tuple[int, tuple]
+POINTS = Union[Iterable[Coords], CoordsArray]
+
+
+def geometry(shape: SHAPE) -> GEOMETRY:
+    """Return the kind of `shape` and the floats describing it : (x, y), (x, y, radius) or (xi, yi, xf, yf)."""
+    if type(shape) is Coords:
+        return POINT, (shape.x, shape.y)
+    elif type(shape) is Circle:
+        return CIRCLE, (shape.center.x, shape.center.y, shape.radius)
+    elif isinstance(shape, BoundingBox):
+        return BOX, (shape.xi, shape.yi, shape.xf, shape.yf)
+    else:
+        raise TypeError(shape)
+
+
+def bounds(kind: int, g: tuple) -> Tuple[Real, Real, Real, Real]:
+    if kind == POINT:
+        return g[0], g[1], g[0], g[1]
+    elif kind == CIRCLE:
+        return g[0] - g[2], g[1] - g[2], g[0] + g[2], g[1] + g[2]
+    else:
+        return g
+
+
+def distance(kind: int, g: tuple, x: Real, y: Real) -> Real:
+    """Return the distance from (x, y) to the shape, 0 if it contains it."""
+    if kind == POINT:
+        return ((x - g[0]) ** 2 + (y - g[1]) ** 2) ** 0.5
+    elif kind == CIRCLE:
+        return max(0, ((x - g[0]) ** 2 + (y - g[1]) ** 2) ** 0.5 - g[2])
+    else:
+        dx = max(g[0] - x, 0, x - g[2])
+        dy = max(g[1] - y, 0, y - g[3])
+        return (dx ** 2 + dy ** 2) ** 0.5
+
+
+def contains(kind: int, g: tuple, x: Real, y: Real) -> bool:
+    """Return True if the shape contains (x, y), as `Circle.__contains__` and `BoundingBox.__contains__` do."""
+    if kind == POINT:
+        return x == g[0] and y == g[1]
+    elif kind == CIRCLE:
+        return ((x - g[0]) ** 2 + (y - g[1]) ** 2) ** 0.5 <= g[2]
+    else:
+        return g[0] <= x <= g[2] and g[1] <= y <= g[3]
+
+
+def intersects(kind: int, g: tuple, other_kind: int, other: tuple) -> bool:
+    if other_kind == POINT:
+        return contains(kind, g, *other)
+    elif other_kind == CIRCLE:
+        return distance(kind, g, other[0], other[1]) <= other[2]
+    elif kind == BOX:
+        return g[0] <= other[2] and other[0] <= g[2] and g[1] <= other[3] and other[1] <= g[3]
+    else:
+        return intersects(other_kind, other, kind, g)
+
+
+class SpatialIndex:
+    """
+        Uniform grid of `Coords`, `Circle` and `BoundingBox` shapes given by key, answering the containment,
+        intersection and nearest neighbours queries by only checking the shapes of the cells around the query.
+        Each shape is stored in all the cells its bounds overlap, the `cell` size should be close to the size
+        of the shapes (see `of_shapes`).
+    """
+
+    def __init__(self, cell: Real):
+        assert float(cell) > 0
+        self.cell: Real = cell
+        self.shapes: Dict[int, SHAPE] = {}
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self._geometries: Dict[int, GEOMETRY] = {}
+        self._keys: Dict[int, List[Tuple[int, int]]] = {}
+        self._next_key: int = 0
+        # (cxi, cyi, cxf, cyf) covering all the cells used since the creation of the index
+        self._extent: Optional[Tuple[int, int, int, int]] = None
+
+    @classmethod
+    def of_shapes(cls, shapes: Iterable[SHAPE], cell: Optional[Real] = None) -> SpatialIndex:
+        """
+            Return the index of the `shapes`, keyed by position. The default `cell` is the median size of the shapes,
+            or the mean spacing between them if it is larger (a shape per cell on average).
+        """
+        shapes = list(shapes)
+        if cell is None:
+            boxes = [bounds(*geometry(shape)) for shape in shapes]
+            if boxes:
+                xi, yi, xf, yf = zip(*boxes)
+                sizes = sorted(max(w, h) for w, h in zip(map(sub, xf, xi), map(sub, yf, yi)))
+                spacing = ((max(xf) - min(xi)) * (max(yf) - min(yi)) / len(boxes)) ** 0.5
+                cell = max(sizes[len(sizes) // 2], spacing)
+
+            if not cell:
+                cell = 1.0
+
+        index = cls(cell)
+        for shape in shapes:
+            index.add(shape)
+
+        return index
+
+    def __len__(self) -> int:
+        return len(self.shapes)
+
+    def __getitem__(self, key: int) -> SHAPE:
+        return self.shapes[key]
+
+    def _cell_keys(self, xi: Real, yi: Real, xf: Real, yf: Real) -> List[Tuple[int, int]]:
+        cell = self.cell
+        return [(cx, cy)
+                for cx in range(floor(xi / cell), floor(xf / cell) + 1)
+                for cy in range(floor(yi / cell), floor(yf / cell) + 1)]
+
+    def add(self, shape: SHAPE) -> int:
+        """Add the `shape` and return its key."""
+        key = self._next_key
+        self._next_key += 1
+        self._insert(key, shape)
+        return key
+
+    def _insert(self, key: int, shape: SHAPE) -> None:
+        g = self._geometries[key] = geometry(shape)
+        self.shapes[key] = shape
+        cells = self.cells
+        keys = self._keys[key] = self._cell_keys(*bounds(*g))
+        for cell_key in keys:
+            cells.setdefault(cell_key, []).append(key)
+
+        (cxi, cyi), (cxf, cyf) = keys[0], keys[-1]
+        if self._extent is not None:
+            exi, eyi, exf, eyf = self._extent
+            cxi, cyi, cxf, cyf = min(cxi, exi), min(cyi, eyi), max(cxf, exf), max(cyf, eyf)
+
+        self._extent = cxi, cyi, cxf, cyf
+
+    def remove(self, key: int) -> SHAPE:
+        """Remove and return the shape of `key`."""
+        cells = self.cells
+        for cell_key in self._keys.pop(key):
+            items = cells[cell_key]
+            items.remove(key)
+            if not items:
+                del cells[cell_key]
+
+        del self._geometries[key]
+        return self.shapes.pop(key)
+
+    def move(self, key: int, shape: SHAPE) -> None:
+        """Replace the shape of `key`, to call when it moved or changed."""
+        self.remove(key)
+        self._insert(key, shape)
+
+    ####################################################################################################################
+    # QUERIES
+    ####################################################################################################################
+
+    def _containing(self, x: Real, y: Real) -> List[int]:
+        geometries = self._geometries
+        cell = self.cell
+        return [key for key in self.cells.get((floor(x / cell), floor(y / cell)), ())
+                if contains(*geometries[key], x, y)]
+
+    def containing(self, point: Coords) -> List[int]:
+        """Return the keys of the shapes containing `point`, in the order of insertion."""
+        return sorted(self._containing(point.x, point.y))
+
+    def containing_many(self, points: POINTS) -> List[List[int]]:
+        """Return the keys of the shapes containing each of `points`."""
+        columns = zip(points.x, points.y) if type(points) is CoordsArray else ((p.x, p.y) for p in points)
+        return [sorted(self._containing(x, y)) for x, y in columns]
+
+    def intersecting(self, shape: SHAPE) -> List[int]:
+        """Return the keys of the shapes intersecting `shape`, a box gives the shapes within a range."""
+        kind, g = geometry(shape)
+        cells, geometries = self.cells, self._geometries
+        candidates = set()
+        for cell_key in self._cell_keys(*bounds(kind, g)):
+            candidates.update(cells.get(cell_key, ()))
+
+        return sorted(key for key in candidates if intersects(*geometries[key], kind, g))
+
+    def intersecting_many(self, shapes: Iterable[SHAPE]) -> List[List[int]]:
+        return [self.intersecting(shape) for shape in shapes]
+
+    def _nearest(self, x: Real, y: Real, k: int) -> List[int]:
+        cells, geometries, cell = self.cells, self._geometries, self.cell
+        if not cells:
+            return []
+
+        cx, cy = floor(x / cell), floor(y / cell)
+        cxi, cyi, cxf, cyf = self._extent
+        first = max(0, cxi - cx, cx - cxf, cyi - cy, cy - cyf)
+        limit = max(cx - cxi, cxf - cx, cy - cyi, cyf - cy)
+        found = {}
+        for ring in range(first, limit + 1):
+            if ring == 0:
+                ring_keys = [(cx, cy)]
+            else:
+                ring_keys = [(kx, ky) for kx in (cx - ring, cx + ring) for ky in range(cy - ring, cy + ring + 1)]
+                ring_keys += [(kx, ky) for ky in (cy - ring, cy + ring) for kx in range(cx - ring + 1, cx + ring)]
+
+            for cell_key in ring_keys:
+                for key in cells.get(cell_key, ()):
+                    if key not in found:
+                        found[key] = distance(*geometries[key], x, y)
+
+            # the shapes out of the searched square are at least at `ring * cell` from (x, y)
+            if len(found) >= k:
+                best = nsmallest(k, found.items(), key=lambda item: (item[1], item[0]))
+                if best[-1][1] <= ring * cell:
+                    return [key for key, _ in best]
+
+        return [key for key, _ in nsmallest(k, found.items(), key=lambda item: (item[1], item[0]))]
+
+    def nearest(self, point: Coords, k: int = 1) -> List[int]:
+        """Return the keys of the `k` shapes closest to `point` (0 for a shape containing it), the closest first."""
+        return self._nearest(point.x, point.y, k)
+
+    def nearest_many(self, points: POINTS, k: int = 1) -> List[List[int]]:
+        columns = zip(points.x, points.y) if type(points) is CoordsArray else ((p.x, p.y) for p in points)
+        return [self._nearest(x, y, k) for x, y in columns]
@@ -3,10 +3,17 @@ from __future__ import annotations
 from numbers import Real
 from typing import Generator
 
-from tools37.Typed import Typed, typedmethod, TypedArg
+# the exact types of the common scalars, checked before falling back to `isinstance(other, Real)`
+SCALARS = (float, int)
 
 
-class Vector(Typed):
+class Vector:
+    """
+        2D vector, with `*` as the inner product and `^` as the outer product of two vectors.
+        The operators branch on the exact type of the other operand, subclasses of Vector are not supported.
+    """
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: Real, y: Real):
         self.x: Real = x
         self.y: Real = y
@@ -53,108 +60,75 @@ class Vector(Typed):
         return Vector(-self.x, -self.y)
 
     ####################################################################################################################
-    # VECTOR x SCALAR operations
+    # VECTOR x VECTOR and VECTOR x SCALAR operations, NotImplemented otherwise
     ####################################################################################################################
 
-    @typedmethod(Real)
     def __add__(self, other) -> Vector:
-        return Vector(self.x + other, self.y + other)
+        cls = type(other)
+        if cls is Vector:
+            return Vector(self.x + other.x, self.y + other.y)
+        elif cls in SCALARS or isinstance(other, Real):
+            return Vector(self.x + other, self.y + other)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __radd__(self, other) -> Vector:
-        return Vector(other + self.x, other + self.y)
+        if type(other) in SCALARS or isinstance(other, Real):
+            return Vector(other + self.x, other + self.y)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __sub__(self, other) -> Vector:
-        return Vector(self.x - other, self.y - other)
+        cls = type(other)
+        if cls is Vector:
+            return Vector(self.x - other.x, self.y - other.y)
+        elif cls in SCALARS or isinstance(other, Real):
+            return Vector(self.x - other, self.y - other)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __rsub__(self, other) -> Vector:
-        return Vector(other - self.x, other - self.y)
-
-    @typedmethod(Real)
-    def __mul__(self, other) -> Vector:
-        return Vector(self.x * other, self.y * other)
+        if type(other) in SCALARS or isinstance(other, Real):
+            return Vector(other - self.x, other - self.y)
+        else:
+            return NotImplemented
+
+    def __mul__(self, other):
+        """Represent the inner product of two vectors, or the product by a scalar."""
+        cls = type(other)
+        if cls is Vector:
+            return self.x * other.x + self.y * other.y
+        elif cls in SCALARS or isinstance(other, Real):
+            return Vector(self.x * other, self.y * other)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __rmul__(self, other) -> Vector:
-        return Vector(other * self.x, other * self.y)
+        if type(other) in SCALARS or isinstance(other, Real):
+            return Vector(other * self.x, other * self.y)
+        else:
+            return NotImplemented
 
-    @typedmethod(Real)
     def __truediv__(self, other) -> Vector:
-        return Vector(self.x / other, self.y / other)
+        if type(other) in SCALARS or isinstance(other, Real):
+            return Vector(self.x / other, self.y / other)
+        else:
+            return NotImplemented
+
+    def __xor__(self, other) -> Real:
+        """Represent the outer product of two vectors."""
+        if type(other) is Vector:
+            return self.x * other.y - self.y * other.x
+        else:
+            return NotImplemented
 
-    @typedmethod(int)
     def __pow__(self, power: int):
+        if not isinstance(power, int):
+            return NotImplemented
+
         d, r = divmod(power, 2)
         n = (self.x ** 2 + self.y ** 2) ** d
         if r:
             return n * self
         else:
             return n
-
-    ####################################################################################################################
-    # VECTOR x VECTOR operations
-    ####################################################################################################################
-
-    @typedmethod(TypedArg.CLASS)
-    def __add__(self, other) -> Vector:
-        return Vector(self.x + other.x, self.y + other.y)
-
-    @typedmethod(TypedArg.CLASS)
-    def __sub__(self, other) -> Vector:
-        return Vector(self.x - other.x, self.y - other.y)
-
-    @typedmethod(TypedArg.CLASS)
-    def __mul__(self, other) -> Real:
-        """Represent the inner product of two vectors."""
-        return self.x * other.x + self.y * other.y
-
-    @typedmethod(TypedArg.CLASS)
-    def __xor__(self, other) -> Real:
-        """Represent the outer product of two vectors."""
-        return self.x * other.y - self.y * other.x
-
-    ####################################################################################################################
-    # VECTOR x ??? operations -> NotImplemented
-    ####################################################################################################################
-
-    @typedmethod(object)
-    def __add__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __radd__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __sub__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __rsub__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __mul__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __rmul__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __xor__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __rxor__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __truediv__(self, _):
-        return NotImplemented
-
-    @typedmethod(object)
-    def __rtruediv__(self, _):
-        return NotImplemented
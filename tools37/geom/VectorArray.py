@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from array import array
+from itertools import repeat
+from numbers import Real
+from operator import add, mul, neg, sub, truediv
+from typing import Generator, Iterable, Optional, Tuple, Union
+
+from .Vector import SCALARS, Vector
+
+COLUMNS = Tuple[Iterable[float], Iterable[float]]
+
+
+def broadcast(size: int, other, array_cls: type, item_cls: type) -> Optional[COLUMNS]:
+    """
+        Return the x and y columns of `other` against an array of `size` items : an array of `array_cls`,
+        a single `item_cls` or a scalar are repeated, an `array('d')` gives a scalar per item.
+        Return None if `other` is not supported.
+    """
+    cls = type(other)
+    if cls is array_cls or cls is array:
+        if len(other) != size:
+            raise ValueError(f"length mismatch: {size} != {len(other)}")
+
+        return (other.x, other.y) if cls is array_cls else (other, other)
+    elif cls is item_cls:
+        return repeat(other.x), repeat(other.y)
+    elif cls in SCALARS or isinstance(other, Real):
+        return repeat(other), repeat(other)
+    else:
+        return None
+
+
+class VectorArray:
+    """
+        Array of 2D vectors stored as two `array('d')` of x and y, with the operators of `Vector` applied in bulk.
+        The other operand is another VectorArray of the same length, a single Vector, a scalar or an `array('d')`
+        of a scalar per vector. Indexing returns a plain Vector.
+    """
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x: Iterable[float] = (), y: Iterable[float] = ()):
+        self.x: array = array('d', x)
+        self.y: array = array('d', y)
+        if len(self.x) != len(self.y):
+            raise ValueError(f"length mismatch: {len(self.x)} != {len(self.y)}")
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector]) -> VectorArray:
+        vectors = list(vectors)
+        return cls([vector.x for vector in vectors], [vector.y for vector in vectors])
+
+    def __iter__(self) -> Generator[Vector, None, None]:
+        for x, y in zip(self.x, self.y):
+            yield Vector(x, y)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self.x)!r}, {list(self.y)!r})"
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.x == other.x and self.y == other.y
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Vector, VectorArray]:
+        if isinstance(index, slice):
+            return VectorArray(self.x[index], self.y[index])
+        else:
+            return Vector(self.x[index], self.y[index])
+
+    def __setitem__(self, index: int, value: Vector) -> None:
+        self.x[index] = value.x
+        self.y[index] = value.y
+
+    def append(self, vector: Vector) -> None:
+        self.x.append(vector.x)
+        self.y.append(vector.y)
+
+    def __abs__(self) -> array:
+        """Return the norms of the vectors."""
+        return array('d', [(x ** 2 + y ** 2) ** 0.5 for x, y in zip(self.x, self.y)])
+
+    def __unit__(self) -> VectorArray:
+        return self / abs(self)
+
+    def __orth__(self) -> VectorArray:
+        return VectorArray(map(neg, self.y), self.x)
+
+    def __neg__(self) -> VectorArray:
+        return VectorArray(map(neg, self.x), map(neg, self.y))
+
+    ####################################################################################################################
+    # OPERATIONS
+    ####################################################################################################################
+
+    def _columns(self, other) -> Optional[COLUMNS]:
+        return broadcast(len(self.x), other, VectorArray, Vector)
+
+    def _is_vector(self, other) -> bool:
+        return type(other) is VectorArray or type(other) is Vector
+
+    def _map(self, operation, columns: COLUMNS, reflected: bool = False) -> VectorArray:
+        x, y = columns
+        if reflected:
+            return VectorArray(map(operation, x, self.x), map(operation, y, self.y))
+        else:
+            return VectorArray(map(operation, self.x, x), map(operation, self.y, y))
+
+    def __add__(self, other) -> VectorArray:
+        columns = self._columns(other)
+        return NotImplemented if columns is None else self._map(add, columns)
+
+    def __radd__(self, other) -> VectorArray:
+        columns = self._columns(other)
+        return NotImplemented if columns is None else self._map(add, columns, reflected=True)
+
+    def __sub__(self, other) -> VectorArray:
+        columns = self._columns(other)
+        return NotImplemented if columns is None else self._map(sub, columns)
+
+    def __rsub__(self, other) -> VectorArray:
+        columns = self._columns(other)
+        return NotImplemented if columns is None else self._map(sub, columns, reflected=True)
+
+    def __mul__(self, other) -> Union[array, VectorArray]:
+        """Represent the inner products with vectors, or the products by scalars."""
+        columns = self._columns(other)
+        if columns is None:
+            return NotImplemented
+        elif self._is_vector(other):
+            x, y = columns
+            return array('d', map(add, map(mul, self.x, x), map(mul, self.y, y)))
+        else:
+            return self._map(mul, columns)
+
+    def __rmul__(self, other) -> Union[array, VectorArray]:
+        columns = self._columns(other)
+        if columns is None:
+            return NotImplemented
+        elif self._is_vector(other):
+            x, y = columns
+            return array('d', map(add, map(mul, x, self.x), map(mul, y, self.y)))
+        else:
+            return self._map(mul, columns, reflected=True)
+
+    def __truediv__(self, other) -> VectorArray:
+        if self._is_vector(other):
+            return NotImplemented
+
+        columns = self._columns(other)
+        return NotImplemented if columns is None else self._map(truediv, columns)
+
+    def __xor__(self, other) -> array:
+        """Represent the outer products with vectors."""
+        if not self._is_vector(other):
+            return NotImplemented
+
+        x, y = self._columns(other)
+        return array('d', map(sub, map(mul, self.x, y), map(mul, self.y, x)))
+
+    def __rxor__(self, other) -> array:
+        if not self._is_vector(other):
+            return NotImplemented
+
+        x, y = self._columns(other)
+        return array('d', map(sub, map(mul, x, self.y), map(mul, y, self.x)))
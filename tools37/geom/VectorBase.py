@@ -2,6 +2,7 @@ from typing import Generator
 
 from tools37.Typed import Typed, typedmethod
 from .Vector import Vector, Real
+from .VectorArray import VectorArray
 
 
 class VectorBase(Typed):
@@ -64,3 +65,25 @@ class VectorBase(Typed):
     @typedmethod(Vector)
     def __rmul__(self, other: Vector) -> Vector:
         return self * other
+
+    @typedmethod(VectorArray)
+    def __lshift__(self, vectors: VectorArray) -> VectorArray:
+        """Return the vectors projected in the base."""
+        ex, ey, d = self.ex, self.ey, abs(self)
+        return VectorArray([(x * ey.y - y * ey.x) / d for x, y in zip(vectors.x, vectors.y)],
+                           [(ex.x * y - ex.y * x) / d for x, y in zip(vectors.x, vectors.y)])
+
+    @typedmethod(VectorArray)
+    def __mul__(self, vectors: VectorArray) -> VectorArray:
+        """Return the vectors extracted from the base."""
+        ex, ey = self.ex, self.ey
+        return VectorArray([x * ex.x + y * ey.x for x, y in zip(vectors.x, vectors.y)],
+                           [x * ex.y + y * ey.y for x, y in zip(vectors.x, vectors.y)])
+
+    @typedmethod(VectorArray)
+    def __rrshift__(self, other: VectorArray) -> VectorArray:
+        return self << other
+
+    @typedmethod(VectorArray)
+    def __rmul__(self, other: VectorArray) -> VectorArray:
+        return self * other
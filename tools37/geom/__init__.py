@@ -1,7 +1,10 @@
 from .Vector import Vector
 from .VectorBase import VectorBase
 from .Coords import Coords
+from .VectorArray import VectorArray
+from .CoordsArray import CoordsArray
 from .BoundingBox import BoundingBox
 from .AbsoluteBoundingBox import AbsoluteBoundingBox
 from .CenteredBoundingBox import CenteredBoundingBox
-from .Circle import Circle
\ No newline at end of file
+from .Circle import Circle
+from .SpatialIndex import SpatialIndex
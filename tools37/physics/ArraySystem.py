@@ -0,0 +1,192 @@
+from array import array
+from numbers import Real
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from tools37.geom import Vector
+from .Circle import Circle
+from .SweepAndPrune import SweepAndPrune
+from .SweptBoundingBox import swept_bounds
+from .functions import circle_circle_impacts, elastic_collision
+
+INF = float('inf')
+
+
+class ArraySystem:
+    """
+        System of circles whose states are stored in flat `array('d')` buffers.
+        `update` gives the same positions and speeds as `System.update` without building any `Vector`,
+        `Polynom` or `Collision` on the way, the callbacks receive the index of the circles.
+    """
+
+    def __init__(self, gravity: Vector, friction: Real, max_collision_check: int = 100):
+        self.gravity: Vector = gravity
+        self.friction: Real = friction
+        self.max_collision_check: int = max_collision_check
+
+        self.px: array = array('d')
+        self.py: array = array('d')
+        self.sx: array = array('d')
+        self.sy: array = array('d')
+        self.radii: array = array('d')
+        self.masses: array = array('d')
+        self.frictions: array = array('d')
+        self.searching: List[int] = []
+        # set to None to check every pair of circles
+        self.broad_phase: Optional[SweepAndPrune] = SweepAndPrune()
+
+    @classmethod
+    def from_system(cls, system) -> 'ArraySystem':
+        """Copy a `System` made of circles, the objects are indexed in the order of `system.objects`."""
+        result = cls(system.gravity, system.friction, system.max_collision_check)
+        indexes = {}
+        for circle in system.objects:
+            indexes[id(circle)] = result.add(circle, searching=False)
+
+        result.searching = [indexes[id(circle)] for circle in system.objects_searching_for_collision]
+        return result
+
+    def __len__(self) -> int:
+        return len(self.px)
+
+    def add(self, circle: Circle, searching: bool = True) -> int:
+        """Add a copy of the `circle` state and return its index."""
+        if not isinstance(circle, Circle):
+            raise TypeError(f"{self.__class__.__name__} only handles circles, not {type(circle)!r}")
+
+        index = len(self.px)
+        self.px.append(circle.position.x)
+        self.py.append(circle.position.y)
+        self.sx.append(circle.speed.x)
+        self.sy.append(circle.speed.y)
+        self.radii.append(circle.radius)
+        self.masses.append(circle.mass)
+        self.frictions.append(circle.friction)
+        if searching:
+            self.searching.append(index)
+
+        return index
+
+    def circle(self, index: int) -> Circle:
+        """Return a new `Circle` with the state of the circle at `index`."""
+        circle = Circle(position=Vector(self.px[index], self.py[index]), radius=self.radii[index],
+                        speed=Vector(self.sx[index], self.sy[index]), mass=self.masses[index])
+        circle.friction = self.frictions[index]
+        return circle
+
+    def write_to(self, circles: Iterable[Circle]) -> None:
+        """Copy the positions and speeds back into the `circles`, given in the order of their indexes."""
+        for index, circle in enumerate(circles):
+            circle.position = Vector(self.px[index], self.py[index])
+            circle.speed = Vector(self.sx[index], self.sy[index])
+
+    def forward(self, dt: float) -> None:
+        px, py, sx, sy = self.px, self.py, self.sx, self.sy
+        for index in range(len(px)):
+            px[index] += dt * sx[index]
+            py[index] += dt * sy[index]
+
+    def apply_forces(self) -> None:
+        """Apply the gravity then the friction of the system to all the circles."""
+        assert 0 <= float(self.friction) <= 1
+        gx, gy = self.gravity.x, self.gravity.y
+        factor = 1 - self.friction
+        sx, sy, masses = self.sx, self.sy, self.masses
+        for index in range(len(sx)):
+            if masses[index] < INF:
+                sx[index] += gx
+                sy[index] += gy
+
+            sx[index] *= factor
+            sy[index] *= factor
+
+    def find_collisions(self, dt: float) -> Tuple[float, int, List[Tuple[int, int, float, float]]]:
+        """
+            Return the time of the earliest collisions within `dt`, the number of pairs colliding at this time
+            (as counted by `CollisionList`) and the (origin, target, vx, vy) of the ones with an impact.
+        """
+        px, py, sx, sy, radii = self.px, self.py, self.sx, self.sy, self.radii
+        speeds = [(x ** 2 + y ** 2) ** 0.5 for x, y in zip(sx, sy)]
+        neighbours = self.neighbours(dt)
+
+        best, count, found = dt, 0, []
+        done = set()
+        for origin in self.searching:
+            done.add(origin)
+            ox, oy, ovx, ovy = px[origin], py[origin], sx[origin], sy[origin]
+            radius, speed = radii[origin], speeds[origin]
+            for target in neighbours[origin]:
+                if target in done:
+                    continue
+
+                first, vx, vy = dt, 0, 0
+                dpx, dpy = ox - px[target], oy - py[target]
+                distance = radius + radii[target]
+                if (dpx ** 2 + dpy ** 2) ** 0.5 - distance <= speed + speeds[target]:
+                    for t, ix, iy in circle_circle_impacts(dpx, dpy, ovx - sx[target], ovy - sy[target], distance):
+                        if 0 < t:
+                            if t < first:
+                                first, vx, vy = t, ix, iy
+                            elif t == first:
+                                vx, vy = vx + ix, vy + iy
+
+                if first < best:
+                    best, count, found = first, 1, []
+                elif first == best:
+                    count += 1
+                else:
+                    continue
+
+                if (vx ** 2 + vy ** 2) ** 0.5:
+                    found.append((origin, target, vx, vy))
+
+        return best, count, found
+
+    def neighbours(self, dt: float) -> List[Iterable[int]]:
+        """Return, for each circle, the indexes of the circles which may collide with it within `dt`."""
+        if self.broad_phase is None:
+            return [range(len(self.px))] * len(self.px)
+
+        bounds = list(map(swept_bounds, self.px, self.py, self.sx, self.sy, self.radii, [dt] * len(self.px)))
+        return self.broad_phase.neighbours(*zip(*bounds)) if bounds else []
+
+    def resolve(self, origin: int, target: int, vx: float, vy: float) -> None:
+        """Apply the elastic collision between `origin` and `target` along the impact vector (vx, vy)."""
+        sx, sy, masses, frictions = self.sx, self.sy, self.masses, self.frictions
+        norm = (vx ** 2 + vy ** 2) ** 0.5
+        friction = (1 - frictions[origin]) * (1 - frictions[target])
+        exx, exy = vx / norm, vy / norm
+        eyx, eyy = -exy, exx
+        det = exx * eyy - exy * eyx
+        assert det != 0
+
+        v1n, v1t = (sx[origin] * eyy - sy[origin] * eyx) / det, (exx * sy[origin] - exy * sx[origin]) / det
+        v2n, v2t = (sx[target] * eyy - sy[target] * eyx) / det, (exx * sy[target] - exy * sx[target]) / det
+        v1n, v2n = elastic_collision(v1n, masses[origin], v2n, masses[target])
+
+        sx[origin], sy[origin] = friction * v1n * exx + v1t * eyx, friction * v1n * exy + v1t * eyy
+        sx[target], sy[target] = friction * v2n * exx + v2t * eyx, friction * v2n * exy + v2t * eyy
+
+    def update(self, dt: float = 1.0, col_callback: Optional[Callable[[int], None]] = None) -> None:
+        self.apply_forces()
+
+        checks = 0
+        while dt > 0 and checks < self.max_collision_check:
+            first, count, found = self.find_collisions(dt)
+            if not count:
+                break
+
+            self.forward(first)
+            for origin, target, vx, vy in found:
+                self.resolve(origin, target, vx, vy)
+                if col_callback is not None:
+                    col_callback(origin)
+                    col_callback(target)
+
+            dt -= first
+            checks += len(found)
+
+        if checks >= self.max_collision_check:
+            print("MAX COLLISION CHECK OVERLOAD")
+
+        if 0 < dt:
+            self.forward(dt)
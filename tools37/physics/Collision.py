@@ -36,5 +36,6 @@ class Collision:
             self.origin.speed = Vector(friction * v1n, v1t) * base
             self.target.speed = Vector(friction * v2n, v2t) * base
 
-            col_callback(self.origin)
-            col_callback(self.target)
+            if col_callback is not None:
+                col_callback(self.origin)
+                col_callback(self.target)
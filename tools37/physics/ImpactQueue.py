@@ -0,0 +1,40 @@
+import heapq
+from typing import List, Optional, Tuple
+
+
+class ImpactQueue:
+    """
+        Priority queue of the predicted impacts between objects, keyed by (t, i, j) with i < j : the simultaneous
+        impacts are popped in the same order whatever the order they were pushed in.
+        Each object has a version, increased by `invalidate` when its trajectory changes :
+        the impacts predicted with an older version are dropped when they reach the top of the queue.
+    """
+
+    def __init__(self, size: int):
+        self.versions: List[int] = [0] * size
+        self.heap: List[Tuple[float, int, int, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, t: float, i: int, j: int) -> None:
+        """Predict an impact between `i` and `j` at `t`."""
+        if j < i:
+            i, j = j, i
+
+        versions = self.versions
+        heapq.heappush(self.heap, (t, i, j, versions[i], versions[j]))
+
+    def invalidate(self, i: int) -> None:
+        """Drop all the impacts predicted for `i`."""
+        self.versions[i] += 1
+
+    def pop(self, until: float = float('inf')) -> Optional[Tuple[float, int, int]]:
+        """Return the next valid impact (t, i, j) with t <= `until`, None if there is none."""
+        heap, versions = self.heap, self.versions
+        while heap and heap[0][0] <= until:
+            t, i, j, version_i, version_j = heapq.heappop(heap)
+            if versions[i] == version_i and versions[j] == version_j:
+                return t, i, j
+
+        return None
@@ -0,0 +1,140 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .ScheduledSystem import BOUNDS, Grid, ScheduledSystem, predict_impact
+from .SweepAndPrune import SweepAndPrune
+from .SweptBoundingBox import swept_bounds
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # python < 3.8
+    SharedMemory = None
+
+# buffers shared with the workers, the order of the objects along x is stored as floats too
+FIELDS = ('px', 'py', 'sx', 'sy', 'radii', 'searching', 'order')
+
+_attached: Dict[str, 'SharedMemory'] = {}
+
+
+def _view(name: str, size: int) -> memoryview:
+    """Return the `size` floats of the shared memory `name`, attached once per process."""
+    shm = _attached.get(name)
+    if shm is None:
+        shm = _attached[name] = SharedMemory(name=name)
+
+    return shm.buf.cast('d')[:size]
+
+
+def tile_impacts(names: Sequence[str], size: int, dt: float, cell: float,
+                 start: int, stop: int) -> List[Tuple[float, int, int]]:
+    """
+        Return the (t, i, j) of the impacts within `dt` of the objects at the positions [`start`, `stop`[
+        of the order along x. The objects of the next tiles whose paths reach the tile are its halo,
+        a pair is handled by the tile of the object which comes first in the order.
+    """
+    px, py, sx, sy, radii, searching, order = (_view(name, size) for name in names)
+    grid = Grid(cell)
+    positions = {}
+    reach = float('-inf')
+    for position in range(start, size):
+        index = int(order[position])
+        bounds = swept_bounds(px[index], py[index], sx[index], sy[index], radii[index], dt)
+        if position < stop:
+            reach = max(reach, bounds[2])
+
+        elif bounds[0] > reach:
+            break
+
+        grid.move(index, bounds)
+        positions[index] = position
+
+    impacts = []
+    for position in range(start, stop):
+        index = int(order[position])
+        for other in grid.query(index):
+            if positions[other] > position and (searching[index] or searching[other]):
+                i, j = (index, other) if index < other else (other, index)
+                t = predict_impact(px, py, sx, sy, radii, i, j, 0.0, 0.0, 0.0)
+                if t is not None and t <= dt:
+                    impacts.append((t, i, j))
+
+    return impacts
+
+
+class ParallelSystem(ScheduledSystem):
+    """
+        ScheduledSystem predicting the impacts at the start of an update in a pool of `workers` processes.
+        The space is split in tiles along x holding the same number of objects, the state is written in shared memory
+        buffers read by the workers. The collisions are then resolved in the order of their times by the parent process,
+        as a collision in a tile can change the ones of its neighbours.
+        Call `close` (or use the system as a context manager) to stop the workers and free the buffers.
+    """
+
+    def __init__(self, *args, workers: int = 4, **kwargs):
+        if SharedMemory is None:
+            raise RuntimeError(f"{self.__class__.__name__} requires multiprocessing.shared_memory (python 3.8+)")
+
+        super().__init__(*args, **kwargs)
+        self.workers: int = workers
+        self.tiles: SweepAndPrune = SweepAndPrune()
+        self._buffers: List[SharedMemory] = []
+        self._capacity: int = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+        for shm in self._buffers:
+            attached = _attached.pop(shm.name, None)
+            if attached is not None:
+                attached.close()
+
+            shm.close()
+            shm.unlink()
+
+        self._buffers = []
+        self._capacity = 0
+
+    def _share(self, bounds: List[BOUNDS]) -> List[str]:
+        """Write the state in the shared buffers and return their names."""
+        size = len(self.px)
+        if size > self._capacity:
+            self.close()
+            self._capacity = max(size, 2 * self._capacity)
+            self._buffers = [SharedMemory(create=True, size=8 * self._capacity) for _ in FIELDS]
+
+        searching = array('d', bytes(8 * size))
+        for index in self.searching:
+            searching[index] = 1.0
+
+        order = array('d', self.tiles.sort([xi for xi, _, _, _ in bounds]))
+        for shm, values in zip(self._buffers, [self.px, self.py, self.sx, self.sy, self.radii, searching, order]):
+            shm.buf.cast('d')[:size] = values
+
+        return [shm.name for shm in self._buffers]
+
+    def initial_impacts(self, dt: float, bounds: List[BOUNDS], grid: Grid) -> Iterable[Tuple[float, int, int]]:
+        size = len(self.px)
+        if not size:
+            return []
+
+        names = self._share(bounds)
+        if self.workers == 1:
+            return tile_impacts(names, size, dt, grid.cell, 0, size)
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers)
+
+        futures = [self._pool.submit(tile_impacts, names, size, dt, grid.cell,
+                                     size * tile // self.workers, size * (tile + 1) // self.workers)
+                   for tile in range(self.workers)]
+        return [impact for future in futures for impact in future.result()]
@@ -0,0 +1,57 @@
+from typing import List, Sequence
+
+from .SweptBoundingBox import SweptBoundingBox
+
+
+class SweepAndPrune:
+    """
+        Broad phase finding the intersecting boxes by sweeping them along x.
+        The boxes are given by index, their order along x is kept between the calls and restored
+        by an insertion sort, which is linear when the objects only moved a little since the last call.
+    """
+
+    def __init__(self):
+        self.order: List[int] = []
+
+    def sort(self, xi: Sequence[float]) -> List[int]:
+        """Return the indexes of the boxes sorted by `xi`."""
+        order = self.order
+        if len(order) != len(xi):
+            order[:] = sorted(range(len(xi)), key=xi.__getitem__)
+            return order
+
+        for position in range(1, len(order)):
+            index = order[position]
+            value = xi[index]
+            previous = position - 1
+            while previous >= 0 and xi[order[previous]] > value:
+                order[previous + 1] = order[previous]
+                previous -= 1
+
+            order[previous + 1] = index
+
+        return order
+
+    def neighbours(self, xi: Sequence[float], yi: Sequence[float],
+                   xf: Sequence[float], yf: Sequence[float]) -> List[List[int]]:
+        """Return, for each box, the sorted indexes of the other boxes intersecting it."""
+        result = [[] for _ in range(len(xi))]
+        active = []
+        for index in self.sort(xi):
+            start, low, high = xi[index], yi[index], yf[index]
+            active = [other for other in active if xf[other] >= start]
+            for other in active:
+                if low <= yf[other] and yi[other] <= high:
+                    result[index].append(other)
+                    result[other].append(index)
+
+            active.append(index)
+
+        for indexes in result:
+            indexes.sort()
+
+        return result
+
+    def neighbours_of_boxes(self, boxes: Sequence[SweptBoundingBox]) -> List[List[int]]:
+        return self.neighbours([box.xi for box in boxes], [box.yi for box in boxes],
+                               [box.xf for box in boxes], [box.yf for box in boxes])
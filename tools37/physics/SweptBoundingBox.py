@@ -0,0 +1,40 @@
+from numbers import Real
+from typing import Tuple
+
+from tools37.geom import AbsoluteBoundingBox
+
+# relative padding of the boxes, so that the rounding errors of the times of impact never prune a colliding pair
+MARGIN = 1e-9
+
+
+def swept_bounds(x: Real, y: Real, vx: Real, vy: Real, radius: Real, dt: Real) -> Tuple[Real, Real, Real, Real]:
+    """Return the (xi, yi, xf, yf) covering a disk of `radius` moving from (x, y) at the speed (vx, vy) during `dt`."""
+    x1, y1 = x + dt * vx, y + dt * vy
+    xi, xf = (x, x1) if x <= x1 else (x1, x)
+    yi, yf = (y, y1) if y <= y1 else (y1, y)
+    margin = radius + MARGIN * (1 + abs(xi) + abs(xf) + abs(yi) + abs(yf) + radius)
+    return xi - margin, yi - margin, xf + margin, yf + margin
+
+
+class SweptBoundingBox(AbsoluteBoundingBox):
+    """AbsoluteBoundingBox covering the path of an object, it can be flat (xi == xf or yi == yf)."""
+
+    def __init__(self, xi: Real, yi: Real, xf: Real, yf: Real):
+        assert xi <= xf
+        assert yi <= yf
+        self.xi: Real = xi
+        self.yi: Real = yi
+        self.xf: Real = xf
+        self.yf: Real = yf
+
+    @classmethod
+    def of_disk(cls, x: Real, y: Real, vx: Real, vy: Real, radius: Real, dt: Real) -> 'SweptBoundingBox':
+        return cls(*swept_bounds(x, y, vx, vy, radius, dt))
+
+    def __or__(self, other: 'SweptBoundingBox') -> 'SweptBoundingBox':
+        """Return the box covering both boxes."""
+        return SweptBoundingBox(min(self.xi, other.xi), min(self.yi, other.yi),
+                                max(self.xf, other.xf), max(self.yf, other.yf))
+
+    def intersects(self, other: AbsoluteBoundingBox) -> bool:
+        return self.xi <= other.xf and other.xi <= self.xf and self.yi <= other.yf and other.yi <= self.yf
@@ -1,5 +1,5 @@
 from numbers import Real
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 
 from tools37.Typed import Typed, typedmethod
 from tools37.geom import Vector
@@ -8,6 +8,8 @@ from .Collision import Collision
 from .CollisionList import CollisionList
 from .Line import Line
 from .Object import Object
+from .SweepAndPrune import SweepAndPrune
+from .SweptBoundingBox import SweptBoundingBox
 from .functions import circle_line_collision, circle_circle_collision
 
 
@@ -18,6 +20,8 @@ class System(Typed):
         self.friction: Real = friction
         self.objects_searching_for_collision: List[Object] = []
         self.max_collision_check: int = max_collision_check
+        # set to None to check every pair of objects
+        self.broad_phase: Optional[SweepAndPrune] = SweepAndPrune()
 
     def forward(self, dt: float):
         for o in self.objects:
@@ -31,13 +35,9 @@ class System(Typed):
         checks = 0
         while dt > 0 and checks < self.max_collision_check:
             collisions = CollisionList(dt)
-            done = []
-            for origin in self.objects_searching_for_collision:
-                done.append(origin)
-                for target in self.objects:
-                    if target not in done:
-                        collision = self.calculate_collision(origin, target, dt)
-                        collisions.add(collision)
+            for origin, target in self.candidate_pairs(dt):
+                collision = self.calculate_collision(origin, target, dt)
+                collisions.add(collision)
 
             if not collisions:
                 break
@@ -46,7 +46,7 @@ class System(Typed):
             collisions.apply(col_callback)
             dt -= collisions.dt
 
-            checks += len(collisions)
+            checks += sum(1 for collision in collisions if abs(collision.v))
 
         if checks >= self.max_collision_check:
             print("MAX COLLISION CHECK OVERLOAD")
@@ -54,6 +54,47 @@ class System(Typed):
         if 0 < dt:
             self.forward(dt)
 
+    def candidate_pairs(self, dt: float) -> Iterator[Tuple[Object, Object]]:
+        """
+            Yield the (origin, target) pairs which may collide within `dt`, in the order of
+            `objects_searching_for_collision` then `objects`.
+        """
+        if self.broad_phase is None:
+            done = []
+            for origin in self.objects_searching_for_collision:
+                done.append(origin)
+                for target in self.objects:
+                    if target not in done:
+                        yield origin, target
+            return
+
+        boxes = [self.bounding_box(o, dt) for o in self.objects]
+        neighbours = self.broad_phase.neighbours_of_boxes(boxes)
+        indexes = {id(o): index for index, o in enumerate(self.objects)}
+        done = set()
+        for origin in self.objects_searching_for_collision:
+            done.add(id(origin))
+            for index in neighbours[indexes[id(origin)]]:
+                target = self.objects[index]
+                if id(target) not in done:
+                    yield origin, target
+
+    @typedmethod(Circle)
+    def bounding_box(self, circle: Circle, dt: float) -> SweptBoundingBox:
+        """Return the box covering the `circle` during `dt`."""
+        return SweptBoundingBox.of_disk(circle.position.x, circle.position.y,
+                                        circle.speed.x, circle.speed.y, circle.radius, dt)
+
+    @typedmethod(Line)
+    def bounding_box(self, line: Line, dt: float) -> SweptBoundingBox:
+        origin, target = line.origin, line.target
+        return SweptBoundingBox.of_disk(origin.x, origin.y, line.speed.x, line.speed.y, 0, dt) | \
+            SweptBoundingBox.of_disk(target.x, target.y, line.speed.x, line.speed.y, 0, dt)
+
+    @typedmethod(object)
+    def bounding_box(self, o, dt: float) -> SweptBoundingBox:
+        return SweptBoundingBox(float('-inf'), float('-inf'), float('inf'), float('inf'))
+
     def calculate_collision(self, origin: Object, target: Object, dt: float):
         collision = Collision(origin, target, dt)
         for dt, v in self.calculate_collisions_between(origin, target):
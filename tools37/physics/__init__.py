@@ -1,7 +1,13 @@
+from .ArraySystem import ArraySystem
 from .Circle import Circle
 from .Collision import Collision
 from .CollisionList import CollisionList
+from .ImpactQueue import ImpactQueue
 from .Line import Line
 from .Object import Object
+from .ParallelSystem import ParallelSystem
+from .ScheduledSystem import ScheduledSystem
+from .SweepAndPrune import SweepAndPrune
+from .SweptBoundingBox import SweptBoundingBox
 from .System import System
 from .functions import *
@@ -1,8 +1,12 @@
 from numbers import Real
-from tools37.algebra import Polynom
+from typing import Iterable, List, Tuple
+
+from tools37.algebra.Polynom import solve_quadratic
 from .Circle import Circle
 from .Line import Line
-from tools37.geom import VectorBase
+from tools37.geom import Vector
+
+IMPACT = Tuple[float, float, float]
 
 
 def elastic_collision(v1: Real, m1: Real, v2: Real, m2: Real):
@@ -22,24 +26,94 @@ def elastic_collision(v1: Real, m1: Real, v2: Real, m2: Real):
     return n1, n2
 
 
+def _strip(factors: List[float]) -> List[float]:
+    while len(factors) > 1 and factors[-1] == 0:
+        factors.pop(-1)
+
+    return factors
+
+
+def _square_minus(a0: float, a1: float, radius: Real) -> List[float]:
+    """Return the factors of `Polynom(a0, a1) ** 2 - radius ** 2`, with the same operations."""
+    if a1 == 0:
+        factors = [0 + a0 * a0]
+    else:
+        factors = _strip([0 + a0 * a0, (0 + a0 * a1) + a1 * a0, 0 + a1 * a1])
+
+    factors[0] -= radius ** 2
+    return _strip(factors)
+
+
+def _roots(factors: List[float]) -> List[float]:
+    """Return the roots as `Polynom.solve` does, for a polynom of degree <= 2."""
+    if len(factors) == 3:
+        return solve_quadratic(*factors)
+    elif len(factors) == 2:
+        return [-factors[0] / factors[1]]
+    else:
+        return []
+
+
+def circle_circle_impacts(dpx: float, dpy: float, dvx: float, dvy: float, radius: Real) -> List[IMPACT]:
+    """
+        Return the (t, vx, vy) of the impacts between two circles at the relative position (dpx, dpy)
+        with the relative speed (dvx, dvy), (vx, vy) being their relative position at t.
+        The roots are the ones of the `Polynom` of the squared distance minus `radius` ** 2, with the same operations.
+    """
+    factors = _strip([dpx * dpx + dpy * dpy, (dpx * dvx + dpy * dvy) + (dvx * dpx + dvy * dpy), dvx * dvx + dvy * dvy])
+    factors[0] -= radius ** 2
+    factors = _strip(factors)
+
+    if not factors[0] >= 0:
+        return []
+
+    return [(t, dvx * t + dpx, dvy * t + dpy) for t in _roots(factors)]
+
+
+def circle_line_impacts(dpx: float, dpy: float, dvx: float, dvy: float, radius: Real,
+                        dx: float, dy: float) -> List[IMPACT]:
+    """
+        Return the (t, vx, vy) of the impacts between a circle and a line of half length (dx, dy),
+        the circle being at (dpx, dpy) from the origin of the line with the relative speed (dvx, dvy).
+        (vx, vy) is the component of their relative position orthogonal to the line at t.
+        The roots are the ones of the `Polynom` of the squared distance to the line minus `radius` ** 2,
+        with the same operations.
+    """
+    length = (dx ** 2 + dy ** 2) ** 0.5
+    exx, exy = dx / length, dy / length
+    eyx, eyy = -exy, exx
+
+    impacts = []
+    for t in _roots(_square_minus(dpx * eyx + dpy * eyy, dvx * eyx + dvy * eyy, radius)):
+        rx, ry = dvx * t + dpx, dvy * t + dpy
+        if 0 <= rx * exx + ry * exy <= 2 * length:
+            normal = rx * eyx + ry * eyy
+            impacts.append((t, normal * eyx, normal * eyy))
+
+    return impacts
+
+
+def circle_circle_impacts_many(dpx: Iterable[float], dpy: Iterable[float], dvx: Iterable[float],
+                               dvy: Iterable[float], radii: Iterable[Real]) -> List[List[IMPACT]]:
+    """Return the `circle_circle_impacts` of each pair, given by the columns of their arguments."""
+    return list(map(circle_circle_impacts, dpx, dpy, dvx, dvy, radii))
+
+
+def circle_line_impacts_many(dpx: Iterable[float], dpy: Iterable[float], dvx: Iterable[float], dvy: Iterable[float],
+                             radii: Iterable[Real], dx: Iterable[float], dy: Iterable[float]) -> List[List[IMPACT]]:
+    """Return the `circle_line_impacts` of each pair, given by the columns of their arguments."""
+    return list(map(circle_line_impacts, dpx, dpy, dvx, dvy, radii, dx, dy))
+
+
 def circle_circle_collision(circle1: Circle, circle2: Circle):
-    t1 = Polynom(circle1.position, circle1.speed)
-    t2 = Polynom(circle2.position, circle2.speed)
-    rt = t1 - t2
-    err = rt ** 2 - (circle1.radius + circle2.radius) ** 2
-    if err(0) >= 0:
-        for t in err.solve():
-            yield t, rt(t)
+    dp = circle1.position - circle2.position
+    dv = circle1.speed - circle2.speed
+    for t, x, y in circle_circle_impacts(dp.x, dp.y, dv.x, dv.y, circle1.radius + circle2.radius):
+        yield t, Vector(x, y)
 
 
 def circle_line_collision(circle: Circle, line: Line):
-    t1 = Polynom(circle.position, circle.speed)
-    t2 = Polynom(line.origin, line.speed)
-    rt = t1 - t2
-    ex = line.delta.__unit__()
-    ey = ex.__orth__()
-
-    err = (rt * ey) ** 2 - circle.radius ** 2
-    for t in err.solve():
-        if 0 <= rt(t) * ex <= 2 * abs(line.delta):
-            yield t, (rt(t) * ey) * ey
+    dp = circle.position - line.origin
+    dv = circle.speed - line.speed
+    for t, x, y in circle_line_impacts(dp.x, dp.y, dv.x, dv.y, circle.radius, line.delta.x, line.delta.y):
+        yield t, Vector(x, y)
@@ -110,7 +110,10 @@ class Component(abc.Component):
 
     def _setup_events(self) -> None:
         if isinstance(self.binder, DynamicBinder):
-            Observer().on(name=f".{self.__config__.binder!s}", emitter=self.data, function=self._update_local)
+            # the observer is kept by the component, the events only hold weak references to it
+            self._binder_observer = Observer()
+            self._binder_observer.on(name=f".{self.__config__.binder!s}", emitter=self.data,
+                                     function=self._update_local)
 
         for key, value in self.style.items():
             if isinstance(value, Evaluable):